@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The csv_benchmark utility measures the throughput and latency of the csv_reader and csv_writer tools, so that results
+can be compared between commits.
+
+Synthetic climate, gases and particulates streams, shaped like the DOCUMENT EXAMPLEs of the tools, are generated at
+each of the given sizes, as JSON (one document per line), as a JSON array, and as CSV. Generated files are kept in the
+work directory and re-used on later runs, so that successive runs convert the same data. The values are pseudo-random,
+from a fixed seed.
+
+Each tool is run as a separate process, in each mode, on each stream. For each run, the utility reports:
+
+* rows per second - rows divided by the wall time of the process
+* peak RSS - the maximum resident set size of the process, in kilobytes (Linux reports kilobytes, macOS bytes)
+* first-row latency - the time from starting the process to receiving the first complete output row, in seconds
+
+csv_reader is run in sequence and array (-a) modes. csv_writer is given both sequence and array input.
+
+Each stream is also written in the columnar format (csv_writer -f columnar), and read back with csv_reader. The
+output must be byte-identical to that of csv_reader on the CSV - for each stream, the utility reports the size of
+both files, and whether the round trip was exact. The utility exits with status 1 if any round trip was not exact.
+
+The 10M row streams take several minutes to generate, and about 6 GB of disk space.
+
+SYNOPSIS
+csv_benchmark.py [-s SIZES] [-t STREAMS] [-w WORK_DIR] [-o OUTPUT] [-v]
+
+EXAMPLES
+./benchmarks/csv_benchmark.py -s 10k,1M -o benchmark-$(git rev-parse --short HEAD).json
+
+DOCUMENT EXAMPLE - OUTPUT
+{"commit": "63f7256", "python": "3.11.7", "created": "2026-10-18T18:32:54Z", "results": [{"tool": "csv_reader",
+"mode": "sequence", "stream": "climate", "rows": 10000, "rows-per-second": 105479.3, "peak-rss": 13952,
+"first-row-latency": 0.0454}, ..., {"tool": "csv_writer", "mode": "columnar", "stream": "climate", "rows": 10000,
+"csv-size": 508361, "columnar-size": 170141, "round-trip": true}, ...]}
+"""
+
+import csv
+import json
+import optparse
+import os
+import random
+import subprocess
+import sys
+import time
+
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+PACKAGE_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+TOOL_DIR = os.path.join(PACKAGE_ROOT, 'src', 'scs_mfr')
+
+DEFAULT_SIZES = '10k,1M,10M'
+DEFAULT_WORK_DIR = os.path.join('/tmp', 'scs_mfr_benchmark')
+
+STREAMS = ('climate', 'gases', 'particulates')
+MULTIPLIERS = {'k': 1000, 'M': 1000000}
+
+EPOCH = datetime(2018, 4, 4, 14, 50, 27, 641000)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# streams...
+
+def climate(rnd):
+    return OrderedDict([
+        ('hmd', round(rnd.uniform(30.0, 90.0), 1)),
+        ('tmp', round(rnd.uniform(5.0, 35.0), 1))
+    ])
+
+
+def gases(rnd):
+    val = OrderedDict()
+
+    for gas in ('NO2', 'CO', 'SO2', 'H2S'):
+        val[gas] = OrderedDict([
+            ('weV', round(rnd.uniform(0.25, 0.35), 6)),
+            ('aeV', round(rnd.uniform(0.25, 0.35), 6)),
+            ('weC', round(rnd.uniform(-0.05, 0.05), 6)),
+            ('cnc', round(rnd.uniform(-30.0, 200.0), 1))
+        ])
+
+    val['pt1'] = OrderedDict([('v', round(rnd.uniform(0.3, 0.35), 6)), ('tmp', round(rnd.uniform(5.0, 35.0), 1))])
+    val['sht'] = climate(rnd)
+
+    return val
+
+
+def particulates(rnd):
+    return OrderedDict([
+        ('per', 4.9),
+        ('pm1', round(rnd.uniform(0.0, 20.0), 1)),
+        ('pm2p5', round(rnd.uniform(0.0, 40.0), 1)),
+        ('pm10', round(rnd.uniform(0.0, 80.0), 1)),
+        ('bin', [rnd.randint(0, 400) for _ in range(16)]),
+        ('mtf1', rnd.randint(15, 40)),
+        ('mtf3', rnd.randint(15, 40)),
+        ('mtf5', rnd.randint(15, 40)),
+        ('mtf7', rnd.randint(15, 40)),
+        ('sht', climate(rnd))
+    ])
+
+
+VALUES = {'climate': climate, 'gases': gases, 'particulates': particulates}
+
+
+def document(stream, rnd, index):
+    rec = EPOCH + timedelta(seconds=10 * index)
+
+    return OrderedDict([
+        ('tag', 'scs-ap1-6'),
+        ('rec', rec.strftime('%Y-%m-%dT%H:%M:%S.') + '%03d+00:00' % (rec.microsecond // 1000)),
+        ('val', VALUES[stream](rnd))
+    ])
+
+
+def leaves(node, path=''):
+    # (header path, value) pairs, named as csv_writer names them...
+    if isinstance(node, dict):
+        for key, child in node.items():
+            for leaf in leaves(child, key if path == '' else path + '.' + key):
+                yield leaf
+
+    elif isinstance(node, list):
+        for index, child in enumerate(node):
+            for leaf in leaves(child, path + ':%d' % index):
+                yield leaf
+
+    else:
+        yield path, node
+
+
+def generate(stream, rows, work_dir, verbose):
+    json_filename = os.path.join(work_dir, '%s-%d.json' % (stream, rows))
+    array_filename = os.path.join(work_dir, '%s-%d-array.json' % (stream, rows))
+    csv_filename = os.path.join(work_dir, '%s-%d.csv' % (stream, rows))
+
+    filenames = (json_filename, array_filename, csv_filename)
+
+    if all(os.path.isfile(filename) for filename in filenames):
+        return filenames
+
+    if verbose:
+        print("csv_benchmark: generating %s x %d..." % (stream, rows), file=sys.stderr)
+        sys.stderr.flush()
+
+    rnd = random.Random(rows)
+
+    with open(json_filename + '.tmp', 'w') as json_file, open(array_filename + '.tmp', 'w') as array_file, \
+            open(csv_filename + '.tmp', 'w', newline='') as csv_file:
+        writer = csv.writer(csv_file)
+
+        for index in range(rows):
+            doc = document(stream, rnd, index)
+            cells = list(leaves(doc))
+
+            if index == 0:
+                writer.writerow([path for path, _ in cells])
+
+            writer.writerow(['' if value is None else value for _, value in cells])
+
+            jstr = json.dumps(doc)
+
+            json_file.write(jstr + '\n')
+            array_file.write(('[' if index == 0 else ',\n') + jstr)
+
+        array_file.write(']\n')
+
+    for filename in filenames:
+        os.rename(filename + '.tmp', filename)
+
+    return filenames
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# first complete output row...
+
+def csv_row_received(received):
+    return received.count(b'\n') >= 2                                   # the header, then the first row
+
+
+def sequence_row_received(received):
+    return b'\n' in received
+
+
+def array_row_received(received):
+    try:
+        json.JSONDecoder().raw_decode(received.decode(), 1)             # the first element, after '['
+        return True
+
+    except ValueError:
+        return False
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# measurement...
+
+def measure(tool, args, stdin_filename, row_received):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (os.path.join(PACKAGE_ROOT, 'src'), env.get('PYTHONPATH'))))
+
+    command = [sys.executable, os.path.join(TOOL_DIR, tool + '.py')] + args
+
+    with open(stdin_filename if stdin_filename else os.devnull, 'rb') as stdin:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, stdin=stdin, stdout=subprocess.PIPE, env=env)
+
+        latency = None
+        received = b''
+
+        while True:
+            chunk = process.stdout.read1(1 << 16)
+
+            if not chunk:
+                break
+
+            if latency is None:
+                received += chunk
+
+                if row_received(received):
+                    latency = time.perf_counter() - start
+                    received = None
+
+        # wait4(..) gives the resource usage of this process alone...
+        _, status, usage = os.wait4(process.pid, 0)
+        elapsed = time.perf_counter() - start
+
+        process.stdout.close()
+        process.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+
+    if process.returncode != 0:
+        raise RuntimeError("%s exited with status %d" % (' '.join(command), process.returncode))
+
+    return elapsed, usage.ru_maxrss, latency
+
+
+def output(tool, args, stdin_filename=None):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (os.path.join(PACKAGE_ROOT, 'src'), env.get('PYTHONPATH'))))
+
+    command = [sys.executable, os.path.join(TOOL_DIR, tool + '.py')] + args
+
+    with open(stdin_filename if stdin_filename else os.devnull, 'rb') as stdin:
+        return subprocess.check_output(command, stdin=stdin, env=env)
+
+
+def round_trip(json_filename, csv_filename):
+    # (CSV size, columnar size, csv_reader output identical)...
+    columnar_filename = os.path.splitext(csv_filename)[0] + '.col'
+
+    if not os.path.isfile(columnar_filename):
+        output('csv_writer', [columnar_filename + '.tmp', '-f', 'columnar'], json_filename)
+        os.rename(columnar_filename + '.tmp', columnar_filename)
+
+    identical = output('csv_reader', [csv_filename]) == output('csv_reader', [columnar_filename])
+
+    return os.path.getsize(csv_filename), os.path.getsize(columnar_filename), identical
+
+
+def runs(json_filename, array_filename, csv_filename):
+    # (tool, mode, args, stdin filename, row_received)...
+    return [
+        ('csv_reader', 'sequence', [csv_filename], None, sequence_row_received),
+        ('csv_reader', 'array', ['-a', csv_filename], None, array_row_received),
+        ('csv_writer', 'sequence', [], json_filename, csv_row_received),
+        ('csv_writer', 'array', [], array_filename, csv_row_received)
+    ]
+
+
+def size(text):
+    text = text.strip()
+
+    if text[-1:] in MULTIPLIERS:
+        return int(float(text[:-1]) * MULTIPLIERS[text[-1]])
+
+    return int(text)
+
+
+def commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=PACKAGE_ROOT,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = optparse.OptionParser(usage="%prog [-s SIZES] [-t STREAMS] [-w WORK_DIR] [-o OUTPUT] [-v]",
+                                   version="%prog 1.0")
+
+    parser.add_option("--sizes", "-s", type="string", nargs=1, action="store", dest="sizes", default=DEFAULT_SIZES,
+                      help="comma-separated row counts, with optional k or M suffix (default %s)" % DEFAULT_SIZES)
+
+    parser.add_option("--streams", "-t", type="string", nargs=1, action="store", dest="streams",
+                      default=','.join(STREAMS), help="comma-separated streams (default %s)" % ','.join(STREAMS))
+
+    parser.add_option("--work-dir", "-w", type="string", nargs=1, action="store", dest="work_dir",
+                      default=DEFAULT_WORK_DIR, help="directory for generated streams (default %s)" % DEFAULT_WORK_DIR)
+
+    parser.add_option("--output", "-o", type="string", nargs=1, action="store", dest="output",
+                      help="write results to OUTPUT, rather than stdout")
+
+    parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                      help="report narrative to stderr")
+
+    opts, args = parser.parse_args()
+
+    try:
+        sizes = [size(text) for text in opts.sizes.split(',')]
+
+    except ValueError:
+        parser.print_help(sys.stderr)
+        exit(2)
+
+    streams = opts.streams.split(',')
+
+    if not all(stream in STREAMS for stream in streams) or not all(rows > 0 for rows in sizes):
+        parser.print_help(sys.stderr)
+        exit(2)
+
+    os.makedirs(opts.work_dir, exist_ok=True)
+
+    results = []
+    failures = 0
+
+    try:
+        for rows in sizes:
+            for stream in streams:
+                filenames = generate(stream, rows, opts.work_dir, opts.verbose)
+
+                for tool, mode, tool_args, stdin_filename, row_received in runs(*filenames):
+                    elapsed, peak_rss, latency = measure(tool, tool_args, stdin_filename, row_received)
+
+                    result = OrderedDict([
+                        ('tool', tool),
+                        ('mode', mode),
+                        ('stream', stream),
+                        ('rows', rows),
+                        ('rows-per-second', round(rows / elapsed, 1)),
+                        ('peak-rss', peak_rss),
+                        ('first-row-latency', None if latency is None else round(latency, 4))
+                    ])
+
+                    if opts.verbose:
+                        print("csv_benchmark: %s" % json.dumps(result), file=sys.stderr)
+                        sys.stderr.flush()
+
+                    results.append(result)
+
+                csv_size, columnar_size, identical = round_trip(filenames[0], filenames[2])
+
+                result = OrderedDict([
+                    ('tool', 'csv_writer'),
+                    ('mode', 'columnar'),
+                    ('stream', stream),
+                    ('rows', rows),
+                    ('csv-size', csv_size),
+                    ('columnar-size', columnar_size),
+                    ('round-trip', identical)
+                ])
+
+                if not identical:
+                    print("csv_benchmark: columnar round trip differs: %s x %d" % (stream, rows), file=sys.stderr)
+                    failures += 1
+
+                if opts.verbose:
+                    print("csv_benchmark: %s" % json.dumps(result), file=sys.stderr)
+                    sys.stderr.flush()
+
+                results.append(result)
+
+    except KeyboardInterrupt:
+        if opts.verbose:
+            print("csv_benchmark: KeyboardInterrupt", file=sys.stderr)
+
+    report = OrderedDict([
+        ('commit', commit()),
+        ('python', '%d.%d.%d' % sys.version_info[:3]),
+        ('created', time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())),
+        ('results', results)
+    ])
+
+    if opts.output is None:
+        print(json.dumps(report))
+
+    else:
+        with open(opts.output, 'w') as file:
+            file.write(json.dumps(report, indent=4) + '\n')
+
+    if failures:
+        exit(1)
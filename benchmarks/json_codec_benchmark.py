@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The json_codec_benchmark utility compares the available JSONCodec backends on the DOCUMENT EXAMPLE payloads found in
+the docstrings of the scs_mfr tools. For each backend, each payload is decoded and re-encoded the given number of
+times, and the mean time per document is reported. Each backend's output is checked against the standard library's -
+a backend that does not give byte-identical output is reported as a mismatch.
+
+The tool sources are read as text, so no tool modules (or their hardware dependencies) are imported.
+
+SYNOPSIS
+json_codec_benchmark.py [-n ITERATIONS] [-v]
+
+EXAMPLES
+PYTHONPATH=src ./benchmarks/json_codec_benchmark.py -n 20000
+
+DOCUMENT EXAMPLE - OUTPUT
+{"payloads": 25, "iterations": 20000, "backends": {"orjson": {"loads": 1.31, "dumps": 2.044, "identical": true},
+"json": {"loads": 3.947, "dumps": 2.383, "identical": true}}}
+
+(loads and dumps are mean microseconds per document)
+"""
+
+import glob
+import json
+import optparse
+import os
+import sys
+import time
+
+from scs_mfr.conversion.json_codec import JSONCodec
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def example_payloads(tool_dir):
+    payloads = []
+
+    for filename in sorted(glob.glob(os.path.join(tool_dir, '*.py'))):
+        with open(filename) as file:
+            lines = file.read().splitlines()
+
+        for i, line in enumerate(lines):
+            if not line.startswith('DOCUMENT EXAMPLE'):
+                continue
+
+            for candidate in lines[i + 1:]:
+                if not candidate.strip():
+                    break
+
+                try:
+                    payloads.append(json.dumps(json.loads(candidate)))      # normalised, as the tools emit it
+
+                except ValueError:
+                    continue
+
+    return payloads
+
+
+def measure(codec, payloads, iterations):
+    start = time.perf_counter()
+
+    for _ in range(iterations):
+        documents = [codec.loads(jstr, ordered=True) for jstr in payloads]
+
+    loads_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+
+    for _ in range(iterations):
+        encoded = [codec.dumps(document) for document in documents]
+
+    dumps_time = time.perf_counter() - start
+
+    count = iterations * len(payloads)
+
+    return {
+        'loads': round(loads_time / count * 1e6, 3),
+        'dumps': round(dumps_time / count * 1e6, 3),
+        'identical': encoded == payloads
+    }
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = optparse.OptionParser(usage="%prog [-n ITERATIONS] [-v]", version="%prog 1.0")
+
+    parser.add_option("--iterations", "-n", type="int", nargs=1, action="store", dest="iterations", default=10000,
+                      help="decode and encode each payload ITERATIONS times (default 10000)")
+
+    parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                      help="report narrative to stderr")
+
+    opts, args = parser.parse_args()
+
+    tools = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'scs_mfr')
+    examples = example_payloads(tools)
+
+    if not examples:
+        print("json_codec_benchmark: no DOCUMENT EXAMPLE payloads found in: %s" % tools, file=sys.stderr)
+        exit(1)
+
+    results = {}
+
+    for backend in JSONCodec.available():
+        if opts.verbose:
+            print("json_codec_benchmark: %s..." % backend, file=sys.stderr)
+
+        results[backend] = measure(JSONCodec.construct(backend), examples, opts.iterations)
+
+    print(json.dumps({'payloads': len(examples), 'iterations': opts.iterations, 'backends': results}))
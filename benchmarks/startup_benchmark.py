@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The startup_benchmark utility measures the import time of each of the scripts listed in setup.py, so that the start-up
+cost of interactive tools can be compared between commits, and kept low on slow hosts such as the Pi Zero.
+
+For each script, the module-level imports - and only those - are run in a fresh interpreter, with -X importtime. No
+script is run, so no hardware is touched, and no conf is read or written. For each script, the utility reports:
+
+* wall - the wall time of the interpreter, in seconds, less that of an interpreter that imports nothing
+* imports - the sum of the cumulative import times of the script's top-level imports, in seconds
+* slowest - the slowest top-level imports, with their cumulative times
+
+Each script is imported once, to compile its modules, and then REPEATS times - the minimum times are reported. Where
+an import fails, for example because a dependency is not installed, the error is reported in place of the times.
+
+SYNOPSIS
+startup_benchmark.py [-a] [-n REPEATS] [-o OUTPUT] [-v]
+
+EXAMPLES
+./benchmarks/startup_benchmark.py -n 5 -o startup-$(git rev-parse --short HEAD).json
+
+DOCUMENT EXAMPLE - OUTPUT
+{"commit": "2e6997d", "python": "3.7.3", "created": "2026-10-18T19:12:05Z", "baseline": 0.0421,
+"results": [{"script": "dfe_test.py", "wall": 0.8313, "imports": 0.7952,
+"slowest": [["scs_mfr.test.dfe_test_conductor", 0.5311], ["scs_core.sys.system_id", 0.1107], ...], "error": null},
+...]}
+"""
+
+import ast
+import json
+import optparse
+import os
+import re
+import subprocess
+import sys
+import time
+
+from collections import OrderedDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+PACKAGE_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+SRC_DIR = os.path.join(PACKAGE_ROOT, 'src')
+TOOL_DIR = os.path.join(SRC_DIR, 'scs_mfr')
+
+DEFAULT_REPEATS = 3
+SLOWEST = 5
+
+IMPORT_TIME = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)')
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def setup_scripts():
+    # the scripts listed in setup.py, as paths relative to the package root...
+    with open(os.path.join(PACKAGE_ROOT, 'setup.py')) as file:
+        tree = ast.parse(file.read())
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.keyword) and node.arg == 'scripts':
+            return [element.s for element in node.value.elts]
+
+    return []
+
+
+def all_scripts():
+    # every tool in the package, whether or not it is listed in setup.py...
+    scripts = []
+
+    for name in sorted(os.listdir(TOOL_DIR)):
+        path = os.path.join(TOOL_DIR, name)
+
+        if name.endswith('.py') and os.path.isfile(path):
+            with open(path) as file:
+                if "if __name__ == '__main__':" in file.read():
+                    scripts.append(os.path.relpath(path, PACKAGE_ROOT))
+
+    return scripts
+
+
+def import_statements(path):
+    # the source of the module-level imports, including those guarded by try or if...
+    with open(path) as file:
+        source = file.read()
+
+    lines = source.splitlines()
+    statements = []
+
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            statements.append('\n'.join(lines[node.lineno - 1:node.lineno - 1 + source_lines(node)]))
+
+        elif isinstance(node, (ast.Try, ast.If)) and imports_only(node):
+            statements.append('\n'.join(lines[node.lineno - 1:last_line(node)]))
+
+    return '\n'.join(statements)
+
+
+def imports_only(node):
+    for child in ast.walk(node):
+        if isinstance(child, (ast.Call, ast.FunctionDef, ast.ClassDef, ast.Assign)):
+            return False
+
+    return True
+
+
+def source_lines(node):
+    return last_line(node) - node.lineno + 1
+
+
+def last_line(node):
+    if getattr(node, 'end_lineno', None) is not None:
+        return node.end_lineno
+
+    return max(getattr(child, 'lineno', node.lineno) for child in ast.walk(node))
+
+
+def measure(statements, startup=()):
+    # (wall seconds, import seconds, slowest top-level imports, error) - startup modules are not counted...
+    env = dict(os.environ)
+    env['PYTHONPATH'] = SRC_DIR + os.pathsep + env.get('PYTHONPATH', '')
+
+    started = time.time()
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', statements], env=env,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    wall = time.time() - started
+
+    stderr = process.stderr.decode(errors='replace')
+
+    if process.returncode != 0:
+        errors = [line for line in stderr.splitlines() if not line.startswith('import time:')]
+        return None, None, None, errors[-1] if errors else "exit status %d" % process.returncode
+
+    # the top-level imports are those at the least depth...
+    entries = [(len(indent), name, int(cumulative) / 1e6)
+               for _, cumulative, indent, name in IMPORT_TIME.findall(stderr)]
+
+    depth = min((entry[0] for entry in entries), default=0)
+    top = [(name, seconds) for indent, name, seconds in entries if indent == depth and name not in startup]
+
+    return wall, sum(seconds for _, seconds in top), sorted(top, key=lambda entry: -entry[1])[:SLOWEST], None
+
+
+def startup_modules():
+    # the modules imported by an interpreter that imports nothing itself...
+    env = dict(os.environ)
+    env['PYTHONPATH'] = SRC_DIR + os.pathsep + env.get('PYTHONPATH', '')
+
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'pass'], env=env,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    return set(name for _, _, _, name in IMPORT_TIME.findall(process.stderr.decode(errors='replace')))
+
+
+def commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=PACKAGE_ROOT,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = optparse.OptionParser(usage="%prog [-a] [-n REPEATS] [-o OUTPUT] [-v]", version="%prog 1.0")
+
+    parser.add_option("--all", "-a", action="store_true", dest="all", default=False,
+                      help="measure every tool in the package, not only those listed in setup.py")
+
+    parser.add_option("--repeats", "-n", type="int", nargs=1, action="store", dest="repeats",
+                      default=DEFAULT_REPEATS, help="timed imports per script (default %d)" % DEFAULT_REPEATS)
+
+    parser.add_option("--output", "-o", type="string", nargs=1, action="store", dest="output",
+                      help="write results to OUTPUT, rather than stdout")
+
+    parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                      help="report narrative to stderr")
+
+    opts, args = parser.parse_args()
+
+    if opts.repeats < 1 or args:
+        parser.print_help(sys.stderr)
+        exit(2)
+
+    scripts = all_scripts() if opts.all else setup_scripts()
+
+    # the cost of an interpreter that imports nothing...
+    baseline = min(measure('pass')[0] for _ in range(opts.repeats + 1))
+    startup = startup_modules()
+
+    results = []
+
+    try:
+        for script in scripts:
+            path = os.path.join(PACKAGE_ROOT, script)
+
+            if not os.path.isfile(path):
+                wall, imports, slowest, error = None, None, None, "not found"
+
+            else:
+                statements = import_statements(path)
+                measurements = [measure(statements, startup) for _ in range(opts.repeats + 1)][1:]
+
+                error = measurements[-1][3]
+
+                if error is None:
+                    wall = min(measurement[0] for measurement in measurements) - baseline
+                    imports = min(measurement[1] for measurement in measurements)
+                    slowest = min(measurements, key=lambda measurement: measurement[1])[2]
+
+                else:
+                    wall, imports, slowest = None, None, None
+
+            result = OrderedDict([
+                ('script', os.path.basename(script)),
+                ('wall', None if wall is None else round(wall, 4)),
+                ('imports', None if imports is None else round(imports, 4)),
+                ('slowest', None if slowest is None else [[name, round(seconds, 4)] for name, seconds in slowest]),
+                ('error', error)
+            ])
+
+            if opts.verbose:
+                print("startup_benchmark: %s" % json.dumps(result), file=sys.stderr)
+                sys.stderr.flush()
+
+            results.append(result)
+
+    except KeyboardInterrupt:
+        if opts.verbose:
+            print("startup_benchmark: KeyboardInterrupt", file=sys.stderr)
+
+    report = OrderedDict([
+        ('commit', commit()),
+        ('python', '%d.%d.%d' % sys.version_info[:3]),
+        ('created', time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())),
+        ('baseline', round(baseline, 4)),
+        ('results', results)
+    ])
+
+    if opts.output is None:
+        print(json.dumps(report))
+
+    else:
+        with open(opts.output, 'w') as file:
+            file.write(json.dumps(report, indent=4) + '\n')
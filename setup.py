@@ -28,10 +28,13 @@ setup(
         'src/scs_mfr/afe_baseline.py',
         'src/scs_mfr/afe_calib.py',
         'src/scs_mfr/afe_conf.py',
+        'src/scs_mfr/conf_apply.py',
         'src/scs_mfr/csv_reader.py',
         'src/scs_mfr/csv_writer.py',
         'src/scs_mfr/dfe_id.py',
         'src/scs_mfr/dfe_test.py',
+        'src/scs_mfr/dfe_test_client.py',
+        'src/scs_mfr/dfe_test_daemon.py',
         'src/scs_mfr/eeprom_read.py',
         'src/scs_mfr/eeprom_write.py',
         'src/scs_mfr/gps_conf.py',
@@ -42,6 +45,7 @@ setup(
         'src/scs_mfr/osio_client_auth.py',
         'src/scs_mfr/osio_host_organisation.py',
         'src/scs_mfr/osio_project.py',
+        'src/scs_mfr/provision.py',
         'src/scs_mfr/psu_conf.py',
         'src/scs_mfr/pt1000_calib.py',
         'src/scs_mfr/dfe_conf.py',
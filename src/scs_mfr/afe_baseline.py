@@ -49,23 +49,19 @@ from scs_core.gas.afe_calib import AFECalib
 
 from scs_core.gas.sensor_baseline import SensorBaseline, BaselineEnvironment
 
-from scs_dfe.climate.mpl115a2 import MPL115A2
-from scs_dfe.climate.mpl115a2_conf import MPL115A2Conf
-from scs_dfe.climate.sht_conf import SHTConf
-
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.bus.i2c_session import I2CSession
+
 from scs_mfr.cmd.cmd_afe_baseline import CmdAFEBaseline
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
 
-    sht = None
-    mpl = None
-
     now = LocalizedDatetime.now().utc()
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -82,47 +78,20 @@ if __name__ == '__main__':
         sys.stderr.flush()
 
     try:
-        I2C.open(Host.I2C_SENSORS)
+        I2CSession.open(Host.I2C_SENSORS)
 
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        afe_baseline = AFEBaseline.load(Host)
-
-        if not cmd.env_is_specified():
-            # SHTConf...
-            sht_conf = SHTConf.load(Host)
-
-            if sht_conf is None:
-                print("afe_baseline: SHTConf not available.", file=sys.stderr)
-                exit(1)
-
-            if cmd.verbose:
-                print("afe_baseline: %s" % sht_conf, file=sys.stderr)
-
-            # SHT...
-            sht = sht_conf.int_sht()
-
-            # MPL115A2Conf...
-            mpl_conf = MPL115A2Conf.load(Host)
-
-            if mpl_conf is not None:
-                if cmd.verbose:
-                    print("afe_baseline: %s" % mpl_conf, file=sys.stderr)
-
-                # MPL115A2...
-                mpl = MPL115A2.construct(None)
+        afe_baseline = ConfCache.load(AFEBaseline, Host)
 
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        if mpl is not None:
-            mpl.init()
-
         # update...
         if cmd.update():
-            calib = AFECalib.load(Host)
+            calib = ConfCache.load(AFECalib, Host)
 
             if calib is None:
                 print("afe_baseline: no AFE calibration document available.", file=sys.stderr)
@@ -153,6 +122,36 @@ if __name__ == '__main__':
                 press = cmd.press
 
             else:
+                # the drivers are imported only where the sensors are sampled...
+                from scs_dfe.climate.mpl115a2 import MPL115A2
+                from scs_dfe.climate.mpl115a2_conf import MPL115A2Conf
+                from scs_dfe.climate.sht_conf import SHTConf
+
+                # SHTConf...
+                sht_conf = ConfCache.load(SHTConf, Host)
+
+                if sht_conf is None:
+                    print("afe_baseline: SHTConf not available.", file=sys.stderr)
+                    exit(1)
+
+                if cmd.verbose:
+                    print("afe_baseline: %s" % sht_conf, file=sys.stderr)
+
+                # SHT...
+                sht = sht_conf.int_sht()
+
+                # MPL115A2Conf...
+                mpl_conf = ConfCache.load(MPL115A2Conf, Host)
+                mpl = None
+
+                if mpl_conf is not None:
+                    if cmd.verbose:
+                        print("afe_baseline: %s" % mpl_conf, file=sys.stderr)
+
+                    # MPL115A2...
+                    mpl = MPL115A2.construct(None)
+                    mpl.init()
+
                 sht_datum = sht.sample()
                 mpl_datum = None if mpl is None else mpl.sample()
 
@@ -184,4 +183,4 @@ if __name__ == '__main__':
             print("afe_baseline: KeyboardInterrupt", file=sys.stderr)
 
     finally:
-        I2C.close()
+        I2CSession.close()
@@ -55,6 +55,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_afe_calib import CmdAFECalib
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -77,7 +79,7 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        calib = AFECalib.load(Host)
+        calib = ConfCache.load(AFECalib, Host)
 
 
         # ------------------------------------------------------------------------------------------------------------
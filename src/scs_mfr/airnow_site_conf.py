@@ -51,6 +51,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_airnow_site_conf import CmdAirNowSiteConf
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -74,7 +76,7 @@ if __name__ == '__main__':
     # resources...
 
     # APIAuth...
-    conf = AirNowSiteConf.load(Host)
+    conf = ConfCache.load(AirNowSiteConf, Host)
 
     if cmd.verbose and conf is not None:
         print("airnow_site_conf: %s" % conf, file=sys.stderr)
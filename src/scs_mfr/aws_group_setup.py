@@ -23,15 +23,11 @@ A conf file is placed in a default directory referencing the group name and when
 https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/greengrass.html
 """
 
-import boto3
 import socket
 import sys
-from botocore.exceptions import ClientError
 
 from getpass import getpass
 
-
-from scs_core.aws.greengrass.aws_group import AWSGroup
 from scs_core.aws.greengrass.aws_group_configurator import AWSGroupConfigurator
 from scs_core.aws.greengrass.gg_errors import ProjectMissingError
 
@@ -45,6 +41,8 @@ from scs_mfr.cmd.cmd_aws_group_setup import CmdAWSGroupSetup
 # --------------------------------------------------------------------------------------------------------------------
 
 def create_aws_client():
+    import boto3                                    # deferred - boto3 is slow to import, and only needed here
+
     access_key_secret = ""
     access_key_id = input("Enter AWS Access Key ID or leave blank to use environment variables: ")
     if access_key_id:
@@ -104,6 +102,9 @@ if __name__ == '__main__':
             if not user_choice.lower() == "yes":
                 print("Operation cancelled")
                 exit()
+
+        from botocore.exceptions import ClientError
+
         try:
             aws_configurator = AWSGroupConfigurator(aws_group_name, create_aws_client(), cmd.use_ml)
 
@@ -124,6 +125,7 @@ if __name__ == '__main__':
             print("aws_group_setup: Project configuration not set.", file=sys.stderr)
 
     if cmd.show_current:
+        from scs_core.aws.greengrass.aws_group import AWSGroup
 
         try:
             aws_group_info = AWSGroup(cmd.aws_group_name, create_aws_client())
@@ -35,7 +35,6 @@ amazon itself and may be subject to change e.g. via obsolescence - check here:
 https://docs.aws.amazon.com/iot/latest/developerguide/server-authentication.html
 """
 
-import boto3
 import json
 import os
 import socket
@@ -53,6 +52,8 @@ from scs_mfr.cmd.cmd_aws_greengrass_identity import CmdAWSSetup
 # --------------------------------------------------------------------------------------------------------------------
 
 def create_aws_clients():
+    import boto3                                    # deferred - boto3 is slow to import, and only needed here
+
     access_key_secret = ""
     access_key_id = input("Enter AWS Access Key ID or leave blank to use environment variables: ")
     if access_key_id:
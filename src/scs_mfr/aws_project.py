@@ -61,6 +61,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_aws_project import CmdAWSProject
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -81,7 +83,7 @@ if __name__ == '__main__':
 
     # SystemID...
     if cmd.verbose:
-        system_id = SystemID.load(Host)
+        system_id = ConfCache.load(SystemID, Host)
 
         if system_id is None:
             print("aws_project: SystemID not available.", file=sys.stderr)
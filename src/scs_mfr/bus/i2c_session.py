@@ -0,0 +1,158 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A reference-counted stand-in for I2C.open(..) / I2C.close(). The underlying bus is opened on first use, and closed
+only when the last user has finished with it - an outer user, such as a dfe_test run, therefore keeps the file
+descriptor open for every test within it. Where a different bus is requested, the file descriptor is switched.
+
+Each open(..) must be matched by exactly one close() - typically in a finally clause. Unlike I2C.close(), a close()
+without an open session raises RuntimeError.
+"""
+
+import threading
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+from scs_host.bus.i2c import I2C
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class I2CSession(object):
+    """
+    classdocs
+    """
+
+    __LOCK = threading.RLock()
+
+    __bus = None                                    # int    the bus currently open, if any
+    __references = 0                                # int
+
+    __requests = 0                                  # int    calls to open(..)
+    __opens = 0                                     # int    calls to I2C.open(..)
+
+    __opened_at = None                              # float
+    __held_time = 0.0                               # float  seconds for which a bus has been open
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def open(cls, bus):
+        with cls.__LOCK:
+            cls.__requests += 1
+            cls.__references += 1
+
+            if cls.__bus == bus:
+                return
+
+            if cls.__bus is not None:
+                cls.__release()
+
+            I2C.open(bus)
+
+            cls.__bus = bus
+            cls.__opens += 1
+            cls.__opened_at = time.time()
+
+
+    @classmethod
+    def close(cls):
+        with cls.__LOCK:
+            if cls.__references < 1:                # an unmatched close would release another user's reference
+                raise RuntimeError("I2CSession.close: the session is not open")
+
+            cls.__references -= 1
+
+            if cls.__references == 0 and cls.__bus is not None:
+                cls.__release()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def stats(cls):
+        with cls.__LOCK:
+            held_time = cls.__held_time
+
+            if cls.__opened_at is not None:
+                held_time += time.time() - cls.__opened_at
+
+            return I2CSessionStats(cls.__requests, cls.__opens, held_time)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __release(cls):
+        I2C.close()
+
+        cls.__held_time += time.time() - cls.__opened_at
+
+        cls.__bus = None
+        cls.__opened_at = None
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class I2CSessionStats(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, requests, opens, held_time):
+        """
+        Constructor
+        """
+        self.__requests = requests                                      # int
+        self.__opens = opens                                            # int
+        self.__held_time = held_time                                    # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['requests'] = self.requests
+        jdict['opens'] = self.opens
+        jdict['saved'] = self.saved
+        jdict['held'] = round(self.held_time, 3)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def requests(self):
+        return self.__requests
+
+
+    @property
+    def opens(self):
+        return self.__opens
+
+
+    @property
+    def saved(self):
+        return self.__requests - self.__opens
+
+
+    @property
+    def held_time(self):
+        return self.__held_time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "I2CSessionStats:{requests:%s, opens:%s, saved:%s, held_time:%0.3f}" % \
+               (self.requests, self.opens, self.saved, self.held_time)
@@ -5,6 +5,9 @@ Created on 2 Aug 2016
 """
 
 import optparse
+import os
+
+from scs_mfr.conversion.csv_selection import CSVSelection
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -16,25 +19,85 @@ class CmdCSVReader(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-a] [-v] [FILENAME]", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [-c PATHS] [-s START] [-e END] [-a] [{ -l | -p PROCESSES }] "
+                                                    "[-v] [FILENAME ...]", version="%prog 1.0")
 
         # optional...
+        self.__parser.add_option("--columns", "-c", type="string", nargs=1, action="store", dest="columns",
+                                 help="include only the comma-separated header PATHS, and the columns beneath them")
+
+        self.__parser.add_option("--start", "-s", type="string", nargs=1, action="store", dest="start",
+                                 help="include only rows whose rec is at or after ISO 8601 START")
+
+        self.__parser.add_option("--end", "-e", type="string", nargs=1, action="store", dest="end",
+                                 help="include only rows whose rec is before ISO 8601 END")
+
         self.__parser.add_option("--array", "-a", action="store_true", dest="array", default=False,
                                  help="output JSON documents as array instead of a sequence")
 
+        self.__parser.add_option("--live", "-l", action="store_true", dest="live", default=False,
+                                 help="flush each document when stdout is a pipe")
+
+        self.__parser.add_option("--processes", "-p", type="int", nargs=1, action="store", dest="processes",
+                                 help="memory-map FILENAME and convert it with a pool of PROCESSES")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
         self.__opts, self.__args = self.__parser.parse_args()
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.processes is not None:
+            if self.filename is None or self.merge or self.live or self.processes < 1:
+                return False
+
+        if self.start is not None and CSVSelection.timestamp(self.start) is None:
+            return False
+
+        if self.end is not None and CSVSelection.timestamp(self.end) is None:
+            return False
+
+        if self.columns is not None and not all(self.columns):
+            return False
+
+        return True
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
+    @property
+    def columns(self):
+        return None if self.__opts.columns is None else [path.strip() for path in self.__opts.columns.split(',')]
+
+
+    @property
+    def start(self):
+        return self.__opts.start
+
+
+    @property
+    def end(self):
+        return self.__opts.end
+
+
     @property
     def array(self):
         return self.__opts.array
 
 
+    @property
+    def live(self):
+        return self.__opts.live
+
+
+    @property
+    def processes(self):
+        return self.__opts.processes
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -45,6 +108,16 @@ class CmdCSVReader(object):
         return self.__args[0] if len(self.__args) > 0 else None
 
 
+    @property
+    def filenames(self):
+        return self.__args
+
+
+    @property
+    def merge(self):
+        return len(self.__args) > 1 or (len(self.__args) == 1 and os.path.isdir(self.__args[0]))
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def print_help(self, file):
@@ -52,4 +125,7 @@ class CmdCSVReader(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdCSVReader:{array:%s, verbose:%s, filename:%s}" % (self.array, self.verbose, self.filename)
+        return "CmdCSVReader:{columns:%s, start:%s, end:%s, array:%s, live:%s, processes:%s, verbose:%s, " \
+               "filenames:%s}" % \
+               (self.columns, self.start, self.end, self.array, self.live, self.processes, self.verbose,
+                self.filenames)
@@ -12,19 +12,35 @@ import optparse
 class CmdCSVWriter(object):
     """unix command line handler"""
 
+    CSV = 'csv'
+    COLUMNAR = 'columnar'
+
+    FORMATS = (CSV, COLUMNAR)
+
     def __init__(self):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [FILENAME] [-c] [-a] [-e] [-v]", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [FILENAME] [-f FORMAT] [-c] [-a] "
+                                                    "[-i INTERVAL [-b MAX_BUFFER]] [-e] [-v]",
+                                              version="%prog 1.0")
 
         # optional...
+        self.__parser.add_option("--format", "-f", type="choice", choices=self.FORMATS, action="store",
+                                 dest="format", default=self.CSV, help="output format { csv | columnar } (default csv)")
+
         self.__parser.add_option("--cache", "-c", action="store_true", dest="cache", default=False,
                                  help="cache rows in heap space until exit")
 
         self.__parser.add_option("--append", "-a", action="store_true", dest="append", default=False,
                                  help="append rows to existing file")
 
+        self.__parser.add_option("--interval", "-i", type="float", nargs=1, action="store", dest="interval",
+                                 default=0, help="write buffered rows every INTERVAL seconds (default 0)")
+
+        self.__parser.add_option("--max-buffer", "-b", type="int", nargs=1, action="store", dest="max_buffer",
+                                 default=None, help="write when MAX_BUFFER characters are held (default 65536)")
+
         self.__parser.add_option("--echo", "-e", action="store_true", dest="echo", default=False,
                                  help="echo stdin to stdout")
 
@@ -34,6 +50,18 @@ class CmdCSVWriter(object):
         self.__opts, self.__args = self.__parser.parse_args()
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.interval < 0:
+            return False
+
+        if self.max_buffer is not None and (self.interval == 0 or self.max_buffer < 1 or self.columnar):
+            return False
+
+        return True
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -41,6 +69,16 @@ class CmdCSVWriter(object):
         return self.__args[0] if len(self.__args) > 0 else None
 
 
+    @property
+    def format(self):
+        return self.__opts.format
+
+
+    @property
+    def columnar(self):
+        return self.format == self.COLUMNAR
+
+
     @property
     def cache(self):
         return self.__opts.cache
@@ -51,6 +89,16 @@ class CmdCSVWriter(object):
         return self.__opts.append
 
 
+    @property
+    def interval(self):
+        return self.__opts.interval
+
+
+    @property
+    def max_buffer(self):
+        return self.__opts.max_buffer
+
+
     @property
     def echo(self):
         return self.__opts.echo
@@ -63,6 +111,12 @@ class CmdCSVWriter(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
     def __str__(self, *args, **kwargs):
-        return "CmdCSVWriter:{filename:%s, cache:%s, append:%s, echo:%s, verbose:%s}" % \
-                    (self.filename, self.cache, self.append, self.echo, self.verbose)
+        return "CmdCSVWriter:{filename:%s, format:%s, cache:%s, append:%s, interval:%s, max_buffer:%s, echo:%s, " \
+               "verbose:%s}" % \
+                    (self.filename, self.format, self.cache, self.append, self.interval, self.max_buffer, self.echo,
+                     self.verbose)
@@ -12,14 +12,18 @@ import optparse
 class CmdDFETest(object):
     """unix command line handler"""
 
-    def __init__(self):
+    def __init__(self, args=None, prog=None):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-e] [-g] [-r] [-v] DFE_SERIAL_NUMBER",
-                                              version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [-e] [-g] [-r] [-t] [-v] "
+                                                    "{ DFE_SERIAL_NUMBER | -m MANIFEST }",
+                                              version="%prog 1.0", prog=prog)
 
         # optional...
+        self.__parser.add_option("--manifest", "-m", type="string", nargs=1, action="store", dest="manifest",
+                                 help="station mode: test the boards listed in the MANIFEST file")
+
         self.__parser.add_option("--eeprom", "-e", action="store_true", dest="ignore_eeprom", default=False,
                                  help="ignore EEPROM")
 
@@ -29,16 +33,19 @@ class CmdDFETest(object):
         self.__parser.add_option("--rtc", "-r", action="store_true", dest="ignore_rtc", default=False,
                                  help="ignore real-time clock")
 
+        self.__parser.add_option("--timing", "-t", action="store_true", dest="timing", default=False,
+                                 help="report the time taken by each setup stage and subject")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
-        self.__opts, self.__args = self.__parser.parse_args()
+        self.__opts, self.__args = self.__parser.parse_args(args)           # args is sys.argv[1:] if None
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def is_valid(self):
-        if self.dfe_serial_number is None:
+        if (self.dfe_serial_number is None) == (self.manifest is None):
             return False
 
         return True
@@ -51,6 +58,11 @@ class CmdDFETest(object):
         return self.__args[0] if len(self.__args) > 0 else None
 
 
+    @property
+    def manifest(self):
+        return self.__opts.manifest
+
+
     @property
     def ignore_eeprom(self):
         return self.__opts.ignore_eeprom
@@ -66,6 +78,11 @@ class CmdDFETest(object):
         return self.__opts.ignore_rtc
 
 
+    @property
+    def timing(self):
+        return self.__opts.timing
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -78,5 +95,7 @@ class CmdDFETest(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdDFETest:{dfe_serial_number:%s, ignore_eeprom:%s, ignore_gps:%s, ignore_rtc:%s, verbose:%s}" % \
-                    (self.dfe_serial_number, self.ignore_eeprom, self.ignore_gps, self.ignore_rtc, self.verbose)
+        return "CmdDFETest:{dfe_serial_number:%s, manifest:%s, ignore_eeprom:%s, ignore_gps:%s, ignore_rtc:%s, " \
+               "timing:%s, verbose:%s}" % \
+                    (self.dfe_serial_number, self.manifest, self.ignore_eeprom, self.ignore_gps, self.ignore_rtc,
+                     self.timing, self.verbose)
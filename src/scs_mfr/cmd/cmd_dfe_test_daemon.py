@@ -0,0 +1,60 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdDFETestDaemon(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-s SOCKET] [-v]", version="%prog 1.0")
+
+        # optional...
+        self.__parser.add_option("--socket", "-s", type="string", nargs=1, action="store", dest="socket",
+                                 help="listen on the Unix SOCKET (default $SCS_DFE_TEST_SOCKET, or a socket in "
+                                      "$XDG_RUNTIME_DIR, or in a private directory in the temporary directory)")
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if len(self.__args) > 0:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def socket(self):
+        return self.__opts.socket
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdDFETestDaemon:{socket:%s, verbose:%s}" % (self.socket, self.verbose)
@@ -0,0 +1,67 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdEEPROMRead(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [{ -d | -r REFERENCE }] [-v]", version="%prog 1.0")
+
+        # optional...
+        self.__parser.add_option("--diff", "-d", action="store_true", dest="diff", default=False,
+                                 help="show only the pages that differ from the host's reference image")
+
+        self.__parser.add_option("--reference", "-r", type="string", nargs=1, action="store", dest="reference",
+                                 help="show only the pages that differ from the REFERENCE image file")
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.__opts.diff and self.__opts.reference is not None:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def diff(self):
+        return self.__opts.diff or self.__opts.reference is not None
+
+
+    @property
+    def reference(self):
+        return self.__opts.reference
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdEEPROMRead:{diff:%s, reference:%s, verbose:%s}" % (self.diff, self.reference, self.verbose)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The conf_apply utility brings the configuration documents of a device into line with a single MANIFEST - a JSON
+object whose fields are the documents, keyed by name. Each document is compared with the stored document, and is
+written only if it differs, so that applying a fleet manifest to a device that is already correctly configured reads
+each document, and writes nothing.
+
+A document in the manifest need only give the fields that it sets - other fields keep their stored values. Where a
+document is null, the stored document is deleted. Documents that are not named in the manifest are not touched.
+
+The documents are: system_id, interface_conf, sht_conf, mpl115a2_conf, gps_conf, opc_conf, scd30_conf, psu_conf,
+mqtt_conf, csv_logger_conf, schedule, timezone_conf and airnow_site_conf. Each takes the form reported by its conf
+utility. The opc_conf document is the default, unnamed OPC configuration.
+
+Every document is validated before any document is written. Each document is written atomically, by replacing the
+stored file, so that a device is never left with a partially-written document.
+
+The utility reports the action taken for each document - unchanged, write or delete. With the --dry-run flag, the
+actions are reported, but not taken. As for the individual conf utilities, the processes that use the documents must
+be restarted for changes to take effect.
+
+SYNOPSIS
+conf_apply.py [-n] [-v] MANIFEST
+
+EXAMPLES
+./conf_apply.py -v ~/SCS/fleet_manifest.json
+
+DOCUMENT EXAMPLE - MANIFEST
+{"sht_conf": {"int": "0x44", "ext": "0x45"}, "interface_conf": {"model": "DFE"},
+"schedule": {"scs-climate": {"interval": 10.0, "tally": 1}}, "mqtt_conf": null}
+
+DOCUMENT EXAMPLE - OUTPUT
+{"sht_conf": "unchanged", "interface_conf": "unchanged", "schedule": "write", "mqtt_conf": "delete"}
+
+SEE ALSO
+scs_mfr/provision
+"""
+
+import sys
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+
+from scs_host.sys.host import Host
+
+from scs_mfr.cmd.cmd_conf_apply import CmdConfApply
+
+from scs_mfr.provisioning.conf_manifest import ConfManifest
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    report = OrderedDict()
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdConfApply()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("conf_apply: %s" % cmd, file=sys.stderr)
+        sys.stderr.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # resources...
+
+    # ConfManifest...
+    try:
+        manifest = ConfManifest.construct_from_file(cmd.manifest)
+
+    except FileNotFoundError:
+        print("conf_apply: file not found: %s" % cmd.manifest, file=sys.stderr)
+        exit(1)
+
+    except ValueError as ex:
+        print("conf_apply: malformed manifest: %s" % ex, file=sys.stderr)
+        exit(1)
+
+    if cmd.verbose:
+        print("conf_apply: %s" % manifest, file=sys.stderr)
+        sys.stderr.flush()
+
+    # ConfUpdates...
+    try:
+        updates = manifest.updates(Host)
+
+    except ImportError as ex:
+        print("conf_apply: %s" % ex, file=sys.stderr)
+        exit(1)
+
+    except ValueError as ex:
+        print("conf_apply: malformed document: %s" % ex, file=sys.stderr)
+        exit(1)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # run...
+
+    for update in updates:
+        if cmd.verbose:
+            print("conf_apply: %s" % update, file=sys.stderr)
+            sys.stderr.flush()
+
+        try:
+            report[update.name] = update.action(Host) if cmd.dry_run else update.apply(Host)
+
+        except OSError as ex:
+            print("conf_apply: %s: %s" % (update.name, ex), file=sys.stderr)
+            exit(1)
+
+    print(JSONify.dumps(report))
@@ -0,0 +1,483 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A compact, binary, columnar alternative to CSV for sensor data streams. Columns are named with the same header paths
+as CSV, and a file may be appended to, since each block is self-contained. All values are little-endian.
+
+file:   MAGIC, uint32 header length, header (UTF-8 JSON array of column names), block...
+block:  'B', uint32 row count, column...
+column: type, payload
+
+type    payload
+'n'     none - every value is null
+'i'     nulls, int64 x count
+'w'     nulls, uint8 width, int8 | int16 | int32 x count - integers of 1, 2 or 4 bytes
+'f'     nulls, float32 x count - used only where every value can be restored exactly
+'d'     nulls, float64 x count
+'s'     nulls, uint32 dictionary size, (uint32 length, UTF-8 string) x size, uint8 index width, index x count
+'t'     nulls, uint32 style count, (uint32 length, UTF-8 style) x count, uint8 index width, int64 x count, index x count
+'j'     uint32 length, UTF-8 JSON array of values - booleans, mixed types and out-of-range integers
+nulls   uint8 0 | uint8 1, bitmap of ceil(count / 8) bytes, set bit for a null value
+
+A 't' column holds ISO 8601 datetimes, such as rec, as microseconds since the Unix epoch, UTC. Each value's style -
+its number of fractional second digits, and its UTC offset as written, such as "3+01:00" or "0Z" - is held in a
+dictionary. An index width of 0 means that every value has the first style. A string column is written as 't' only
+where every value is restored exactly - otherwise, it is written as 's'.
+
+Decoded columns are returned both as values and as JSON text, so that a regular CSVTemplate can compose documents
+without re-encoding them.
+"""
+
+import json
+import re
+import struct
+import sys
+
+from array import array
+from datetime import datetime, timedelta
+from json.encoder import encode_basestring_ascii
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ColumnarFormat(object):
+    """
+    classdocs
+    """
+
+    MAGIC =                 b'SCSCOL\x01'
+
+    __BLOCK =               b'B'
+
+    __NULL =                b'n'
+    __INT =                 b'i'
+    __NARROW_INT =          b'w'
+    __FLOAT32 =             b'f'
+    __FLOAT64 =             b'd'
+    __STRING =              b's'
+    __DATETIME =            b't'
+    __JSON =                b'j'
+
+    __INT_MIN =             -(1 << 63)
+    __INT_MAX =             (1 << 63) - 1
+
+    __INDEX_TYPES =         {1: 'B', 2: 'H', 4: 'I'}
+    __NARROW_INT_TYPES =    {1: 'b', 2: 'h', 4: 'i'}
+
+    __ISO_8601 =            re.compile(r'(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?'
+                                       r'(Z|[+-]\d{2}:\d{2})$', re.ASCII)
+
+    __EPOCH =               datetime(1970, 1, 1)
+
+    __FLOAT_CONSTANTS =     {'nan': 'NaN', 'inf': 'Infinity', '-inf': '-Infinity'}
+
+    __UINT32 =              struct.Struct('<I')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def is_columnar(cls, prefix):
+        return prefix[:len(cls.MAGIC)] == cls.MAGIC
+
+
+    @classmethod
+    def restore32(cls, value):
+        # the shortest decimal that gives the same float32 - the writer checks that this is the original value...
+        packed = struct.pack('<f', value)
+
+        for precision in (6, 7, 8):
+            restored = float('%.*g' % (precision, value))
+
+            if struct.pack('<f', restored) == packed:
+                return restored
+
+        return float('%.9g' % value)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def header(cls, names):
+        text = json.dumps(names).encode()
+
+        return cls.MAGIC + cls.__UINT32.pack(len(text)) + text
+
+
+    @classmethod
+    def read_header(cls, stream):
+        magic = stream.read(len(cls.MAGIC))
+
+        if len(magic) == 0:
+            return None
+
+        if magic != cls.MAGIC:
+            raise ValueError("read_header: not a columnar file")
+
+        length = cls.__read_uint32(stream)
+
+        return json.loads(stream.read(length).decode())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def encode_block(cls, rows, width):
+        pieces = [cls.__BLOCK, cls.__UINT32.pack(len(rows))]
+
+        for column in range(width):
+            pieces.append(cls.__encode_column([row[column] for row in rows]))
+
+        return b''.join(pieces)
+
+
+    @classmethod
+    def decode_block(cls, stream, width):
+        # returns (value columns, encoded columns), or None at end of stream...
+        marker = stream.read(1)
+
+        if len(marker) == 0:
+            return None
+
+        if marker != cls.__BLOCK:
+            raise ValueError("decode_block: bad block marker: %s" % marker)
+
+        count = cls.__read_uint32(stream)
+
+        values = []
+        encoded = []
+
+        for _ in range(width):
+            column_values, column_encoded = cls.__decode_column(stream, count)
+
+            values.append(column_values)
+            encoded.append(column_encoded)
+
+        return values, encoded
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __encode_column(cls, values):
+        present = [value for value in values if value is not None]
+
+        if not present:
+            return cls.__NULL
+
+        kinds = set(type(value) for value in present)
+
+        if kinds == {int} and cls.__INT_MIN <= min(present) and max(present) <= cls.__INT_MAX:
+            for width, typecode in cls.__NARROW_INT_TYPES.items():
+                limit = 1 << (width * 8 - 1)
+
+                if -limit <= min(present) and max(present) < limit:
+                    return cls.__NARROW_INT + cls.__nulls(values) + bytes((width, )) + \
+                           cls.__array(typecode, values, 0)
+
+            return cls.__INT + cls.__nulls(values) + cls.__array('q', values, 0)
+
+        if kinds == {float}:
+            try:
+                float32 = array('f', present)
+
+            except OverflowError:
+                float32 = ()
+
+            if float32 and all(cls.restore32(restored) == value for restored, value in zip(float32, present)):
+                return cls.__FLOAT32 + cls.__nulls(values) + cls.__array('f', values, 0.0)
+
+            return cls.__FLOAT64 + cls.__nulls(values) + cls.__array('d', values, 0.0)
+
+        if kinds == {str}:
+            datetimes = cls.__datetimes(values)
+
+            if datetimes is not None:
+                return cls.__DATETIME + cls.__nulls(values) + datetimes
+
+            return cls.__STRING + cls.__nulls(values) + cls.__dictionary(values)
+
+        text = json.dumps(values).encode()
+
+        return cls.__JSON + cls.__UINT32.pack(len(text)) + text
+
+
+    @classmethod
+    def __decode_column(cls, stream, count):
+        kind = stream.read(1)
+
+        if kind == cls.__NULL:
+            return [None] * count, ['null'] * count
+
+        if kind == cls.__JSON:
+            length = cls.__read_uint32(stream)
+            values = json.loads(stream.read(length).decode())
+
+            return values, [json.dumps(value) for value in values]
+
+        nulls = cls.__read_nulls(stream, count)
+
+        if kind == cls.__INT:
+            values = cls.__read_array(stream, 'q', count).tolist()
+            encoded = [str(value) for value in values]
+
+        elif kind == cls.__NARROW_INT:
+            width = stream.read(1)[0]
+            values = cls.__read_array(stream, cls.__NARROW_INT_TYPES[width], count).tolist()
+            encoded = [str(value) for value in values]
+
+        elif kind == cls.__FLOAT32:
+            # sensor readings repeat, so each distinct value is restored and encoded once - values are keyed by
+            # their bits, since 0.0 and -0.0 are equal...
+            items = cls.__read_array(stream, 'f', count)
+            bits = array('I', items.tobytes())
+
+            restored = {}
+            values = []
+            encoded = []
+
+            for key, value in zip(bits, items):
+                if key not in restored:
+                    original = cls.restore32(value)
+                    restored[key] = (original, cls.__encode_float(original))
+
+                original, text = restored[key]
+
+                values.append(original)
+                encoded.append(text)
+
+        elif kind == cls.__FLOAT64:
+            values = cls.__read_array(stream, 'd', count).tolist()
+            encoded = [cls.__encode_float(value) for value in values]
+
+        elif kind == cls.__STRING:
+            size = cls.__read_uint32(stream)
+            dictionary = [stream.read(cls.__read_uint32(stream)).decode() for _ in range(size)]
+            dictionary_encoded = [encode_basestring_ascii(entry) for entry in dictionary]
+
+            width = stream.read(1)[0]
+            indices = cls.__read_array(stream, cls.__INDEX_TYPES[width], count)
+
+            values = [dictionary[index] for index in indices]
+            encoded = [dictionary_encoded[index] for index in indices]
+
+        elif kind == cls.__DATETIME:
+            size = cls.__read_uint32(stream)
+            styles = [cls.__style(stream.read(cls.__read_uint32(stream)).decode()) for _ in range(size)]
+
+            width = stream.read(1)[0]
+            micros = cls.__read_array(stream, 'q', count)
+            indices = [0] * count if width == 0 else cls.__read_array(stream, cls.__INDEX_TYPES[width], count)
+
+            values = [cls.__format_datetime(value, *styles[index]) for value, index in zip(micros, indices)]
+            encoded = ['"' + value + '"' for value in values]
+
+        else:
+            raise ValueError("decode_column: unknown column type: %s" % kind)
+
+        if nulls is not None:
+            for i in nulls:
+                values[i] = None
+                encoded[i] = 'null'
+
+        return values, encoded
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __nulls(cls, values):
+        indices = [i for i, value in enumerate(values) if value is None]
+
+        if not indices:
+            return b'\x00'
+
+        bitmap = bytearray((len(values) + 7) // 8)
+
+        for i in indices:
+            bitmap[i >> 3] |= 1 << (i & 7)
+
+        return b'\x01' + bytes(bitmap)
+
+
+    @classmethod
+    def __read_nulls(cls, stream, count):
+        if stream.read(1) == b'\x00':
+            return None
+
+        bitmap = stream.read((count + 7) // 8)
+
+        return [i for i in range(count) if bitmap[i >> 3] & (1 << (i & 7))]
+
+
+    @classmethod
+    def __dictionary(cls, values):
+        dictionary = {}
+        indices = []
+
+        for value in values:
+            if value is None:
+                indices.append(0)
+                continue
+
+            if value not in dictionary:
+                dictionary[value] = len(dictionary)
+
+            indices.append(dictionary[value])
+
+        width = 1 if len(dictionary) <= 0x100 else 2 if len(dictionary) <= 0x10000 else 4
+
+        pieces = [cls.__UINT32.pack(len(dictionary))]
+
+        for entry in dictionary:
+            text = entry.encode()
+            pieces.append(cls.__UINT32.pack(len(text)) + text)
+
+        pieces.append(bytes((width, )))
+        pieces.append(cls.__array(cls.__INDEX_TYPES[width], indices, 0))
+
+        return b''.join(pieces)
+
+
+    @classmethod
+    def __datetimes(cls, values):
+        # the 't' payload, or None if any value is not restored exactly...
+        styles = {}
+        micros = []
+        indices = []
+
+        for value in values:
+            if value is None:
+                micros.append(0)
+                indices.append(0)
+                continue
+
+            parsed = cls.__parse_datetime(value)
+
+            if parsed is None:
+                return None
+
+            micro, style = parsed
+
+            if style not in styles:
+                styles[style] = len(styles)
+
+            if cls.__format_datetime(micro, *cls.__style(style)) != value:
+                return None
+
+            micros.append(micro)
+            indices.append(styles[style])
+
+        if not styles:
+            return None
+
+        width = 0 if len(styles) == 1 else 1 if len(styles) <= 0x100 else 2 if len(styles) <= 0x10000 else 4
+
+        pieces = [cls.__UINT32.pack(len(styles))]
+
+        for style in styles:
+            text = style.encode()
+            pieces.append(cls.__UINT32.pack(len(text)) + text)
+
+        pieces.append(bytes((width, )))
+        pieces.append(cls.__array('q', micros, 0))
+
+        if width > 0:
+            pieces.append(cls.__array(cls.__INDEX_TYPES[width], indices, 0))
+
+        return b''.join(pieces)
+
+
+    @classmethod
+    def __parse_datetime(cls, value):
+        # (microseconds since the epoch, UTC, style), or None...
+        match = cls.__ISO_8601.match(value)
+
+        if match is None:
+            return None
+
+        year, month, day, hour, minute, second, fraction, offset = match.groups()
+
+        try:
+            local = datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                             0 if fraction is None else int(fraction.ljust(6, '0')))
+
+        except ValueError:
+            return None
+
+        style = '%d%s' % (0 if fraction is None else len(fraction), offset)
+        delta = local - cls.__EPOCH
+
+        micro = (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds - cls.__style(style)[2]
+
+        return micro, style
+
+
+    @classmethod
+    def __style(cls, style):
+        # (fractional digits, offset text, offset microseconds)...
+        digits = int(style[0])
+        offset = style[1:]
+
+        if offset == 'Z':
+            return digits, offset, 0
+
+        minutes = (int(offset[1:3]) * 60 + int(offset[4:6])) * (-1 if offset[0] == '-' else 1)
+
+        return digits, offset, minutes * 60000000
+
+
+    @classmethod
+    def __format_datetime(cls, micro, digits, offset, offset_micro):
+        local = cls.__EPOCH + timedelta(microseconds=micro + offset_micro)
+
+        text = '%04d-%02d-%02dT%02d:%02d:%02d' % (local.year, local.month, local.day,
+                                                   local.hour, local.minute, local.second)
+
+        if digits:
+            text += '.' + ('%06d' % local.microsecond)[:digits]
+
+        return text + offset
+
+
+    @classmethod
+    def __array(cls, typecode, values, null_value):
+        items = array(typecode, [null_value if value is None else value for value in values])
+
+        if sys.byteorder != 'little':
+            items.byteswap()
+
+        return items.tobytes()
+
+
+    @classmethod
+    def __read_array(cls, stream, typecode, count):
+        items = array(typecode)
+        items.frombytes(stream.read(items.itemsize * count))
+
+        if len(items) != count:
+            raise ValueError("read_array: truncated block")
+
+        if sys.byteorder != 'little':
+            items.byteswap()
+
+        return items
+
+
+    @classmethod
+    def __read_uint32(cls, stream):
+        data = stream.read(4)
+
+        if len(data) != 4:
+            raise ValueError("read_uint32: truncated stream")
+
+        return cls.__UINT32.unpack(data)[0]
+
+
+    @classmethod
+    def __encode_float(cls, value):
+        text = float.__repr__(value)
+
+        return cls.__FLOAT_CONSTANTS.get(text, text)
@@ -0,0 +1,129 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Reads a columnar file (or stdin) written by ColumnarStreamWriter, and converts each block to JSON text. Documents are
+built from the header paths exactly as they are for CSV input.
+
+Where a CSVSelection is given, it is applied to whole columns once each block has been decoded.
+"""
+
+import sys
+
+from scs_mfr.conversion.columnar_format import ColumnarFormat
+from scs_mfr.conversion.compressed_file import CompressedFile
+from scs_mfr.conversion.csv_selection import CSVSelection
+from scs_mfr.conversion.csv_template import CSVTemplate
+from scs_mfr.conversion.json_codec import JSONCodec
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ColumnarReader(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def is_columnar_file(filename):
+        if filename is None:
+            try:
+                return ColumnarFormat.is_columnar(sys.stdin.buffer.peek(len(ColumnarFormat.MAGIC)))
+
+            except (AttributeError, ValueError):
+                return False
+
+        with CompressedFile.open(filename, "rb") as file:
+            return ColumnarFormat.is_columnar(file.read(len(ColumnarFormat.MAGIC)))
+
+
+    @classmethod
+    def construct_for_file(cls, filename, paths=None, start=None, end=None):
+        file = sys.stdin.buffer if filename is None else CompressedFile.open(filename, "rb")
+
+        return ColumnarReader(file, paths, start, end)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, file, paths=None, start=None, end=None):
+        """
+        Constructor
+        """
+        self.__file = file                                              # binary file
+
+        header = ColumnarFormat.read_header(file)
+
+        if header is None:
+            self.__width = 0
+            self.__selection = None
+            self.__template = None
+            return
+
+        self.__width = len(header)
+        self.__selection = CSVSelection.construct(header, paths, start, end)        # raises ValueError
+        self.__template = CSVTemplate.construct(self.__selection.header(header))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def blocks(self):
+        if self.__template is None:
+            return
+
+        width = self.__width
+        select = None if self.__selection.is_identity() else self.__selection.select_columns
+        codec = JSONCodec.default()
+
+        while True:
+            block = ColumnarFormat.decode_block(self.__file, width)
+
+            if block is None:
+                return
+
+            values, encoded = block
+
+            if select is not None:
+                values, encoded = select(values, encoded)
+
+                if not values or not values[0]:
+                    continue
+
+            if self.__template.is_regular():
+                yield self.__template.compose(zip(*encoded))
+
+            else:
+                yield [codec.dumps(self.__template.document(row)) for row in zip(*values)]
+
+
+    def rows(self):
+        for block in self.blocks():
+            for jstr in block:
+                yield jstr
+
+
+    def close(self):
+        if self.__file is not sys.stdin.buffer:
+            self.__file.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def selection(self):
+        return self.__selection
+
+
+    @property
+    def template(self):
+        return self.__template
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ColumnarReader:{file:%s, selection:%s, template:%s}" % \
+               (self.__file.name, self.selection, self.template)
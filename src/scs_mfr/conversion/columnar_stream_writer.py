@@ -0,0 +1,182 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Writes a stream of JSON documents to a columnar file (or stdout), using a JSONFlattener compiled from the first
+document - or, when appending to an existing file, from that file's header. Rows are held until a block is full or,
+where a flush interval is given, until a timer writes them, at most one interval after the first row was held. Rows
+still held are written when the writer is closed. An error raised by the timer's write is raised again by the next
+write_document(..) or close().
+"""
+
+import os
+import sys
+import threading
+
+from scs_mfr.conversion.columnar_format import ColumnarFormat
+from scs_mfr.conversion.compressed_file import CompressedFile
+from scs_mfr.conversion.json_codec import JSONCodec
+from scs_mfr.conversion.json_flattener import JSONFlattener
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ColumnarStreamWriter(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_BLOCK_ROWS =        4096
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def existing_header(filename):
+        if filename is None or not os.path.isfile(filename):
+            return None
+
+        with CompressedFile.open(filename, "rb") as file:
+            try:
+                return ColumnarFormat.read_header(file)
+
+            except ValueError:
+                raise ValueError("cannot append to a file that is not columnar: %s" % filename)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename=None, append=False, interval=0, block_rows=DEFAULT_BLOCK_ROWS):
+        """
+        Constructor
+        """
+        self.__filename = filename                                      # string or None for stdout
+        self.__append = append                                          # bool
+        self.__interval = interval                                      # float seconds, 0 for full blocks only
+        self.__block_rows = block_rows                                  # int
+
+        header = self.existing_header(filename) if append else None
+        self.__flattener = None if header is None else JSONFlattener.construct_from_header(header)
+        self.__codec = JSONCodec.default()
+
+        if filename is None:
+            self.__file = sys.stdout.buffer
+
+        else:
+            self.__file = CompressedFile.open(filename, "ab" if append else "wb")
+
+        self.__rows = []
+
+        self.__lock = threading.RLock()
+        self.__timer = None                                             # threading.Timer while rows are held
+        self.__timer_error = None                                       # Exception raised by the timer's flush
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, jstr):
+        if not jstr:
+            return
+
+        # only the first document's field order is significant...
+        self.write_document(self.__codec.loads(jstr, ordered=self.__flattener is None))
+
+
+    def write_document(self, document):
+        with self.__lock:
+            self.__raise_timer_error()
+
+            if self.__flattener is None:
+                self.__flattener = JSONFlattener.construct_from_document(document)
+                self.__file.write(ColumnarFormat.header(self.__flattener.header))
+
+            self.__rows.append(self.__flattener.row(document))
+
+            if len(self.__rows) >= self.__block_rows:
+                self.flush()
+
+            elif self.__interval > 0 and self.__timer is None:
+                self.__timer = threading.Timer(self.__interval, self.__flush_held)
+                self.__timer.daemon = True
+                self.__timer.start()
+
+
+    def flush(self):
+        with self.__lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+
+            if self.__rows:
+                self.__file.write(ColumnarFormat.encode_block(self.__rows, len(self.__flattener)))
+                self.__rows = []
+
+            self.__file.flush()
+
+
+    def close(self):
+        try:
+            self.flush()
+            self.__raise_timer_error()
+
+        finally:
+            if self.__file is not sys.stdout.buffer:
+                self.__file.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __flush_held(self):
+        # runs on the timer thread - a timer that was cancelled while waiting for the lock finds no rows held...
+        with self.__lock:
+            if self.__timer is None:
+                return
+
+            try:
+                self.flush()
+
+            except Exception as ex:
+                self.__timer_error = ex
+
+
+    def __raise_timer_error(self):
+        if self.__timer_error is not None:
+            error = self.__timer_error
+            self.__timer_error = None
+
+            raise error
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def append(self):
+        return self.__append
+
+
+    @property
+    def interval(self):
+        return self.__interval
+
+
+    @property
+    def block_rows(self):
+        return self.__block_rows
+
+
+    @property
+    def flattener(self):
+        return self.__flattener
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ColumnarStreamWriter:{filename:%s, append:%s, interval:%s, block_rows:%s, flattener:%s}" % \
+               (self.filename, self.append, self.interval, self.block_rows, self.flattener)
@@ -0,0 +1,285 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Opens files that may be compressed, choosing the codec by file extension - gzip (.gz), xz (.xz) or zstd (.zst). Other
+files are opened as normal.
+
+Compressed files are streamed through a background thread, which runs the codec: on read, the thread decompresses
+ahead of the reader, and on write, the thread compresses behind the writer. Both codecs release the GIL while they
+work, so conversion overlaps with compression. Data passes between the threads in chunks, through a bounded queue.
+
+Appending starts a new compressed member (gzip), stream (xz) or frame (zstd) - each codec reads concatenated members
+as one. Compressed output is completed when the file is closed. Flushing hands buffered data to the codec thread, but
+does not force the codec to emit a block, since doing so for each row would defeat compression.
+
+zstd requires the zstandard package.
+"""
+
+import io
+import os
+import queue
+import threading
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CompressedFile(object):
+    """
+    classdocs
+    """
+
+    GZIP =                  'gzip'
+    XZ =                    'xz'
+    ZSTD =                  'zstd'
+
+    EXTENSIONS =            {'.gz': GZIP, '.xz': XZ, '.zst': ZSTD}
+
+    GZIP_LEVEL =            6                   # as the gzip command - level 9 is three times slower, for 2% gain
+
+    CHUNK_SIZE =            1 << 16             # bytes
+    QUEUE_SIZE =            16                  # chunks
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def codec(cls, filename):
+        if filename is None:
+            return None
+
+        return cls.EXTENSIONS.get(os.path.splitext(filename)[1].lower())
+
+
+    @classmethod
+    def open(cls, filename, mode="r", newline=None):
+        # as the builtin open(..), for modes r, w, a, with or without b...
+        codec = cls.codec(filename)
+
+        if codec is None:
+            return open(filename, mode, newline=None if 'b' in mode else newline)
+
+        if mode.replace('b', '') == 'r':
+            raw = CompressedReader(cls.__codec_file(codec, filename, 'rb'))
+            stream = io.BufferedReader(raw, cls.CHUNK_SIZE)
+
+        else:
+            raw = CompressedWriter(cls.__codec_file(codec, filename, 'ab' if 'a' in mode else 'wb'))
+            stream = io.BufferedWriter(raw, cls.CHUNK_SIZE)
+
+        return stream if 'b' in mode else io.TextIOWrapper(stream, newline=newline)
+
+
+    @classmethod
+    def __codec_file(cls, codec, filename, mode):
+        # a binary file object that runs the codec - opened in the calling thread, so that errors are raised here...
+        if codec == cls.GZIP:
+            import gzip
+            return gzip.open(filename, mode) if mode == 'rb' else gzip.open(filename, mode, cls.GZIP_LEVEL)
+
+        if codec == cls.XZ:
+            import lzma
+            return lzma.open(filename, mode)
+
+        try:
+            import zstandard
+
+        except ImportError:
+            raise ValueError("zstd compression requires the zstandard package: %s" % filename)
+
+        file = open(filename, mode)
+
+        if mode == 'rb':
+            return zstandard.ZstdDecompressor().stream_reader(file, read_across_frames=True, closefd=True)
+
+        return zstandard.ZstdCompressor().stream_writer(file, closefd=True)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CompressedReader(io.RawIOBase):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, codec_file):
+        """
+        Constructor
+        """
+        super().__init__()
+
+        self.__codec_file = codec_file                                  # binary file, decompressing
+        self.__queue = queue.Queue(CompressedFile.QUEUE_SIZE)           # bytes, None at EOF, or Exception
+        self.__stopping = threading.Event()
+
+        self.__chunk = b''
+        self.__offset = 0
+        self.__eof = False
+
+        self.__thread = threading.Thread(target=self.__run, name="CompressedReader", daemon=True)
+        self.__thread.start()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def readable(self):
+        return True
+
+
+    def readinto(self, buffer):
+        while self.__offset >= len(self.__chunk):
+            if self.__eof:
+                return 0
+
+            item = self.__queue.get()
+
+            if item is None:
+                self.__eof = True
+                return 0
+
+            if isinstance(item, Exception):
+                self.__eof = True
+                raise item
+
+            self.__chunk = item
+            self.__offset = 0
+
+        count = min(len(buffer), len(self.__chunk) - self.__offset)
+        buffer[:count] = self.__chunk[self.__offset:self.__offset + count]
+        self.__offset += count
+
+        return count
+
+
+    def close(self):
+        if self.closed:
+            return
+
+        self.__stopping.set()
+
+        # unblock the thread, if it is waiting for space...
+        while self.__thread.is_alive():
+            try:
+                self.__queue.get(timeout=0.1)
+
+            except queue.Empty:
+                pass
+
+        self.__codec_file.close()
+
+        super().close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __run(self):
+        try:
+            while not self.__stopping.is_set():
+                chunk = self.__codec_file.read(CompressedFile.CHUNK_SIZE)
+
+                if not chunk:
+                    break
+
+                self.__queue.put(chunk)
+
+            self.__queue.put(None)
+
+        except Exception as ex:
+            self.__queue.put(ex)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CompressedWriter(io.RawIOBase):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, codec_file):
+        """
+        Constructor
+        """
+        super().__init__()
+
+        self.__codec_file = codec_file                                  # binary file, compressing
+        self.__queue = queue.Queue(CompressedFile.QUEUE_SIZE)           # bytes, or None to close
+        self.__pending = bytearray()                                    # collected into chunks
+        self.__exception = None
+
+        self.__thread = threading.Thread(target=self.__run, name="CompressedWriter", daemon=True)
+        self.__thread.start()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def writable(self):
+        return True
+
+
+    def write(self, data):
+        # small writes - a flush for each row - are collected, so that the threads exchange whole chunks...
+        self.__raise_exception()
+        self.__pending += data
+
+        if len(self.__pending) >= CompressedFile.CHUNK_SIZE:
+            self.__queue.put(bytes(self.__pending))
+            del self.__pending[:]
+
+        return len(data)
+
+
+    def close(self):
+        if self.closed:
+            return
+
+        try:
+            if self.__thread.is_alive():
+                if self.__pending:
+                    self.__queue.put(bytes(self.__pending))
+
+                self.__queue.put(None)
+                self.__thread.join()
+
+            self.__raise_exception()
+
+        finally:
+            super().close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __run(self):
+        try:
+            while True:
+                chunk = self.__queue.get()
+
+                if chunk is None:
+                    break
+
+                self.__codec_file.write(chunk)
+
+            self.__codec_file.close()
+
+        except Exception as ex:
+            self.__exception = ex
+
+            # discard, so that the writer is not blocked...
+            while self.__queue.get() is not None:
+                pass
+
+            try:
+                self.__codec_file.close()
+
+            except Exception:
+                pass
+
+
+    def __raise_exception(self):
+        if self.__exception is not None:
+            exception, self.__exception = self.__exception, None
+            raise exception
@@ -0,0 +1,199 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Reads a CSV file (or stdin) in blocks of rows, and converts each block to JSON text in bulk, using a CSVTemplate
+compiled from the header row. Column types are inferred from the leading rows of the first block.
+
+Where a CSVSelection is given, it is applied to each block before conversion, and the template is compiled from the
+selected header. Where a span of byte offsets is given - see CSVRecIndex - only the rows in the span are read.
+"""
+
+import csv
+import sys
+
+from itertools import islice
+
+from scs_mfr.conversion.compressed_file import CompressedFile
+from scs_mfr.conversion.csv_schema import CSVSchema
+from scs_mfr.conversion.csv_selection import CSVSelection
+from scs_mfr.conversion.csv_template import CSVTemplate
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVBlockReader(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_BLOCK_SIZE =        1000                # rows
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_for_file(cls, filename, block_size=DEFAULT_BLOCK_SIZE, paths=None, start=None, end=None, span=None):
+        if span is None:
+            file = sys.stdin if filename is None else CompressedFile.open(filename, "r", newline='')
+            lines = file
+
+        else:
+            file = open(filename, "rb")
+            lines = cls.span_lines(file, *span)
+
+        try:
+            return CSVBlockReader(file, block_size, paths, start, end, lines)
+
+        except (KeyError, ValueError):
+            if filename is not None:
+                file.close()
+
+            raise
+
+
+    @staticmethod
+    def span_lines(file, begin, stop):
+        # the header line, then the lines from byte offset begin, up to stop (or the end of the binary file)...
+        yield file.readline().decode()
+
+        file.seek(max(begin, file.tell()))
+        remaining = None if stop is None else stop - file.tell()
+
+        for line in file:
+            if remaining is not None:
+                if remaining <= 0:
+                    return
+
+                remaining -= len(line)
+
+            yield line.decode()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, file, block_size=DEFAULT_BLOCK_SIZE, paths=None, start=None, end=None, lines=None):
+        """
+        Constructor
+        """
+        self.__file = file                                              # file
+        self.__block_size = block_size                                  # int
+
+        self.__reader = csv.reader(file if lines is None else lines)
+
+        header = next(self.__reader, None)
+
+        self.__header = header                                          # list of string or None for an empty file
+
+        if header is None:
+            self.__selection = None
+            self.__template = None
+            return
+
+        self.__selection = CSVSelection.construct(header, paths, start, end)        # raises ValueError
+        self.__template = CSVTemplate.construct(self.__selection.header(header))    # raises KeyError
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def blocks(self):
+        if self.__template is None:
+            return
+
+        select = None if self.__selection.is_identity() else self.__selection.select
+
+        while True:
+            rows = list(islice(self.__reader, self.__block_size))
+
+            if not rows:
+                return
+
+            if select is not None:
+                rows = select(rows)
+
+                if not rows:
+                    continue
+
+            if self.__template.schema is None:
+                self.__template.apply(CSVSchema.infer(rows, len(self.__template)))
+
+            yield self.__template.jstrs(rows)
+
+
+    def keyed_blocks(self):
+        # blocks of (rec seconds, JSON text) pairs - a row without a valid rec is keyed with the previous row's rec...
+        if self.__template is None:
+            return
+
+        if CSVSelection.REC not in self.__header:
+            raise ValueError("no %s column in: %s" % (CSVSelection.REC, getattr(self.__file, 'name', None)))
+
+        rec_column = self.__header.index(CSVSelection.REC)
+        timestamp = CSVSelection.timestamp
+        key = float('-inf')
+
+        while True:
+            rows = list(islice(self.__reader, self.__block_size))
+
+            if not rows:
+                return
+
+            rows = self.__selection.filter(rows)
+            keys = []
+
+            for row in rows:
+                rec_time = timestamp(row[rec_column]) if len(row) > rec_column else None
+                key = key if rec_time is None else rec_time
+
+                keys.append(key)
+
+            rows = self.__selection.project(rows)
+
+            if not rows:
+                continue
+
+            if self.__template.schema is None:
+                self.__template.apply(CSVSchema.infer(rows, len(self.__template)))
+
+            yield list(zip(keys, self.__template.jstrs(rows)))
+
+
+    def rows(self):
+        for block in self.blocks():
+            for jstr in block:
+                yield jstr
+
+
+    def close(self):
+        if self.__file is not sys.stdin:
+            self.__file.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def header(self):
+        return self.__header
+
+
+    @property
+    def template(self):
+        return self.__template
+
+
+    @property
+    def selection(self):
+        return self.__selection
+
+
+    @property
+    def block_size(self):
+        return self.__block_size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVBlockReader:{file:%s, block_size:%s, selection:%s, template:%s}" % \
+               (self.__file.name, self.block_size, self.selection, self.template)
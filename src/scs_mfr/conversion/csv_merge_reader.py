@@ -0,0 +1,159 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Reads a number of CSV files - such as the rotated logs of csv_logger - as one stream, in rec order, by a k-way heap
+merge. Each file is read in blocks, so memory is bounded by the number of files and the block size, not by the total
+number of rows. Files may have different headers, and may be compressed.
+
+Each file should be in rec order, as csv_logger output is. Rows with equal rec times are taken in the order of the
+files given, and rows whose rec cannot be read are kept in place, after the row before them.
+
+Where a time range is given, each uncompressed file is read from the span given by its CSVRecIndex.
+
+A directory is expanded to the CSV files beneath it (*.csv, *.csv.gz, *.csv.xz, *.csv.zst), in name order.
+"""
+
+import os
+
+from heapq import merge
+
+from scs_mfr.conversion.compressed_file import CompressedFile
+from scs_mfr.conversion.csv_block_reader import CSVBlockReader
+from scs_mfr.conversion.csv_rec_index import CSVRecIndex
+from scs_mfr.conversion.csv_selection import CSVSelection
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVMergeReader(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def is_csv_file(filename):
+        stem = filename if CompressedFile.codec(filename) is None else os.path.splitext(filename)[0]
+
+        return stem.lower().endswith('.csv')
+
+
+    @classmethod
+    def expand(cls, paths):
+        # files, in the order given, with each directory expanded...
+        filenames = []
+
+        for path in paths:
+            if not os.path.isdir(path):
+                filenames.append(path)
+                continue
+
+            found = []
+
+            for directory, _, names in os.walk(path):
+                found.extend(os.path.join(directory, name) for name in names if cls.is_csv_file(name))
+
+            filenames.extend(sorted(found))
+
+        return filenames
+
+
+    @classmethod
+    def construct_for_files(cls, paths, block_size=CSVBlockReader.DEFAULT_BLOCK_SIZE, columns=None, start=None,
+                            end=None):
+        readers = []
+
+        try:
+            for filename in cls.expand(paths):
+                span = None
+
+                if (start is not None or end is not None) and CompressedFile.codec(filename) is None:
+                    index = CSVRecIndex.construct_for_file(filename)
+
+                    if index is not None:
+                        span = index.span(None if start is None else CSVSelection.timestamp(start),
+                                          None if end is None else CSVSelection.timestamp(end))
+
+                reader = CSVBlockReader.construct_for_file(filename, block_size, columns, start, end, span)
+                readers.append(reader)
+
+                if reader.header is not None and CSVSelection.REC not in reader.header:
+                    raise ValueError("no %s column in: %s" % (CSVSelection.REC, filename))
+
+        except (OSError, KeyError, ValueError):
+            for reader in readers:
+                reader.close()
+
+            raise
+
+        return CSVMergeReader(readers, block_size)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, readers, block_size=CSVBlockReader.DEFAULT_BLOCK_SIZE):
+        """
+        Constructor
+        """
+        self.__readers = readers                                        # list of CSVBlockReader
+        self.__block_size = block_size                                  # int rows
+
+
+    def __len__(self):
+        return len(self.__readers)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def blocks(self):
+        block = []
+
+        for _, _, _, jstr in merge(*[self.__keyed_rows(i, reader) for i, reader in enumerate(self.__readers)]):
+            block.append(jstr)
+
+            if len(block) >= self.__block_size:
+                yield block
+                block = []
+
+        if block:
+            yield block
+
+
+    def rows(self):
+        for block in self.blocks():
+            for jstr in block:
+                yield jstr
+
+
+    def close(self):
+        for reader in self.__readers:
+            reader.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __keyed_rows(file_index, reader):
+        # the file index and row sequence number keep the merge stable...
+        sequence = 0
+
+        for keyed_block in reader.keyed_blocks():
+            for key, jstr in keyed_block:
+                yield key, file_index, sequence, jstr
+                sequence += 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def readers(self):
+        return self.__readers
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVMergeReader:{files:%s, block_size:%s}" % (len(self), self.__block_size)
@@ -0,0 +1,193 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Reads a CSV file by memory-mapping it, splitting the body into row-aligned chunks, and converting the chunks in a pool
+of processes. Converted blocks are yielded in the original order. Where a separator is given, each block is joined in
+its worker process, and yielded as a single run of documents - this reduces the cost of returning the block.
+
+Where columns or a time range are given, a CSVSelection is applied in each worker process, before conversion. Where a
+span of byte offsets is given - see CSVRecIndex - only the rows in the span are converted.
+
+Rows are aligned on newline characters, so cells must not contain quoted newlines - csv_logger output never does.
+"""
+
+import csv
+import io
+import mmap
+import os
+
+from multiprocessing import Pool
+
+from scs_mfr.conversion.csv_schema import CSVSchema
+from scs_mfr.conversion.csv_selection import CSVSelection
+from scs_mfr.conversion.csv_template import CSVTemplate
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVParallelReader(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_CHUNK_SIZE =        1 << 22             # bytes
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def convert_chunk(task):
+        # runs in a worker process...
+        filename, header, chunk_start, chunk_end, separator, paths, start, end = task
+
+        with open(filename, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                text = mapped[chunk_start:chunk_end].decode()
+
+        rows = list(csv.reader(io.StringIO(text, newline='')))
+
+        selection = CSVSelection.construct(header, paths, start, end)
+
+        if not selection.is_identity():
+            rows = selection.select(rows)
+
+        template = CSVTemplate.construct(selection.header(header))
+        template.apply(CSVSchema.infer(rows, len(template)))
+
+        jstrs = template.jstrs(rows)
+
+        return jstrs if separator is None or not jstrs else [separator.join(jstrs)]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_for_file(cls, filename, processes=None, chunk_size=DEFAULT_CHUNK_SIZE, separator=None,
+                           paths=None, start=None, end=None, span=None):
+        return CSVParallelReader(filename, processes, chunk_size, separator, paths, start, end, span)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename, processes=None, chunk_size=DEFAULT_CHUNK_SIZE, separator=None,
+                 paths=None, start=None, end=None, span=None):
+        """
+        Constructor
+        """
+        self.__filename = filename                                      # string
+        self.__processes = os.cpu_count() if processes is None else processes   # int
+        self.__chunk_size = chunk_size                                  # int
+        self.__separator = separator                                    # string or None
+
+        self.__paths = paths                                            # list of string or None for all columns
+        self.__start = start                                            # string ISO 8601 or None
+        self.__end = end                                                # string ISO 8601 or None
+        self.__span = span                                              # (int begin, int or None stop) or None
+
+        self.__pool = None
+
+        self.__size = os.path.getsize(filename)                         # raises FileNotFoundError
+        self.__header = None
+        self.__body_start = None
+
+        if self.__size == 0:
+            self.__selection = None
+            self.__template = None
+            return
+
+        with open(filename, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                header_end = mapped.find(b'\n')
+                self.__body_start = self.__size if header_end < 0 else header_end + 1
+
+                header_line = mapped[:self.__body_start].decode()
+
+        self.__header = next(csv.reader(io.StringIO(header_line, newline='')), [])
+        self.__selection = CSVSelection.construct(self.__header, paths, start, end)     # raises ValueError
+        self.__template = CSVTemplate.construct(self.__selection.header(self.__header))  # raises KeyError
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def blocks(self):
+        if self.__template is None:
+            return
+
+        tasks = [(self.__filename, self.__header, chunk_start, chunk_end, self.__separator,
+                  self.__paths, self.__start, self.__end) for chunk_start, chunk_end in self.chunks()]
+
+        if not tasks:
+            return
+
+        self.__pool = Pool(min(self.__processes, len(tasks)))
+
+        for block in self.__pool.imap(self.convert_chunk, tasks):
+            yield block
+
+        self.__pool.close()
+        self.__pool.join()
+        self.__pool = None
+
+
+    def chunks(self):
+        # (start, end) byte offsets of the row-aligned chunks in the body of the file...
+        if self.__body_start is None or self.__body_start >= self.__size:
+            return []
+
+        if self.__span is None:
+            start, limit = self.__body_start, self.__size
+
+        else:
+            begin, stop = self.__span
+            start, limit = max(begin, self.__body_start), self.__size if stop is None else min(stop, self.__size)
+
+        chunks = []
+
+        with open(self.__filename, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                while start < limit:
+                    boundary = mapped.find(b'\n', min(start + self.__chunk_size, limit) - 1)
+                    end = self.__size if boundary < 0 else boundary + 1
+
+                    chunks.append((start, end))
+                    start = end
+
+        return chunks
+
+
+    def close(self):
+        if self.__pool is not None:
+            self.__pool.terminate()
+            self.__pool.join()
+            self.__pool = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def template(self):
+        return self.__template
+
+
+    @property
+    def selection(self):
+        return self.__selection
+
+
+    @property
+    def processes(self):
+        return self.__processes
+
+
+    @property
+    def chunk_size(self):
+        return self.__chunk_size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVParallelReader:{filename:%s, size:%s, processes:%s, chunk_size:%s, selection:%s, template:%s}" % \
+               (self.__filename, self.__size, self.processes, self.chunk_size, self.selection, self.template)
@@ -0,0 +1,266 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A sparse index of a CSV log, giving the byte offset of a row at roughly every interval bytes, keyed by the row's rec
+time. The index is cached in a sidecar file, alongside the log, and is used to find the span of the log that holds a
+time range, without reading the rows before it.
+
+The cached index is checked against the size and modification time of the log, and against a checksum of its first
+block. Where the log has only grown, the index is extended from its last entry - otherwise it is rebuilt.
+
+rec is assumed to increase through the log, as it does for csv_logger output. Where the sampled rec times do not
+increase, the index reports no span, and the whole log should be read. As for parallel conversion, rows are found by
+newline characters, so cells must not contain quoted newlines.
+
+example sidecar (gases.csv.idx):
+{"size": 104857600, "mtime": 1523289600.0, "head": 2734191733, "rec-column": 1, "interval": 1048576,
+"increasing": true, "entries": [[1522850400.394, 151], [1522851022.641, 1048682], ...]}
+"""
+
+import csv
+import json
+import mmap
+import os
+import zlib
+
+from bisect import bisect_left
+
+from scs_mfr.conversion.csv_selection import CSVSelection
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVRecIndex(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_INTERVAL =          1 << 20             # bytes
+
+    __SUFFIX =                  '.idx'
+    __HEAD_SIZE =               1 << 12             # bytes
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def sidecar(cls, filename):
+        return filename + cls.__SUFFIX
+
+
+    @classmethod
+    def construct_for_file(cls, filename, interval=DEFAULT_INTERVAL):
+        # the cached index, extended or rebuilt as required - returns None if the log has no rec column...
+        stat = os.stat(filename)                                        # raises FileNotFoundError
+
+        if stat.st_size == 0:
+            return None
+
+        with open(filename, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                head = zlib.crc32(mapped[:cls.__HEAD_SIZE])
+
+                index = cls.__load(filename)
+
+                if index is not None and index.size == stat.st_size and index.mtime == stat.st_mtime and \
+                        index.head == head:
+                    return index                                        # current
+
+                if index is not None and index.size < stat.st_size and index.head == head and \
+                        index.interval == interval:
+                    index.__extend(mapped, stat)                         # the log has grown
+
+                else:
+                    index = cls.__build(mapped, stat, head, interval)
+
+        if index is None:
+            return None
+
+        index.__save(filename)
+
+        return index
+
+
+    @classmethod
+    def __load(cls, filename):
+        try:
+            with open(cls.sidecar(filename)) as file:
+                jdict = json.load(file)
+
+            return CSVRecIndex(jdict['size'], jdict['mtime'], jdict['head'], jdict['rec-column'],
+                               jdict['interval'], jdict['increasing'], [tuple(entry) for entry in jdict['entries']])
+
+        except (OSError, ValueError, KeyError, TypeError):
+            return None                                                 # absent or unreadable - rebuild
+
+
+    @classmethod
+    def __build(cls, mapped, stat, head, interval):
+        header_end = mapped.find(b'\n')
+
+        if header_end < 0:
+            return None
+
+        header = next(csv.reader([mapped[:header_end].decode()]), [])
+
+        if CSVSelection.REC not in header:
+            return None
+
+        index = CSVRecIndex(0, None, head, header.index(CSVSelection.REC), interval, True, [])
+        index.__scan(mapped, header_end + 1, stat)
+
+        return index
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, size, mtime, head, rec_column, interval, increasing, entries):
+        """
+        Constructor
+        """
+        self.__size = size                                              # int bytes
+        self.__mtime = mtime                                            # float seconds
+        self.__head = head                                              # int CRC-32 of the first block
+        self.__rec_column = rec_column                                  # int
+        self.__interval = interval                                      # int bytes
+        self.__increasing = increasing                                  # bool
+        self.__entries = entries                                        # list of (float rec seconds, int offset)
+
+
+    def __len__(self):
+        return len(self.__entries)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def span(self, start_time=None, end_time=None):
+        # (begin, stop) byte offsets holding every row in the range - stop is None for the end of the log...
+        if not self.__increasing or not self.__entries:
+            return None
+
+        times = [entry[0] for entry in self.__entries]
+
+        # rows before the last entry earlier than start are all earlier than start...
+        if start_time is None:
+            begin = self.__entries[0][1]
+
+        else:
+            i = bisect_left(times, start_time)
+            begin = self.__entries[max(i - 1, 0)][1]
+
+        # rows from the first entry at or after end are all at or after end...
+        if end_time is None:
+            stop = None
+
+        else:
+            i = bisect_left(times, end_time)
+            stop = self.__entries[i][1] if i < len(self.__entries) else None
+
+        return begin, stop
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __extend(self, mapped, stat):
+        if not self.__entries:
+            self.__scan(mapped, mapped.find(b'\n') + 1, stat)
+            return
+
+        # re-scan from the last entry, whose row may have been incomplete...
+        _, offset = self.__entries.pop()
+        self.__scan(mapped, offset, stat)
+
+
+    def __scan(self, mapped, offset, stat):
+        size = len(mapped)
+
+        while offset < size:
+            row_end = mapped.find(b'\n', offset)
+
+            if row_end < 0:
+                break                                                   # the last row may still be being written
+
+            row = next(csv.reader([mapped[offset:row_end].decode()]), [])
+            rec_time = CSVSelection.timestamp(row[self.__rec_column]) if len(row) > self.__rec_column else None
+
+            if rec_time is not None:
+                if self.__entries and rec_time < self.__entries[-1][0]:
+                    self.__increasing = False
+
+                self.__entries.append((rec_time, offset))
+                boundary = offset + self.__interval
+
+            else:
+                boundary = row_end + 1                                  # try the next row
+
+            if boundary >= size:
+                break
+
+            # the start of the first row after the boundary...
+            offset = mapped.find(b'\n', boundary - 1) + 1
+
+            if offset == 0:
+                break
+
+        self.__size = stat.st_size
+        self.__mtime = stat.st_mtime
+
+
+    def __save(self, filename):
+        jdict = {
+            'size': self.__size,
+            'mtime': self.__mtime,
+            'head': self.__head,
+            'rec-column': self.__rec_column,
+            'interval': self.__interval,
+            'increasing': self.__increasing,
+            'entries': self.__entries
+        }
+
+        sidecar = self.sidecar(filename)
+        tmp = sidecar + '.tmp'
+
+        try:
+            with open(tmp, "w") as file:
+                json.dump(jdict, file)
+
+            os.rename(tmp, sidecar)
+
+        except OSError:
+            pass                                                        # for example, a read-only directory
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def size(self):
+        return self.__size
+
+
+    @property
+    def mtime(self):
+        return self.__mtime
+
+
+    @property
+    def head(self):
+        return self.__head
+
+
+    @property
+    def interval(self):
+        return self.__interval
+
+
+    @property
+    def increasing(self):
+        return self.__increasing
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVRecIndex:{size:%s, mtime:%s, rec_column:%s, interval:%s, increasing:%s, entries:%s}" % \
+               (self.size, self.mtime, self.__rec_column, self.interval, self.increasing, len(self))
@@ -0,0 +1,147 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Column types, inferred from a sample of leading rows, each with a fast-path encoder. A fast path accepts only the cells
+that it can encode without trial parsing - any other cell is passed to the general CSVTemplate.encode(..), so the
+output is always the same as that of the general path.
+
+example:
+CSVSchema:{types:['string', 'string', 'float', 'float']}
+"""
+
+from json.encoder import encode_basestring_ascii
+
+from scs_mfr.conversion.csv_template import CSVTemplate
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVSchema(object):
+    """
+    classdocs
+    """
+
+    SAMPLE_SIZE =           100                     # rows
+
+    INT =                   'int'
+    FLOAT =                 'float'
+    STRING =                'string'
+    MIXED =                 'mixed'
+
+    __FLOAT_CONSTANTS = {'nan': 'NaN', 'inf': 'Infinity', '-inf': '-Infinity'}
+
+    # cells that begin with one of these cannot be parsed by int(..) or float(..)...
+    __TEXT_INITIALS = frozenset('ABCDEFGHJKLMOPQRSTUVWXYZabcdefghjklmopqrstuvwxyz"#$%&\'()*,/;<=>?@[\\]^`{|}~')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def infer(cls, rows, width):
+        types = []
+
+        sample = rows[:cls.SAMPLE_SIZE]
+
+        for column in range(width):
+            found = set()
+
+            for row in sample:
+                if column >= len(row) or len(row[column]) == 0:
+                    continue
+
+                value = CSVTemplate.cast(row[column])
+                found.add(cls.STRING if isinstance(value, str) else cls.FLOAT if isinstance(value, float) else cls.INT)
+
+            if found == {cls.INT, cls.FLOAT}:
+                types.append(cls.FLOAT)
+
+            elif len(found) == 1:
+                types.append(found.pop())
+
+            else:
+                types.append(cls.MIXED)                                 # includes columns that are always empty
+
+        return CSVSchema(types)
+
+
+    @classmethod
+    def general(cls, width):
+        return CSVSchema([cls.MIXED] * width)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def encode_float(cls, cell):
+        # int(..) rejects any cell containing one of these, so the general path would also parse it as a float...
+        if '.' in cell or 'e' in cell or 'E' in cell:
+            try:
+                text = float.__repr__(float(cell))
+                return cls.__FLOAT_CONSTANTS.get(text, text)
+
+            except ValueError:
+                pass
+
+        return CSVTemplate.encode(cell)
+
+
+    @classmethod
+    def encode_int(cls, cell):
+        if len(cell) == 0:
+            return 'null'
+
+        try:
+            return str(int(cell))
+
+        except ValueError:
+            return CSVTemplate.encode(cell)
+
+
+    @classmethod
+    def encode_string(cls, cell):
+        if ':' in cell or (len(cell) > 0 and cell[0] in cls.__TEXT_INITIALS):
+            return encode_basestring_ascii(cell)
+
+        return CSVTemplate.encode(cell)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, types):
+        """
+        Constructor
+        """
+        self.__types = types                                            # list of string
+
+        encoders = {
+            self.INT: self.encode_int,
+            self.FLOAT: self.encode_float,
+            self.STRING: self.encode_string,
+            self.MIXED: CSVTemplate.encode
+        }
+
+        self.__encoders = [encoders[column_type] for column_type in types]
+
+
+    def __len__(self):
+        return len(self.__types)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def types(self):
+        return self.__types
+
+
+    @property
+    def encoders(self):
+        return self.__encoders
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVSchema:{types:%s}" % self.types
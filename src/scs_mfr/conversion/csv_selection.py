@@ -0,0 +1,226 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A selection of columns and rows, applied to CSV rows before any cell is cast or encoded - cells that are not selected
+are never parsed, and documents are built only for the rows that are selected.
+
+Columns are selected by header path: a path selects the column of that name, and any columns beneath it - val.NO2
+selects val.NO2.weV, val.NO2.aeV and so on. Selected columns keep their order in the header.
+
+Rows are selected by a time range over the rec column: start is inclusive, end is exclusive. Times are ISO 8601, and
+times without a UTC offset are taken as UTC. Rows whose rec cell cannot be read as a time are not selected.
+
+example:
+CSVSelection:{paths:['rec', 'val.NO2.cnc'], start:2018-04-04T14:00:00Z, end:None, columns:[1, 14]}
+"""
+
+import calendar
+import re
+
+from operator import itemgetter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVSelection(object):
+    """
+    classdocs
+    """
+
+    REC = 'rec'
+
+    __ISO_8601 = re.compile(r'(\d{4})-(\d\d)-(\d\d)[T ](\d\d):(\d\d)(?::(\d\d)(\.\d+)?)?(Z|[+-]\d\d(?::?\d\d)?)?$')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, header, paths=None, start=None, end=None):
+        # raises ValueError for a path that selects no column, or a time range without a rec column
+        if paths is None:
+            columns = None
+
+        else:
+            columns = [column for column, cell in enumerate(header) if cls.__selects(paths, cell)]
+
+            for path in paths:
+                if not any(cls.__selects((path, ), cell) for cell in header):
+                    raise ValueError("no column is selected by: %s" % path)
+
+        if start is None and end is None:
+            rec_column = None
+
+        elif cls.REC in header:
+            rec_column = header.index(cls.REC)
+
+        else:
+            raise ValueError("a time range requires a %s column" % cls.REC)
+
+        return CSVSelection(paths, start, end, columns, rec_column)
+
+
+    @classmethod
+    def timestamp(cls, text):
+        # seconds since the epoch, or None if the text is not an ISO 8601 datetime...
+        match = None if text is None else cls.__ISO_8601.match(text)
+
+        if match is None:
+            return None
+
+        year, month, day, hour, minute, second, fraction, offset = match.groups()
+
+        try:
+            seconds = calendar.timegm((int(year), int(month), int(day), int(hour), int(minute),
+                                       0 if second is None else int(second)))
+
+        except ValueError:
+            return None
+
+        if fraction is not None:
+            seconds += float(fraction)
+
+        if offset is not None and offset != 'Z':
+            digits = offset[1:].replace(':', '')
+            offset_seconds = int(digits[:2]) * 3600 + (int(digits[2:]) * 60 if len(digits) > 2 else 0)
+
+            seconds += -offset_seconds if offset[0] == '+' else offset_seconds
+
+        return seconds
+
+
+    @classmethod
+    def __selects(cls, paths, cell):
+        for path in paths:
+            if cell == path or cell.startswith(path + '.') or cell.startswith(path + ':'):
+                return True
+
+        return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, paths, start, end, columns, rec_column):
+        """
+        Constructor
+        """
+        self.__paths = paths                                            # list of string or None for all columns
+        self.__start = start                                            # string ISO 8601 or None
+        self.__end = end                                                # string ISO 8601 or None
+
+        self.__columns = columns                                        # list of int or None for all columns
+        self.__rec_column = rec_column                                  # int or None for all rows
+
+        self.__start_time = None if start is None else self.timestamp(start)
+        self.__end_time = None if end is None else self.timestamp(end)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_identity(self):
+        return self.__columns is None and self.__rec_column is None
+
+
+    def header(self, header):
+        if self.__columns is None:
+            return header
+
+        return [header[column] for column in self.__columns]
+
+
+    def select(self, rows):
+        # CSV rows, as lists of cells...
+        return self.project(self.filter(rows))
+
+
+    def filter(self, rows):
+        if self.__rec_column is None:
+            return rows
+
+        rec_column = self.__rec_column
+        includes = self.includes
+
+        return [row for row in rows if len(row) > rec_column and includes(row[rec_column])]
+
+
+    def project(self, rows):
+        if self.__columns is None:
+            return rows
+
+        columns = self.__columns
+        last = columns[-1]
+
+        if len(columns) == 1:
+            return [[row[last]] if len(row) > last else [] for row in rows]
+
+        project = itemgetter(*columns)
+
+        # a short row keeps only the selected cells that it has...
+        return [list(project(row)) if len(row) > last else [row[column] for column in columns if column < len(row)]
+                for row in rows]
+
+
+    def select_columns(self, columns, *others):
+        # whole columns, as lists of values - other lists of columns (such as encodings) are selected in step...
+        if self.__rec_column is not None:
+            includes = self.includes
+            keep = [includes(rec) for rec in columns[self.__rec_column]]
+
+            if not all(keep):
+                columns = [[value for value, kept in zip(column, keep) if kept] for column in columns]
+                others = [[[value for value, kept in zip(column, keep) if kept] for column in other]
+                          for other in others]
+
+        if self.__columns is not None:
+            columns = [columns[column] for column in self.__columns]
+            others = [[other[column] for column in self.__columns] for other in others]
+
+        return (columns, ) + tuple(others)
+
+
+    def includes(self, rec):
+        if self.__start_time is None and self.__end_time is None:
+            return True
+
+        seconds = self.timestamp(rec)
+
+        if seconds is None:
+            return False
+
+        if self.__start_time is not None and seconds < self.__start_time:
+            return False
+
+        if self.__end_time is not None and seconds >= self.__end_time:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def paths(self):
+        return self.__paths
+
+
+    @property
+    def start(self):
+        return self.__start
+
+
+    @property
+    def end(self):
+        return self.__end
+
+
+    @property
+    def columns(self):
+        return self.__columns
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVSelection:{paths:%s, start:%s, end:%s, columns:%s}" % \
+               (self.paths, self.start, self.end, self.columns)
@@ -0,0 +1,185 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Writes a stream of JSON documents to a CSV file (or stdout), using a JSONFlattener compiled from the first document -
+or, when appending to an existing file, from that file's header row.
+
+Where a flush interval is given, rows are held in memory and written with a single write() once the buffer is full,
+or by a timer, at most one interval after the first row was held - so rows are not held longer while the input is
+idle. Rows still held are written when the writer is closed. An error raised by the timer's write is raised again by
+the next write_document(..) or close().
+"""
+
+import csv
+import io
+import os
+import sys
+import threading
+
+from scs_mfr.conversion.compressed_file import CompressedFile
+from scs_mfr.conversion.json_codec import JSONCodec
+from scs_mfr.conversion.json_flattener import JSONFlattener
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVStreamWriter(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_MAX_BUFFER =        1 << 16             # characters
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def existing_header(filename):
+        if filename is None or not os.path.isfile(filename):
+            return None
+
+        with CompressedFile.open(filename, "r", newline='') as file:
+            return next(csv.reader(file), None)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename=None, append=False, interval=0, max_buffer=DEFAULT_MAX_BUFFER):
+        """
+        Constructor
+        """
+        self.__filename = filename                                      # string or None for stdout
+        self.__append = append                                          # bool
+        self.__interval = interval                                      # float seconds, 0 for every row
+        self.__max_buffer = max_buffer                                  # int characters
+
+        header = self.existing_header(filename) if append else None
+        self.__flattener = None if header is None else JSONFlattener.construct_from_header(header)
+        self.__codec = JSONCodec.default()
+
+        if filename is None:
+            self.__file = sys.stdout
+
+        else:
+            self.__file = CompressedFile.open(filename, "a" if append else "w", newline='')
+
+        self.__buffer = io.StringIO()
+        self.__writer = csv.writer(self.__buffer)
+
+        self.__lock = threading.RLock()
+        self.__timer = None                                             # threading.Timer while rows are held
+        self.__timer_error = None                                       # Exception raised by the timer's flush
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, jstr):
+        if not jstr:
+            return
+
+        # only the first document's field order is significant...
+        self.write_document(self.__codec.loads(jstr, ordered=self.__flattener is None))
+
+
+    def write_document(self, document):
+        with self.__lock:
+            self.__raise_timer_error()
+
+            if self.__flattener is None:
+                self.__flattener = JSONFlattener.construct_from_document(document)
+                self.__writer.writerow(self.__flattener.header)
+
+            self.__writer.writerow(self.__flattener.row(document))
+
+            if self.__interval <= 0 or self.__buffer.tell() >= self.__max_buffer:
+                self.flush()
+
+            elif self.__timer is None:
+                self.__timer = threading.Timer(self.__interval, self.__flush_held)
+                self.__timer.daemon = True
+                self.__timer.start()
+
+
+    def flush(self):
+        with self.__lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+
+            text = self.__buffer.getvalue()
+
+            if text:
+                self.__file.write(text)
+
+                self.__buffer.seek(0)
+                self.__buffer.truncate()
+
+            self.__file.flush()
+
+
+    def close(self):
+        try:
+            self.flush()
+            self.__raise_timer_error()
+
+        finally:
+            if self.__file is not sys.stdout:
+                self.__file.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __flush_held(self):
+        # runs on the timer thread - a timer that was cancelled while waiting for the lock finds no rows held...
+        with self.__lock:
+            if self.__timer is None:
+                return
+
+            try:
+                self.flush()
+
+            except Exception as ex:
+                self.__timer_error = ex
+
+
+    def __raise_timer_error(self):
+        if self.__timer_error is not None:
+            error = self.__timer_error
+            self.__timer_error = None
+
+            raise error
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def append(self):
+        return self.__append
+
+
+    @property
+    def interval(self):
+        return self.__interval
+
+
+    @property
+    def max_buffer(self):
+        return self.__max_buffer
+
+
+    @property
+    def flattener(self):
+        return self.__flattener
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVStreamWriter:{filename:%s, append:%s, interval:%s, max_buffer:%s, flattener:%s}" % \
+               (self.filename, self.append, self.interval, self.max_buffer, self.flattener)
@@ -0,0 +1,332 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A CSV header, compiled once into a JSON text template. Each header cell is a path into the JSON document: dictionary
+fields are separated from their container by a period ('.') character, and array members are separated from their
+container by a colon (':') character.
+
+Where the header describes a regular document - no duplicate or conflicting paths, and array indices that run from
+zero without gaps - each complete row is converted by filling the template with the encoded cells, without building
+the document. Short rows, and irregular headers, take the general path: the document is built as a tree and
+serialised. Both paths give the same text as json.dumps(..) with default settings.
+
+example header:
+tag,rec,val.hmd,val.tmp,val.bin:0,val.bin:1
+"""
+
+from collections import OrderedDict
+from json.encoder import encode_basestring_ascii
+
+from scs_mfr.conversion.json_codec import JSONCodec
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVTemplate(object):
+    """
+    classdocs
+    """
+
+    __INDEX = 'index'
+    __KEY = 'key'
+
+    __FLOAT_CONSTANTS = {'nan': 'NaN', 'inf': 'Infinity', '-inf': '-Infinity'}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, header):
+        paths = []
+
+        for cell in header:
+            if len(cell) == 0:
+                raise KeyError(','.join(header))
+
+            paths.append(cls.parse_path(cell))
+
+        return CSVTemplate(header, paths)
+
+
+    @classmethod
+    def parse_path(cls, path):
+        steps = []
+
+        for field in path.split('.'):
+            pieces = field.split(':')
+
+            # a field such as "a:b" is a key, not an array member...
+            if len(pieces) > 1 and all(piece.isdigit() for piece in pieces[1:]):
+                steps.append((cls.__KEY, pieces[0]))
+                steps.extend((cls.__INDEX, int(piece)) for piece in pieces[1:])
+
+            else:
+                steps.append((cls.__KEY, field))
+
+        return tuple(steps)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def cast(cls, cell):
+        if len(cell) == 0:
+            return None
+
+        try:
+            return int(cell)
+        except ValueError:
+            pass
+
+        try:
+            return float(cell)
+        except ValueError:
+            pass
+
+        return cell
+
+
+    @classmethod
+    def encode(cls, cell):
+        # equivalent to json.dumps(cls.cast(cell))...
+        if len(cell) == 0:
+            return 'null'
+
+        try:
+            return str(int(cell))
+        except ValueError:
+            pass
+
+        try:
+            value = float(cell)
+            text = float.__repr__(value)
+
+            return cls.__FLOAT_CONSTANTS.get(text, text)
+
+        except ValueError:
+            pass
+
+        return encode_basestring_ascii(cell)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, header, paths):
+        """
+        Constructor
+        """
+        self.__header = header                                          # list of string
+        self.__paths = paths                                            # list of tuple of (kind, key or index)
+
+        self.__format = None                                            # string with one %s per column
+        self.__order = None                                             # list of int column index
+
+        self.__schema = None                                            # CSVSchema
+        self.__cells = None                                             # list of (int column index, encoder)
+
+        self.__compile()
+
+
+    def __len__(self):
+        return len(self.__header)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_regular(self):
+        return self.__format is not None
+
+
+    def apply(self, schema):
+        # per-column fast-path encoders, in template order...
+        self.__schema = schema
+
+        if self.__format is not None:
+            self.__cells = [(i, schema.encoders[i]) for i in self.__order]
+
+
+    def jstr(self, row):
+        if self.__format is None or len(row) < len(self.__header):
+            return JSONCodec.default().dumps(self.node(row))
+
+        if self.__cells is not None:
+            return self.__format % tuple(encode(row[i]) for i, encode in self.__cells)
+
+        encode = self.encode
+
+        return self.__format % tuple(encode(row[i]) for i in self.__order)
+
+
+    def jstrs(self, rows):
+        # bulk conversion of a block of rows...
+        if self.__format is None:
+            return [self.jstr(row) for row in rows]
+
+        form = self.__format
+        width = len(self.__header)
+        jstr = self.jstr
+
+        if self.__cells is not None:
+            cells = self.__cells
+
+            return [form % tuple(encode(row[i]) for i, encode in cells) if len(row) >= width else jstr(row)
+                    for row in rows]
+
+        order = self.__order
+        encode = self.encode
+
+        return [form % tuple(encode(row[i]) for i in order) if len(row) >= width else jstr(row) for row in rows]
+
+
+    def node(self, row):
+        # the general path - cells beyond the end of the row are not included...
+        return self.document(self.cast(cell) for cell in row)
+
+
+    def document(self, values):
+        # a document from values that have already been typed...
+        root = OrderedDict()
+
+        for path, value in zip(self.__paths, values):
+            self.__insert(root, path, value)
+
+        return root
+
+
+    def compose(self, encoded_rows):
+        # rows of cells that have already been encoded as JSON text, for a regular template only...
+        if self.__format is None:
+            raise ValueError("compose: the template is not regular")
+
+        form = self.__format
+        order = self.__order
+
+        if order == list(range(len(order))):
+            return [form % tuple(encoded) for encoded in encoded_rows]
+
+        return [form % tuple(encoded[i] for i in order) for encoded in encoded_rows]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __compile(self):
+        root = OrderedDict()
+
+        for column, path in enumerate(self.__paths):
+            if not self.__insert(root, path, column, strict=True):
+                return                                                  # irregular - general path only
+
+        order = []
+        form = self.__emit(root, order)
+
+        if form is None:
+            return
+
+        self.__format = form
+        self.__order = order
+
+
+    @classmethod
+    def __insert(cls, root, path, value, strict=False):
+        container = root
+
+        for depth, (kind, step) in enumerate(path):
+            last = depth == len(path) - 1
+            next_kind = None if last else path[depth + 1][0]
+
+            if kind == cls.__INDEX:
+                if not isinstance(container, list):
+                    return False
+
+                while len(container) <= step:
+                    container.append(None)
+
+            elif not isinstance(container, dict):
+                return False
+
+            if last:
+                if strict and cls.__occupied(container, kind, step):
+                    return False                                        # duplicate path
+
+                container[step] = value
+                return True
+
+            child = container[step] if cls.__occupied(container, kind, step) else None
+
+            if child is None:
+                child = [] if next_kind == cls.__INDEX else OrderedDict()
+                container[step] = child
+
+            elif not isinstance(child, (list, dict)):
+                if strict:
+                    return False                                        # a leaf is also a container
+
+                child = [] if next_kind == cls.__INDEX else OrderedDict()
+                container[step] = child
+
+            container = child
+
+        return True
+
+
+    @classmethod
+    def __occupied(cls, container, kind, step):
+        if kind == cls.__INDEX:
+            return step < len(container) and container[step] is not None
+
+        return step in container
+
+
+    @classmethod
+    def __emit(cls, node, order):
+        if isinstance(node, int):
+            order.append(node)
+            return '%s'
+
+        if isinstance(node, list):
+            items = []
+
+            for child in node:
+                if child is None:
+                    return None                                         # gap in array indices
+
+                item = cls.__emit(child, order)
+
+                if item is None:
+                    return None
+
+                items.append(item)
+
+            return '[' + ', '.join(items) + ']'
+
+        fields = []
+
+        for key, child in node.items():
+            item = cls.__emit(child, order)
+
+            if item is None:
+                return None
+
+            fields.append(encode_basestring_ascii(key).replace('%', '%%') + ': ' + item)
+
+        return '{' + ', '.join(fields) + '}'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def header(self):
+        return self.__header
+
+
+    @property
+    def schema(self):
+        return self.__schema
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVTemplate:{header:%s, regular:%s, schema:%s}" % (self.header, self.is_regular(), self.schema)
@@ -0,0 +1,186 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Reads a top-level JSON array from a text stream incrementally, yielding one decoded element at a time. The stream is
+read in chunks, and text is discarded once its elements have been yielded, so memory use is bounded by the chunk size
+and the size of the largest element - not by the size of the array.
+
+Only the first element is decoded with ordered fields - as for CSVStreamWriter, only the first document's field order
+is significant.
+
+example input:
+[{"tag": "scs-ap1-6", "rec": "2018-04-04T14:50:27.641+00:00", "val": {"hmd": 59.6, "tmp": 23.8}},
+{"tag": "scs-ap1-6", "rec": "2018-04-04T14:50:38.394+00:00", "val": {"hmd": 59.7, "tmp": 23.8}}]
+"""
+
+import json
+import re
+
+from collections import OrderedDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class JSONArrayReader(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_CHUNK_SIZE =        1 << 16             # characters
+
+    __WHITESPACE =              re.compile(r'[ \t\n\r]*')
+    __NUMBER_TAIL =             re.compile(r'[0-9.eE+\-]*')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def is_array(stream):
+        # peeks at the binary buffer of a text stream, without consuming any input...
+        try:
+            return stream.buffer.peek(1 << 12).lstrip().startswith(b'[')
+
+        except (AttributeError, ValueError):
+            return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, stream, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Constructor
+        """
+        self.__stream = stream                                          # text stream
+        self.__chunk_size = chunk_size                                  # int characters
+
+        self.__ordered_decoder = json.JSONDecoder(object_pairs_hook=OrderedDict)
+        self.__decoder = json.JSONDecoder()
+
+        self.__buffer = ''
+        self.__eof = False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def elements(self):
+        decoder = self.__ordered_decoder
+        pos = self.__expect(0, '[')
+
+        pos = self.__skip(pos)
+
+        if self.__buffer[pos] == ']':
+            self.__expect_end(pos + 1)
+            return
+
+        want = self.__chunk_size
+
+        while True:
+            # element...
+            try:
+                element, end = decoder.raw_decode(self.__buffer, pos)
+                complete = self.__eof or not self.__is_number(element) or \
+                    self.__NUMBER_TAIL.match(self.__buffer, end).end() < len(self.__buffer)
+
+            except ValueError:
+                if self.__eof:
+                    raise
+
+                complete = False
+
+            if not complete:
+                # read ahead, doubling the request so that a large element is not re-parsed once per chunk...
+                self.__read(want)
+                want *= 2
+                continue
+
+            yield element
+
+            decoder = self.__decoder
+            want = self.__chunk_size
+
+            # discard consumed text...
+            if end >= self.__chunk_size:
+                self.__buffer = self.__buffer[end:]
+                end = 0
+
+            # separator...
+            pos = self.__skip(end)
+            separator = self.__buffer[pos]
+
+            if separator == ']':
+                self.__expect_end(pos + 1)
+                return
+
+            if separator != ',':
+                raise ValueError("elements: expected ',' or ']' at: %s" % self.__buffer[pos:pos + 20])
+
+            pos = self.__skip(pos + 1)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __is_number(element):
+        # only a number may continue in the next chunk - other values are self-delimiting...
+        return isinstance(element, (int, float)) and not isinstance(element, bool)
+
+
+    def __skip(self, pos):
+        # the position of the next non-whitespace character, reading as required...
+        while True:
+            pos = self.__WHITESPACE.match(self.__buffer, pos).end()
+
+            if pos < len(self.__buffer):
+                return pos
+
+            if self.__eof:
+                raise ValueError("elements: unterminated array")
+
+            self.__read(self.__chunk_size)
+
+
+    def __expect(self, pos, token):
+        pos = self.__skip(pos)
+
+        if self.__buffer[pos] != token:
+            raise ValueError("elements: expected '%s' at: %s" % (token, self.__buffer[pos:pos + 20]))
+
+        return pos + 1
+
+
+    def __expect_end(self, pos):
+        while True:
+            if self.__buffer[pos:].strip():
+                raise ValueError("elements: text after array: %s" % self.__buffer[pos:pos + 20].strip())
+
+            if self.__eof:
+                return
+
+            self.__buffer = ''
+            pos = 0
+
+            self.__read(self.__chunk_size)
+
+
+    def __read(self, size):
+        chunk = self.__stream.read(size)
+
+        if not chunk:
+            self.__eof = True
+
+        self.__buffer += chunk
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def chunk_size(self):
+        return self.__chunk_size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "JSONArrayReader:{chunk_size:%s, eof:%s}" % (self.chunk_size, self.__eof)
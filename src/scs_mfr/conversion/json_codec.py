@@ -0,0 +1,132 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The JSON codec shared by the CSV tools. Documents are decoded by an accelerated library where one is installed, and by
+the standard library otherwise. Output must be byte-identical whichever backend is in use, so:
+
+* any text that the accelerated decoder rejects - NaN, Infinity, out-of-range floats - is passed to the standard
+  library, which decides whether it is valid
+* text with a run of 19 or more digits is passed to the standard library, since an accelerated decoder may convert an
+  integer beyond 64 bits to a float
+* documents are always encoded by the standard library's C encoder, with its default settings - no accelerated encoder
+  gives the same separators, ASCII escapes and non-finite float constants
+
+Key order is preserved by every backend: accelerated decoders return insertion-ordered dicts, and the standard library
+is given an OrderedDict hook where order is requested.
+
+example:
+JSONCodec:{backend:orjson, available:['orjson', 'json']}
+"""
+
+import json
+import re
+
+from collections import OrderedDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class JSONCodec(object):
+    """
+    classdocs
+    """
+
+    ORJSON =                'orjson'
+    STDLIB =                'json'
+
+    BACKENDS =              (ORJSON, STDLIB)                # in order of preference
+
+    __LONG_NUMBER =         re.compile(r'[0-9]{19}')
+
+    __default = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def available(cls):
+        backends = []
+
+        for backend in cls.BACKENDS:
+            if cls.__module(backend) is not None:
+                backends.append(backend)
+
+        return backends
+
+
+    @classmethod
+    def default(cls):
+        # the process-wide codec, using the preferred available backend...
+        if cls.__default is None:
+            cls.__default = cls.construct()
+
+        return cls.__default
+
+
+    @classmethod
+    def construct(cls, backend=None):
+        if backend is None:
+            backend = cls.available()[0]
+
+        if backend not in cls.BACKENDS:
+            raise ValueError("construct: unknown backend: %s" % backend)
+
+        module = cls.__module(backend)
+
+        if module is None:
+            raise ImportError("construct: backend not installed: %s" % backend)
+
+        return JSONCodec(backend, None if backend == cls.STDLIB else module.loads)
+
+
+    @classmethod
+    def __module(cls, backend):
+        try:
+            return __import__(backend)
+
+        except ImportError:
+            return None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, backend, fast_loads):
+        """
+        Constructor
+        """
+        self.__backend = backend                                        # string
+        self.__fast_loads = fast_loads                                  # callable or None for the standard library
+
+        self.__encoder = json.JSONEncoder()                             # default settings, as json.dumps(..)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def loads(self, jstr, ordered=False):
+        if self.__fast_loads is not None and self.__LONG_NUMBER.search(jstr) is None:
+            try:
+                return self.__fast_loads(jstr)
+
+            except ValueError:
+                pass                                                    # the standard library decides
+
+        return json.loads(jstr, object_pairs_hook=OrderedDict if ordered else None)
+
+
+    def dumps(self, obj):
+        return self.__encoder.encode(obj)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def backend(self):
+        return self.__backend
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "JSONCodec:{backend:%s, available:%s}" % (self.backend, self.available())
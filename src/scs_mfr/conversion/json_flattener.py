@@ -0,0 +1,141 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Flattens JSON documents to CSV rows. The header - the paths to the leaf nodes of the first document - is compiled once
+into accessors, grouped by parent, so that each later document is read by visiting each parent node once, rather than
+by walking the whole document. Fields that are not in the header are ignored, and fields in the header that are missing
+from a document are given the null value.
+
+example header:
+tag,rec,val.hmd,val.tmp,val.bin:0,val.bin:1
+"""
+
+from collections import OrderedDict
+
+from scs_mfr.conversion.csv_template import CSVTemplate
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class JSONFlattener(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_document(cls, document):
+        paths = []
+        cls.__append_leaf_paths(document, (), paths)
+
+        return JSONFlattener(paths)
+
+
+    @classmethod
+    def construct_from_header(cls, header):
+        paths = [tuple(step for _, step in CSVTemplate.parse_path(cell)) for cell in header]
+
+        return JSONFlattener(paths)
+
+
+    @classmethod
+    def __append_leaf_paths(cls, node, path, paths):
+        if isinstance(node, dict):
+            for key, child in node.items():
+                cls.__append_leaf_paths(child, path + (key, ), paths)
+
+        elif isinstance(node, list):
+            for index, child in enumerate(node):
+                cls.__append_leaf_paths(child, path + (index, ), paths)
+
+        elif path:
+            paths.append(path)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def path_name(path):
+        name = ''
+
+        for step in path:
+            if isinstance(step, int):
+                name += ':%d' % step
+
+            else:
+                name += step if len(name) == 0 else '.' + step
+
+        return name
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, paths):
+        """
+        Constructor
+        """
+        self.__paths = paths                                            # list of tuple of string or int
+
+        # compile: columns grouped by the path to their parent node...
+        groups = OrderedDict()
+
+        for column, path in enumerate(paths):
+            groups.setdefault(path[:-1], []).append((column, path[-1]))
+
+        self.__groups = list(groups.items())                            # list of (parent path, [(column, step)])
+
+
+    def __len__(self):
+        return len(self.__paths)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def row(self, document):
+        row = [None] * len(self.__paths)
+
+        for parent_path, leaves in self.__groups:
+            parent = document
+
+            try:
+                for step in parent_path:
+                    parent = parent[step]
+
+            except (KeyError, IndexError, TypeError):
+                continue
+
+            if not isinstance(parent, (dict, list)):
+                continue
+
+            for column, step in leaves:
+                try:
+                    value = parent[step]
+
+                except (KeyError, IndexError, TypeError):
+                    continue
+
+                if not isinstance(value, (dict, list)):
+                    row[column] = value
+
+        return row
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def paths(self):
+        return self.__paths
+
+
+    @property
+    def header(self):
+        return [self.path_name(path) for path in self.__paths]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "JSONFlattener:{header:%s}" % self.header
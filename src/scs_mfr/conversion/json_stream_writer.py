@@ -0,0 +1,134 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Writes JSON documents to a text stream, either as a sequence of newline-separated documents or as a JSON array. Output
+is gathered into large chunks, unless live mode is selected, in which case each document is flushed as it is written.
+"""
+
+import os
+import stat
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class JSONStreamWriter(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_CHUNK_SIZE =        1 << 16             # characters
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def separator(array):
+        # text that may be used to join a run of documents, which are then written as one...
+        return ',' if array else '\n'
+
+
+    @staticmethod
+    def is_pipe(stream):
+        try:
+            return stat.S_ISFIFO(os.fstat(stream.fileno()).st_mode)
+
+        except (AttributeError, OSError, ValueError):
+            return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, stream, array=False, live=False, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Constructor
+        """
+        self.__stream = stream                                          # text stream
+        self.__array = array                                            # bool
+        self.__live = live                                              # bool
+        self.__chunk_size = chunk_size                                  # int
+
+        self.__buffer = []                                              # list of string
+        self.__buffered = 0                                             # int
+        self.__first = True                                             # bool
+
+        if self.__array:
+            self.__append('[')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, jstr):
+        self.write_block((jstr, ))
+
+
+    def write_block(self, jstrs):
+        if not jstrs:
+            return
+
+        if self.__array:
+            separator = self.separator(True)
+
+            if self.__first:
+                self.__append(jstrs[0])
+                jstrs = jstrs[1:]
+
+            for jstr in jstrs:
+                self.__append(separator + jstr)
+
+        else:
+            for jstr in jstrs:
+                self.__append(jstr + '\n')
+
+        self.__first = False
+
+        if self.__live or self.__buffered >= self.__chunk_size:
+            self.flush()
+
+
+    def flush(self):
+        if self.__buffer:
+            self.__stream.write(''.join(self.__buffer))
+
+            self.__buffer = []
+            self.__buffered = 0
+
+        self.__stream.flush()
+
+
+    def close(self):
+        if self.__array:
+            self.__append(']\n')
+
+        self.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __append(self, text):
+        self.__buffer.append(text)
+        self.__buffered += len(text)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def array(self):
+        return self.__array
+
+
+    @property
+    def live(self):
+        return self.__live
+
+
+    @property
+    def chunk_size(self):
+        return self.__chunk_size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "JSONStreamWriter:{array:%s, live:%s, chunk_size:%s}" % (self.array, self.live, self.chunk_size)
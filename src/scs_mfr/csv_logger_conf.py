@@ -39,6 +39,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_csv_logger_conf import CmdCSVLoggerConf
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -62,7 +64,7 @@ if __name__ == '__main__':
     # resources...
 
     # check for existing document...
-    conf = CSVLoggerConf.load(Host)
+    conf = ConfCache.load(CSVLoggerConf, Host)
 
 
     # ----------------------------------------------------------------------------------------------------------------
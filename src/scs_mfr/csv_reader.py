@@ -19,11 +19,46 @@ By default, output is in the form of a sequence of JSON documents, separated by
 selected, output is in the form of a JSON array - the output opens with a '[' character, documents are separated by
 the ',' character, and the output is terminated by a ']' character.
 
+Rows are converted in blocks, and output is written in large chunks. If the live (-l) option is selected and stdout is
+a pipe, each document is instead written and flushed as soon as its row has been read.
+
+If the processes (-p) option is selected, the named file is memory-mapped, split into row-aligned chunks, and converted
+by a pool of worker processes. Output remains in the original row order. In this mode, cells must not contain
+quoted newline characters.
+
+If columns (-c) are given, only the named header paths - and any columns beneath them - are included. If a start (-s)
+or end (-e) is given, only rows whose rec field is in the time range are included: start is inclusive, end exclusive,
+and times without a UTC offset are taken as UTC. Both are applied before any document is built, so cells that are not
+selected are never parsed.
+
+When a time range is given for a named CSV file, csv_reader uses a sparse index of the file, giving the byte offset of
+a row at every megabyte, keyed by rec. The index is cached in a sidecar file (FILENAME.idx), and is checked against the
+size and modification time of the file - where the file has grown, the index is extended. Only the rows in the span
+of the index that holds the range are read. rec must increase through the file, as it does for csv_logger output -
+where it does not, the whole file is read.
+
+If FILENAME ends with .gz, .xz or .zst, it is decompressed with gzip, xz or zstd as it is read, by a background thread,
+so that decompression overlaps with conversion. Compressed files are always read sequentially, and without an index.
+zstd requires the zstandard package.
+
+Columnar files written by csv_writer are recognised, and converted to the same JSON documents. Columnar files are
+always read sequentially.
+
+If several files, or a directory, are given, the CSV files are merged into one stream in rec order, by a k-way heap
+merge - each file must itself be in rec order, as the rotated logs of csv_logger are. Files are read in blocks, so
+memory is bounded by the number of files, not by the total number of rows. Files may have different headers, and may
+be compressed. A directory is expanded to the *.csv files beneath it (with any compression extension), in name order.
+Rows with equal rec times are taken in the order in which their files are given.
+
 SYNOPSIS
-csv_reader.py [-a] [-v] [FILENAME]
+csv_reader.py [-c PATHS] [-s START] [-e END] [-a] [{ -l | -p PROCESSES }] [-v] [FILENAME ...]
 
 EXAMPLES
 csv_reader.py temp.csv
+csv_reader.py -p 4 gases-2018-04.csv
+csv_reader.py gases-2018-04.csv.xz
+csv_reader.py -s 2018-04-01T00:00:00Z /srv/removable_data_storage/climate
+csv_reader.py -c rec,val.NO2.cnc -s 2018-04-04T14:00:00Z -e 2018-04-05T00:00:00Z gases-2018-04.csv
 
 DOCUMENT EXAMPLE - INPUT
 tag,rec,val.hmd,val.tmp
@@ -44,22 +79,35 @@ scs_mfr/csv_writer
 
 import sys
 
-from scs_core.csv.csv_reader import CSVReader
-
 from scs_mfr.cmd.cmd_csv_reader import CmdCSVReader
 
+from scs_mfr.conversion.columnar_reader import ColumnarReader
+from scs_mfr.conversion.compressed_file import CompressedFile
+from scs_mfr.conversion.csv_block_reader import CSVBlockReader
+from scs_mfr.conversion.csv_merge_reader import CSVMergeReader
+from scs_mfr.conversion.csv_parallel_reader import CSVParallelReader
+from scs_mfr.conversion.csv_rec_index import CSVRecIndex
+from scs_mfr.conversion.csv_selection import CSVSelection
+from scs_mfr.conversion.json_codec import JSONCodec
+from scs_mfr.conversion.json_stream_writer import JSONStreamWriter
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
 
     reader = None
+    writer = None
 
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
 
     cmd = CmdCSVReader()
 
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
     if cmd.verbose:
         print("csv_reader: %s" % cmd, file=sys.stderr)
 
@@ -67,43 +115,70 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
+        live = cmd.live and JSONStreamWriter.is_pipe(sys.stdout)
+        block_size = 1 if live else CSVBlockReader.DEFAULT_BLOCK_SIZE
+
+        index = None
+        span = None
+
         try:
-            reader = CSVReader.construct_for_file(cmd.filename)
+            columnar = not cmd.merge and ColumnarReader.is_columnar_file(cmd.filename)
+            compressed = CompressedFile.codec(cmd.filename) is not None
+
+            # seek to the time range...
+            if not cmd.merge and not columnar and not compressed and cmd.filename is not None and \
+                    (cmd.start is not None or cmd.end is not None):
+                index = CSVRecIndex.construct_for_file(cmd.filename)
+
+                if index is not None:
+                    span = index.span(None if cmd.start is None else CSVSelection.timestamp(cmd.start),
+                                      None if cmd.end is None else CSVSelection.timestamp(cmd.end))
+
+            if cmd.merge:
+                reader = CSVMergeReader.construct_for_files(cmd.filenames, block_size, cmd.columns, cmd.start, cmd.end)
 
-        except FileNotFoundError:
-            print("csv_reader: file not found: %s" % cmd.filename, file=sys.stderr)
+            elif columnar:
+                reader = ColumnarReader.construct_for_file(cmd.filename, cmd.columns, cmd.start, cmd.end)
+
+            elif cmd.processes is None or compressed:
+                reader = CSVBlockReader.construct_for_file(cmd.filename, block_size, cmd.columns, cmd.start, cmd.end,
+                                                           span)
+
+            else:
+                separator = JSONStreamWriter.separator(cmd.array)
+                reader = CSVParallelReader.construct_for_file(cmd.filename, cmd.processes, separator=separator,
+                                                              paths=cmd.columns, start=cmd.start, end=cmd.end,
+                                                              span=span)
+
+        except FileNotFoundError as ex:
+            print("csv_reader: file not found: %s" % ex.filename, file=sys.stderr)
             exit(1)
 
         except KeyError as ex:
             print("csv_reader: empty header cell in: %s." % ex, file=sys.stderr)
             exit(1)
 
+        except ValueError as ex:
+            print("csv_reader: %s" % ex, file=sys.stderr)
+            exit(1)
+
+        writer = JSONStreamWriter(sys.stdout, cmd.array, live)
+
         if cmd.verbose:
+            if index is not None:
+                print("csv_reader: %s span:%s" % (index, span), file=sys.stderr)
+
             print("csv_reader: %s" % reader, file=sys.stderr)
+            print("csv_reader: %s" % writer, file=sys.stderr)
+            print("csv_reader: %s" % JSONCodec.default(), file=sys.stderr)
             sys.stderr.flush()
 
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        if cmd.array:
-            print('[', end='')
-
-        first = True
-
-        for datum in reader.rows():
-            if cmd.array:
-                if first:
-                    print(datum, end='')
-                    first = False
-
-                else:
-                    print(",%s" % datum, end='')
-
-            else:
-                print(datum)
-
-            sys.stdout.flush()
+        for block in reader.blocks():
+            writer.write_block(block)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -114,9 +189,8 @@ if __name__ == '__main__':
             print("csv_reader: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        if writer is not None:
+            writer.close()
 
         if reader is not None:
-            if cmd is not None and cmd.array:
-                print(']')
-
             reader.close()
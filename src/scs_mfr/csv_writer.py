@@ -15,11 +15,37 @@ All the leaf nodes of the first JSON document are included in the CSV. If subseq
 contain fields that were not in this first document, these extra fields are ignored. If subsequent JSON documents
 do not contain a field in the header, then this field is given the null value.
 
+The header is compiled once into a set of accessors, which are applied to each subsequent document. When appending to
+an existing file, the header is taken from that file.
+
+If an interval (-i) is given, rows are held in memory and written to the file with a single write operation at most
+INTERVAL seconds after the first row was held - whether or not more input arrives - or once the maximum buffer size
+(-b) has been reached. This reduces write amplification on SD cards - see the write-interval parameter of
+csv_logger_conf. Held rows are always written on SIGTERM or KeyboardInterrupt. Echoed documents are not held.
+
+Input may be a sequence of JSON documents, one per line, or a single JSON array of documents - such as the output of
+csv_reader -a. An array is parsed incrementally, one element at a time, so arrays of any size can be converted in
+constant memory. When echoing array input, each element is echoed as a separate document.
+
+If the columnar format (-f columnar) is selected, output is written in a compact binary form: typed integer and float
+columns - the narrowest integers, and float32, wherever every value can be restored exactly - ISO 8601 datetime
+columns, such as rec, held as microseconds since the epoch, and dictionary-encoded string columns, such as tag.
+Columns are named with the same header paths as CSV, and rows are written in blocks of 4096, or on each interval.
+The csv_reader utility converts columnar files back to exactly the JSON documents that were written.
+
+If FILENAME ends with .gz, .xz or .zst, output is compressed with gzip, xz or zstd, by a background thread, so that
+conversion overlaps with compression. Appending adds a new compressed member to the file. Compressed output is
+completed when csv_writer exits, so an interval is not needed. zstd requires the zstandard package.
+
 SYNOPSIS
-csv_writer.py [-c] [-a] [-e] [-v] [FILENAME]
+csv_writer.py [-f FORMAT] [-c] [-a] [-i INTERVAL [-b MAX_BUFFER]] [-e] [-v] [FILENAME]
 
 EXAMPLES
 ./socket_receiver.py | ./csv_writer.py temp.csv -e
+./csv_reader.py -a climate.csv | ./csv_writer.py climate-copy.csv
+./aws_mqtt_client.py -s | ./csv_writer.py gases.csv -a -i 60
+./aws_mqtt_client.py -s | ./csv_writer.py gases.col -f columnar -a -i 60
+./aws_mqtt_client.py -s | ./csv_writer.py gases.csv.gz -a
 
 DOCUMENT EXAMPLE - INPUT
 {"tag": "scs-ap1-6", "rec": "2018-04-04T14:50:27.641+00:00", "val": {"hmd": 59.6, "tmp": 23.8}}
@@ -29,15 +55,28 @@ tag,rec,val.hmd,val.tmp
 scs-ap1-6,2018-04-04T14:50:38.394+00:00,59.7,23.8
 
 SEE ALSO
+scs_mfr/csv_logger_conf
 scs_mfr/csv_reader
 """
 
+import signal
 import sys
 
-from scs_core.csv.csv_writer import CSVWriter
-
 from scs_mfr.cmd.cmd_csv_writer import CmdCSVWriter
 
+from scs_mfr.conversion.columnar_stream_writer import ColumnarStreamWriter
+from scs_mfr.conversion.csv_stream_writer import CSVStreamWriter
+from scs_mfr.conversion.json_array_reader import JSONArrayReader
+from scs_mfr.conversion.json_codec import JSONCodec
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+# noinspection PyUnusedLocal
+def sigterm_handler(signum, frame):
+    # unwind, so that held rows are written...
+    raise KeyboardInterrupt()
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -50,6 +89,10 @@ if __name__ == '__main__':
 
     cmd = CmdCSVWriter()
 
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
     if cmd.verbose:
         print("csv_writer: %s" % cmd, file=sys.stderr)
 
@@ -57,28 +100,55 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        writer = CSVWriter(cmd.filename, cmd.append)
+        try:
+            if cmd.columnar:
+                writer = ColumnarStreamWriter(cmd.filename, cmd.append, cmd.interval)
+
+            elif cmd.max_buffer is None:
+                writer = CSVStreamWriter(cmd.filename, cmd.append, cmd.interval)
+
+            else:
+                writer = CSVStreamWriter(cmd.filename, cmd.append, cmd.interval, cmd.max_buffer)
+
+        except ValueError as ex:
+            print("csv_writer: %s" % ex, file=sys.stderr)
+            exit(1)
+
+        signal.signal(signal.SIGTERM, sigterm_handler)
 
         if cmd.verbose:
             print("csv_writer: %s" % writer, file=sys.stderr)
+            print("csv_writer: %s" % JSONCodec.default(), file=sys.stderr)
             sys.stderr.flush()
 
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            datum = line.strip()
+        if JSONArrayReader.is_array(sys.stdin):
+            codec = JSONCodec.default()
+
+            for document in JSONArrayReader(sys.stdin).elements():
+                writer.write_document(document)
+
+                # echo...
+                if cmd.echo:
+                    print(codec.dumps(document))
+                    sys.stdout.flush()
+
+        else:
+            for line in sys.stdin:
+                datum = line.strip()
 
-            if datum is None:
-                break
+                if datum is None:
+                    break
 
-            writer.write(datum)
+                writer.write(datum)
 
-            # echo...
-            if cmd.echo:
-                print(datum)
-                sys.stdout.flush()
+                # echo...
+                if cmd.echo:
+                    print(datum)
+                    sys.stdout.flush()
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -9,15 +9,36 @@ DESCRIPTION
 The dfe_test utility is used to perform a quality control test on South Coast Science digital front-end (DFE) boards.
 The test exercises all of the ADCs and connectors.
 
-The output of the test is a JSON document, summarising the result of each of a series of tests.
+The output of the test is a JSON document, summarising the result of each of a series of tests. Tests that do not
+compete for a resource are run concurrently - access to the I2C bus is serialised - but the results are always
+reported in the same order.
+
+In station mode, a MANIFEST file lists the boards on a multi-board fixture - each with its DFE serial number, its I2C
+bus(es) and, optionally, an I2C multiplexer channel. The boards are tested concurrently, and one JSON document is
+written per board as each board finishes. The GPS and OPC are reached through the host's single serial port and SPI
+bus, and so these subjects are ignored in station mode.
+
+With the --timing flag, the output includes a timing section, giving the wall-clock time of each setup stage, and,
+for each subject, the time spent constructing and conducting its test, waiting for the I2C bus, and holding it. Setup
+stages are shared by all of the boards in station mode.
+
+The dfe_test_daemon utility holds these modules and the host's configuration in a long-lived process, and
+dfe_test_client - which takes the same arguments as dfe_test - submits tests to it.
 
 Ideally, a standard resistor load should be attached to the AFE connector of the DFE before the test is run.
 
 SYNOPSIS
-dfe_test.py [-e] [-g] [-r] [-v] DFE_SERIAL_NUMBER
+dfe_test.py [-e] [-g] [-r] [-t] [-v] { DFE_SERIAL_NUMBER | -m MANIFEST }
 
 EXAMPLES
 ./dfe_test.py -g -r -v 123
+./dfe_test.py -m ~/SCS/station_manifest.json
+./dfe_test.py -t 123
+
+DOCUMENT EXAMPLE - MANIFEST
+[{"dfe-sn": "123", "bus": 1, "mux": {"addr": "0x70", "channel": 0}},
+{"dfe-sn": "124", "bus": 1, "mux": {"addr": "0x70", "channel": 1}},
+{"dfe-sn": "125", "bus": 3, "eeprom-bus": 4}]
 
 DOCUMENT EXAMPLE - OUTPUT
 {"tag": "scs-ap1-6", "rec": "2018-04-06T16:08:45.037+00:00",
@@ -28,11 +49,18 @@ DOCUMENT EXAMPLE - OUTPUT
 "SO2": {"weV": 0.267942, "aeV": 0.275942, "weC": -0.009696, "cnc": -26.4},
 "H2S": {"weV": 0.296192, "aeV": 0.285754, "weC": 0.026254, "cnc": 19.4},
 "VOC": {"weV": 0.102627, "weC": 0.102037, "cnc": 1300.9}}}}}
+
+DOCUMENT EXAMPLE - TIMING SECTION
+"timing": {"setup": {"system-id": 0.004, "interface-conf": 0.003, "sht-conf": 0.002, "bus": 0.001},
+"subjects": {"RTC": {"construct": 0.0, "conduct": 2.031, "bus-wait": 0.012, "bus-held": 0.019},
+"Int SHT": {"construct": 0.006, "conduct": 0.041, "bus-wait": 0.0, "bus-held": 0.041}, ...}, "total": 2.046}
 """
 
 import sys
+import time
+
+from collections import OrderedDict
 
-from scs_core.data.datetime import LocalizedDatetime
 from scs_core.data.json import JSONify
 
 from scs_core.sys.system_id import SystemID
@@ -44,22 +72,17 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_dfe_test import CmdDFETest
 
-from scs_mfr.report.dfe_test_datum import DFETestDatum
-from scs_mfr.report.dfe_test_reporter import DFETestReporter
+from scs_mfr.sys.conf_cache import ConfCache
 
-from scs_mfr.test.afe_test import AFETest
-from scs_mfr.test.eeprom_test import EEPROMTest
-from scs_mfr.test.gps_test import GPSTest
-from scs_mfr.test.opc_test import OPCTest
-from scs_mfr.test.pt1000_test import Pt1000Test
-from scs_mfr.test.rtc_test import RTCTest
-from scs_mfr.test.sht_test import SHTTest
+from scs_mfr.test.dfe_test_conductor import DFETestConductor
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
 
+    setup = OrderedDict()                           # dict of stage: float seconds
+
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
 
@@ -78,7 +101,9 @@ if __name__ == '__main__':
     # resources...
 
     # SystemID...
-    system_id = SystemID.load(Host)
+    stage_started = time.time()
+    system_id = ConfCache.load(SystemID, Host)
+    setup['system-id'] = time.time() - stage_started
 
     if system_id is None:
         print("dfe_test: SystemID not available.", file=sys.stderr)
@@ -88,168 +113,26 @@ if __name__ == '__main__':
         print(system_id, file=sys.stderr)
 
     # Interface...
-    conf = InterfaceConf.load(Host)
+    stage_started = time.time()
+    conf = ConfCache.load(InterfaceConf, Host)
     interface = conf.interface()
+    setup['interface-conf'] = time.time() - stage_started
 
     if cmd.verbose:
         print(interface, file=sys.stderr)
         sys.stderr.flush()
 
-    reporter = DFETestReporter(cmd.verbose)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # run...
-
-    afe_datum = None
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # UUID...
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # RTC...
-
-    if cmd.ignore_rtc:
-        reporter.report_ignore("RTC")
-
-    else:
-        try:
-            test = RTCTest(interface, cmd.verbose)
-
-            test_ok = test.conduct()
-            reporter.report_test("RTC", test_ok)
-
-        except Exception as ex:
-            reporter.report_exception("RTC", ex)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # OPC...
-
-    try:
-        test = OPCTest(interface, cmd.verbose)
-
-        test_ok = test.conduct()
-        reporter.report_test("OPC", test_ok)
-
-    except Exception as ex:
-        reporter.report_exception("OPC", ex)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # GPS...
-
-    if cmd.ignore_gps:
-        reporter.report_ignore("GPS")
-
-    else:
-        try:
-            test = GPSTest(interface, cmd.verbose)
-
-            test_ok = test.conduct()
-            reporter.report_test("GPS", test_ok)
-
-        except Exception as ex:
-            reporter.report_exception("GPS", ex)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # NDIR...
-
+    # SHTConf...
+    stage_started = time.time()
+    sht_conf = ConfCache.load(SHTConf, Host)
+    setup['sht-conf'] = time.time() - stage_started
 
-    # ----------------------------------------------------------------------------------------------------------------
-    # Int SHT...
-
-    try:
-        sht_conf = SHTConf.load(Host)
-        sht = sht_conf.int_sht()
-
-        test = SHTTest("Int SHT", sht, interface, cmd.verbose)
-
-        test_ok = test.conduct()
-        reporter.report_test("Int SHT", test_ok)
-
-    except Exception as ex:
-        reporter.report_exception("Int SHT", ex)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # Ext SHT...
-
-    try:
-        sht_conf = SHTConf.load(Host)
-        sht = sht_conf.ext_sht()
-
-        test = SHTTest("Ext SHT", sht, interface, cmd.verbose)
-
-        test_ok = test.conduct()
-        reporter.report_test("Ext SHT", test_ok)
-
-    except Exception as ex:
-        reporter.report_exception("Ext SHT", ex)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # Pt1000...
-
-    try:
-        test = Pt1000Test(interface, cmd.verbose)
-
-        test_ok = test.conduct()
-        reporter.report_test("Pt1000", test_ok)
-
-    except Exception as ex:
-        reporter.report_exception("Pt1000", ex)
+    conductor = DFETestConductor(system_id, interface, sht_conf)
 
 
     # ----------------------------------------------------------------------------------------------------------------
-    # AFE...
-
-    try:
-        test = AFETest(interface, cmd.verbose)
-
-        test_ok = test.conduct()
-        reporter.report_test("AFE", test_ok)
-
-        afe_datum = test.datum
-
-    except Exception as ex:
-        reporter.report_exception("AFE", ex)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # EEPROM...
-
-    if cmd.ignore_eeprom:
-        reporter.report_ignore("EEPROM")
-
-    else:
-        try:
-            test = EEPROMTest(interface, cmd.verbose)
-
-            test_ok = test.conduct()
-            reporter.report_test("EEPROM", test_ok)
-
-        except Exception as ex:
-            reporter.report_exception("EEPROM", ex)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # result...
-
-    if cmd.verbose:
-        print(reporter, file=sys.stderr)
-        print(reporter.result, file=sys.stderr)
-        print("-", file=sys.stderr)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # report...
-
-    recorded = LocalizedDatetime.now().utc()
-    datum = DFETestDatum(system_id.message_tag(), recorded, Host.serial_number(), cmd.dfe_serial_number,
-                         reporter.subjects, afe_datum, reporter.result)
+    # run...
 
-    print(JSONify.dumps(datum))
+    for datum in conductor.run(cmd, setup):
+        print(JSONify.dumps(datum))
+        sys.stdout.flush()
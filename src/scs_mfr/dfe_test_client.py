@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The dfe_test_client utility submits a dfe_test quality control test to dfe_test_daemon, and reports the result
+exactly as dfe_test would - the arguments, the stdout and stderr text, and the exit status are those of dfe_test.
+Where the daemon is not running, dfe_test itself is run.
+
+The client uses the standard library only, so that it starts quickly. The daemon's socket is given by the
+SCS_DFE_TEST_SOCKET environment variable, or is the daemon's default.
+
+SYNOPSIS
+dfe_test_client.py [-e] [-g] [-r] [-t] [-v] { DFE_SERIAL_NUMBER | -m MANIFEST }
+
+EXAMPLES
+./dfe_test_client.py -g -r -v 123
+./dfe_test_client.py -m ~/SCS/station_manifest.json
+
+SEE ALSO
+scs_mfr/dfe_test
+scs_mfr/dfe_test_daemon
+"""
+
+import os
+import sys
+
+from scs_mfr.station.dfe_test_client import DFETestClient
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    args = sys.argv[1:]
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # resources...
+
+    client = DFETestClient(DFETestClient.socket_path())
+
+    try:
+        client.connect()
+
+    except OSError as ex:
+        if isinstance(ex, PermissionError):
+            print("dfe_test_client: %s" % ex, file=sys.stderr)
+
+        # no daemon that can be trusted - run dfe_test in this process's place...
+        dfe_test = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dfe_test.py')
+        os.execv(sys.executable, [sys.executable, dfe_test] + args)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # run...
+
+    try:
+        status = client.request(args, os.getcwd(), sys.stdout, sys.stderr)
+
+    except KeyboardInterrupt:
+        status = 1
+
+    finally:
+        client.close()
+
+    exit(status)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The dfe_test_daemon utility is a long-lived test-station server for the dfe_test quality control test. It imports the
+test modules, and loads SystemID, InterfaceConf and SHTConf, once - each test is then submitted by dfe_test_client,
+without the cost of starting a Python interpreter and loading the host's configuration for each board.
+
+Tests are received over a local Unix socket, and are run one at a time. Each test takes the dfe_test command-line
+arguments, and returns the dfe_test output - one DFETestDatum JSON document per board - with its stderr narrative and
+exit status.
+
+The host's configuration is checked before each test, and a document is read again only where its file has changed -
+the daemon need not be restarted if the configuration is changed. The daemon stops on SIGTERM or KeyboardInterrupt,
+and removes its socket.
+
+SYNOPSIS
+dfe_test_daemon.py [-s SOCKET] [-v]
+
+EXAMPLES
+./dfe_test_daemon.py -v &
+./dfe_test_client.py -t 123
+
+SEE ALSO
+scs_mfr/dfe_test
+scs_mfr/dfe_test_client
+"""
+
+import signal
+import sys
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+
+from scs_core.sys.system_id import SystemID
+
+from scs_dfe.climate.sht_conf import SHTConf
+from scs_dfe.interface.interface_conf import InterfaceConf
+
+from scs_host.sys.host import Host
+
+from scs_mfr.cmd.cmd_dfe_test import CmdDFETest
+from scs_mfr.cmd.cmd_dfe_test_daemon import CmdDFETestDaemon
+
+from scs_mfr.station.dfe_test_client import DFETestClient
+from scs_mfr.station.dfe_test_server import DFETestServer
+
+from scs_mfr.sys.conf_cache import ConfCache
+
+from scs_mfr.test.dfe_test_conductor import DFETestConductor
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def current_conductor():
+    # the conductor for the host's current configuration, or None if SystemID is not available...
+    global held_conductor, held_documents
+
+    documents = (ConfCache.load(SystemID, Host), ConfCache.load(InterfaceConf, Host), ConfCache.load(SHTConf, Host))
+    jstrs = tuple(JSONify.dumps(document) for document in documents)
+
+    if held_conductor is None or jstrs != held_documents:
+        system_id, interface_conf, sht_conf = documents
+
+        held_conductor = None if system_id is None else \
+            DFETestConductor(system_id, interface_conf.interface(), sht_conf)
+
+        held_documents = jstrs
+
+    return held_conductor
+
+
+def run(args):
+    # as dfe_test, with the held resources...
+    test_cmd = CmdDFETest(args, prog="dfe_test.py")
+
+    if test_cmd.verbose:
+        print("dfe_test: %s" % test_cmd, file=sys.stderr)
+        sys.stderr.flush()
+
+    if not test_cmd.is_valid():
+        test_cmd.print_help(sys.stderr)
+        exit(2)
+
+    conductor = current_conductor()
+
+    if conductor is None:
+        print("dfe_test: SystemID not available.", file=sys.stderr)
+        exit(1)
+
+    for datum in conductor.run(test_cmd, OrderedDict()):
+        print(JSONify.dumps(datum))
+        sys.stdout.flush()
+
+
+# noinspection PyUnusedLocal
+def sigterm_handler(signum, frame):
+    raise KeyboardInterrupt()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    server = None
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdDFETestDaemon()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("dfe_test_daemon: %s" % cmd, file=sys.stderr)
+        sys.stderr.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # resources...
+
+    # DFETestConductor...
+    held_conductor = None
+    held_documents = None
+
+    if current_conductor() is None:
+        print("dfe_test_daemon: SystemID not available.", file=sys.stderr)
+        exit(1)
+
+    if cmd.verbose:
+        print("dfe_test_daemon: %s" % held_conductor, file=sys.stderr)
+
+    # DFETestServer...
+    socket_path = DFETestClient.socket_path() if cmd.socket is None else cmd.socket
+
+    try:
+        server = DFETestServer.construct(socket_path, run, cmd.verbose)
+
+    except OSError as ex:
+        print("dfe_test_daemon: %s" % ex, file=sys.stderr)
+        exit(1)
+
+    if cmd.verbose:
+        print("dfe_test_daemon: %s" % server, file=sys.stderr)
+        sys.stderr.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # run...
+
+    signal.signal(signal.SIGTERM, sigterm_handler)
+
+    try:
+        server.serve_forever()
+
+    except KeyboardInterrupt:
+        if cmd.verbose:
+            print("dfe_test_daemon: KeyboardInterrupt", file=sys.stderr)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    finally:
+        server.server_close()
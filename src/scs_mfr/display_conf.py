@@ -41,6 +41,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_display_conf import CmdDisplayConf
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -67,7 +69,7 @@ if __name__ == '__main__':
 
     # DisplayConf...
     try:
-        conf = DisplayConf.load(Host)
+        conf = ConfCache.load(DisplayConf, Host)
 
     except NotImplementedError:
         print("display_conf: not available.", file=sys.stderr)
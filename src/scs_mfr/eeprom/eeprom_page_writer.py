@@ -0,0 +1,155 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A differential writer for the CAT24C32 EEPROM. The EEPROM is read once, and is compared with the image page by page,
+by CRC-32 checksum - only the 32-byte pages that differ are written. Each written page is then read back, and its
+checksum is verified. Where the EEPROM already holds the image, the update is a single read.
+
+Pages are aligned with the EEPROM's internal write pages, so each page is written in one write cycle. The writer
+must be used with the EEPROM bus open.
+"""
+
+import time
+import zlib
+
+from scs_core.sys.eeprom_image import EEPROMImage
+
+from scs_dfe.interface.component.cat24c32 import CAT24C32
+
+from scs_host.bus.i2c import I2C
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class EEPROMPageWriter(object):
+    """
+    classdocs
+    """
+
+    ADDR =              0x50
+
+    PAGE_SIZE =         32                      # bytes - the CAT24C32 write page
+
+    __TWR =             0.005                   # seconds - the maximum write cycle time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def checksums(cls, content):
+        # the CRC-32 of each page...
+        return [zlib.crc32(bytes(content[start:start + cls.PAGE_SIZE]))
+                for start in range(0, len(content), cls.PAGE_SIZE)]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, size=CAT24C32.SIZE):
+        """
+        Constructor
+        """
+        self.__size = size                                              # int bytes
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def read(self):
+        return EEPROMImage(self.__read(0, self.__size))
+
+
+    def differences(self, current_image, image, image_checksums=None):
+        # the numbers of the pages that differ...
+        self.__check(image)
+
+        if image_checksums is None:
+            image_checksums = self.checksums(image.content)
+
+        current_checksums = self.checksums(current_image.content)
+
+        return [page for page, checksum in enumerate(image_checksums) if checksum != current_checksums[page]]
+
+
+    def write(self, image, pages):
+        self.__check(image)
+
+        for page in pages:
+            start = page * self.PAGE_SIZE
+            self.__write(start, image.content[start:start + self.PAGE_SIZE])
+
+
+    def verify(self, image, pages, image_checksums=None):
+        # the numbers of the pages whose read-back checksum is wrong...
+        if image_checksums is None:
+            image_checksums = self.checksums(image.content)
+
+        failed = []
+
+        for page in pages:
+            checksum = zlib.crc32(bytes(self.__read(page * self.PAGE_SIZE, self.PAGE_SIZE)))
+
+            if checksum != image_checksums[page]:
+                failed.append(page)
+
+        return failed
+
+
+    def update(self, image, current_image=None, image_checksums=None):
+        # returns (pages written, pages failed) - the current image is read if it is not given...
+        if current_image is None:
+            current_image = self.read()
+
+        if image_checksums is None:
+            image_checksums = self.checksums(image.content)
+
+        pages = self.differences(current_image, image, image_checksums)
+
+        self.write(image, pages)
+
+        return pages, self.verify(image, pages, image_checksums)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __check(self, image):
+        if len(image.content) != self.__size:
+            raise ValueError("image size %d does not match EEPROM size %d" % (len(image.content), self.__size))
+
+
+    def __read(self, memory_addr, count):
+        try:
+            I2C.start_tx(self.ADDR)
+            return I2C.read_cmd16(memory_addr, count)
+
+        finally:
+            I2C.end_tx()
+
+
+    def __write(self, memory_addr, values):
+        try:
+            I2C.start_tx(self.ADDR)
+            I2C.write_addr16(memory_addr, *values)
+
+            time.sleep(self.__TWR)
+
+        finally:
+            I2C.end_tx()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def size(self):
+        return self.__size
+
+
+    @property
+    def pages(self):
+        return (self.__size + self.PAGE_SIZE - 1) // self.PAGE_SIZE
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "EEPROMPageWriter:{addr:0x%02x, size:%s, page_size:%s}" % (self.ADDR, self.size, self.PAGE_SIZE)
@@ -12,11 +12,16 @@ contents to stdout.
 The EEPROM contains information on vendor, product ID and a universally unique ID (UUID) code, as specified by either
 the Raspberry Pi HAT or BeagleBone cape standards.
 
+With the --diff or --reference flags, only the 32-byte pages that differ from a reference image are shown - the
+EEPROM's page, marked <, then the reference page, marked >. The reference is the host's EEPROM image, or the given
+file. Pages are compared by checksum.
+
 SYNOPSIS
-eeprom_read.py
+eeprom_read.py [{ -d | -r REFERENCE }] [-v]
 
 EXAMPLES
 ./eeprom_read.py
+./eeprom_read.py -r ~/SCS/hat.eep
 
 SEE ALSO
 scs_mfr/dfe_id
@@ -37,11 +42,20 @@ http://papermint-designs.com/community/node/331
 https://learn.adafruit.com/introduction-to-the-beaglebone-black-device-tree/compiling-an-overlay
 """
 
+import sys
+
+from scs_core.sys.eeprom_image import EEPROMImage
+
 from scs_dfe.interface.component.cat24c32 import CAT24C32
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.bus.i2c_session import I2CSession
+
+from scs_mfr.cmd.cmd_eeprom_read import CmdEEPROMRead
+
+from scs_mfr.eeprom.eeprom_page_writer import EEPROMPageWriter
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -52,8 +66,36 @@ Host.enable_eeprom_access()
 
 if __name__ == '__main__':
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdEEPROMRead()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("eeprom_read: %s" % cmd, file=sys.stderr)
+
+    # reference...
+    reference = None
+
+    if cmd.diff:
+        filename = Host.eep_image() if cmd.reference is None else cmd.reference
+
+        try:
+            reference = EEPROMImage.construct_from_file(filename, CAT24C32.SIZE)
+
+        except FileNotFoundError:
+            print("eeprom_read: file not found: %s" % filename, file=sys.stderr)
+            exit(1)
+
+        if cmd.verbose:
+            print("eeprom_read: reference: %s" % filename, file=sys.stderr)
+
     try:
-        I2C.open(Host.I2C_EEPROM)
+        I2CSession.open(Host.I2C_EEPROM)
 
 
         # ------------------------------------------------------------------------------------------------------------
@@ -65,11 +107,26 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        eeprom.image.formatted(32)
+        if reference is None:
+            eeprom.image.formatted(32)
+
+        else:
+            writer = EEPROMPageWriter(CAT24C32.SIZE)
+            pages = writer.differences(eeprom.image, reference)
+
+            for page in pages:
+                start = page * EEPROMPageWriter.PAGE_SIZE
+                end = start + EEPROMPageWriter.PAGE_SIZE
+
+                print("%04x < %s" % (start, ' '.join('%02x' % byte for byte in eeprom.image.content[start:end])))
+                print("%04x > %s" % (start, ' '.join('%02x' % byte for byte in reference.content[start:end])))
+
+            print("eeprom_read: %d of %d pages differ from %s" % (len(pages), writer.pages, filename),
+                  file=sys.stderr)
 
 
     # ----------------------------------------------------------------------------------------------------------------
     # end...
 
     finally:
-        I2C.close()
+        I2CSession.close()
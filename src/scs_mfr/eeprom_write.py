@@ -6,12 +6,15 @@ Created on 26 Sep 2016
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 
 DESCRIPTION
-The eeprom_read utility write the contents of the given file to a South Coast Science digital front-end (DFE) board's
+The eeprom_write utility writes the contents of the given file to a South Coast Science digital front-end (DFE) board's
 EEPROM.
 
 The EEPROM contains information on vendor, product ID and a universally unique ID (UUID) code, as specified by either
 the Raspberry Pi HAT or BeagleBone cape standards.
 
+The EEPROM is read once, and only the 32-byte pages that differ from the file are written. Each written page is then
+verified by checksum.
+
 A jumper link must be fitted to the DFE board in order to enable the write operation.
 
 SYNOPSIS
@@ -50,11 +53,14 @@ from scs_core.sys.eeprom_image import EEPROMImage
 
 from scs_dfe.interface.component.cat24c32 import CAT24C32
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.bus.i2c_session import I2CSession
+
 from scs_mfr.cmd.cmd_eeprom_write import CmdEEPROMWrite
 
+from scs_mfr.eeprom.eeprom_page_writer import EEPROMPageWriter
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -66,7 +72,7 @@ from scs_mfr.cmd.cmd_eeprom_write import CmdEEPROMWrite
 if __name__ == '__main__':
 
     try:
-        I2C.open(Host.I2C_EEPROM)
+        I2CSession.open(Host.I2C_EEPROM)
 
 
         # ------------------------------------------------------------------------------------------------------------
@@ -82,21 +88,21 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        eeprom = CAT24C32()
+        writer = EEPROMPageWriter(CAT24C32.SIZE)
 
         if not cmd.is_valid():
             cmd.print_help(sys.stderr)
-            I2C.close()
             exit(2)
 
         if not path.isfile(cmd.filename):
             print("eeprom_write: file not found", file=sys.stderr)
-            I2C.close()
             exit(1)
 
+        eeprom_image = writer.read()
+
         if cmd.verbose:
             print("current eeprom image:")
-            eeprom.image.formatted(32)
+            eeprom_image.formatted(32)
             print("-")
 
 
@@ -112,19 +118,22 @@ if __name__ == '__main__':
             print("-")
 
         # write...
-        eeprom.write(file_image)
+        try:
+            written, failed = writer.update(file_image, eeprom_image)
+
+        except ValueError as ex:
+            print("eeprom_write: %s" % ex, file=sys.stderr)
+            exit(1)
 
         if cmd.verbose:
-            print("eeprom:")
-            eeprom.image.formatted(32)
+            print("pages written: %d of %d" % (len(written), writer.pages))
             print("-")
 
         # verify...
-        verified = eeprom.image == file_image
+        verified = not failed
 
         if not verified:
-            print("eeprom_write: verification failed", file=sys.stderr)
-            I2C.close()
+            print("eeprom_write: verification failed for pages: %s" % failed, file=sys.stderr)
             exit(1)
 
         if cmd.verbose:
@@ -135,4 +144,4 @@ if __name__ == '__main__':
     # end...
 
     finally:
-        I2C.close()
+        I2CSession.close()
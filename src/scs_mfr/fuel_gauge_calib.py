@@ -47,12 +47,14 @@ from scs_core.data.json import JSONify
 
 from scs_dfe.interface.interface_conf import InterfaceConf
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.bus.i2c_session import I2CSession
+
 from scs_mfr.cmd.cmd_fuel_gauge_calib import CmdFuelGaugeCalib
 
-from scs_psu.batt_pack.fuel_gauge.max17055.max17055_params import MAX17055Params
+from scs_mfr.sys.conf_cache import ConfCache
+
 from scs_psu.psu.psu_conf import PSUConf
 
 
@@ -74,16 +76,16 @@ if __name__ == '__main__':
         sys.stderr.flush()
 
     try:
-        I2C.open(Host.I2C_SENSORS)
+        I2CSession.open(Host.I2C_SENSORS)
 
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
         # Interface...
-        interface_conf = InterfaceConf.load(Host)
+        interface_conf = ConfCache.load(InterfaceConf, Host)
 
         # PSU...
-        psu_conf = PSUConf.load(Host)
+        psu_conf = ConfCache.load(PSUConf, Host)
         psu = psu_conf.psu(Host, interface_conf.model)
 
         if cmd.verbose:
@@ -115,7 +117,9 @@ if __name__ == '__main__':
             print(JSONify.dumps(params))
 
         elif cmd.load:
-            params = MAX17055Params.load(Host)
+            from scs_psu.batt_pack.fuel_gauge.max17055.max17055_params import MAX17055Params
+
+            params = ConfCache.load(MAX17055Params, Host)
             batt_pack.write_params(params)
             print(JSONify.dumps(params))
 
@@ -137,4 +141,4 @@ if __name__ == '__main__':
     # end...
 
     finally:
-        I2C.close()
+        I2CSession.close()
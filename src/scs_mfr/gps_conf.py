@@ -46,6 +46,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_gps_conf import CmdGPSConf
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -69,7 +71,7 @@ if __name__ == '__main__':
     # resources...
 
     # GPSConf...
-    conf = GPSConf.load(Host)
+    conf = ConfCache.load(GPSConf, Host)
 
 
     # ----------------------------------------------------------------------------------------------------------------
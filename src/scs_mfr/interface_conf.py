@@ -52,6 +52,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_interface_conf import CmdInterfaceConf
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # TODO: add a field identifying the model of DSI
 
@@ -77,7 +79,7 @@ if __name__ == '__main__':
     # resources...
 
     # InterfaceConf...
-    conf = InterfaceConf.load(Host)
+    conf = ConfCache.load(InterfaceConf, Host)
 
 
     # ----------------------------------------------------------------------------------------------------------------
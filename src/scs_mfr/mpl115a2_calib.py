@@ -38,22 +38,23 @@ import sys
 from scs_core.climate.mpl115a2_calib import MPL115A2Calib
 from scs_core.data.json import JSONify
 
-from scs_dfe.climate.mpl115a2 import MPL115A2
 from scs_dfe.climate.mpl115a2_conf import MPL115A2Conf
-from scs_dfe.climate.sht_conf import SHTConf
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.bus.i2c_session import I2CSession
+
 from scs_mfr.cmd.cmd_mpl115a2_calib import CmdMPL115A2Calib
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
 
     try:
-        I2C.open(Host.I2C_SENSORS)
+        I2CSession.open(Host.I2C_SENSORS)
 
         # ------------------------------------------------------------------------------------------------------------
         # cmd...
@@ -73,31 +74,36 @@ if __name__ == '__main__':
         # resources...
 
         # MPL115A2Conf...
-        conf = MPL115A2Conf.load(Host)
+        conf = ConfCache.load(MPL115A2Conf, Host)
 
         if conf is None:
             print("mpl115a2_calib: MPL115A2Conf not available.", file=sys.stderr)
             exit(1)
 
-        # SHT...
-        sht_conf = SHTConf.load(Host)
-        sht = sht_conf.int_sht()
-
         # MPL115A2Calib...
-        calib = MPL115A2Calib.load(Host)
-
-        c25 = MPL115A2Calib.DEFAULT_C25 if calib is None else calib.c25
-
-        # MPL115A2...
-        barometer = MPL115A2(c25)
+        calib = ConfCache.load(MPL115A2Calib, Host)
 
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        barometer.init()
+        # the drivers are imported only where the sensors are sampled...
+        if cmd.set or cmd.verbose:
+            from scs_dfe.climate.mpl115a2 import MPL115A2
 
         if cmd.set:
+            from scs_dfe.climate.sht_conf import SHTConf
+
+            # SHT...
+            sht_conf = ConfCache.load(SHTConf, Host)
+            sht = sht_conf.int_sht()
+
+            # MPL115A2...
+            c25 = MPL115A2Calib.DEFAULT_C25 if calib is None else calib.c25
+
+            barometer = MPL115A2(c25)
+            barometer.init()
+
             # SHT...
             sht_datum = sht.sample()
 
@@ -114,7 +120,7 @@ if __name__ == '__main__':
             calib.save(Host)
 
             # calibrated...
-            calib = MPL115A2Calib.load(Host)
+            calib = ConfCache.load(MPL115A2Calib, Host)
 
         elif cmd.delete and calib is not None:
             calib.delete(Host)
@@ -139,4 +145,4 @@ if __name__ == '__main__':
         print("mpl115a2_calib: MPL115A2 not available", file=sys.stderr)
 
     finally:
-        I2C.close()
+        I2CSession.close()
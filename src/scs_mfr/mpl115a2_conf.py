@@ -45,6 +45,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_mpl115a2_conf import CmdMPL115A2Conf
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -68,7 +70,7 @@ if __name__ == '__main__':
     # resources...
 
     # MPL115A2Conf...
-    conf = MPL115A2Conf.load(Host)
+    conf = ConfCache.load(MPL115A2Conf, Host)
 
 
     # ----------------------------------------------------------------------------------------------------------------
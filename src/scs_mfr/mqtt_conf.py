@@ -47,6 +47,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_mqtt_conf import CmdMQTTConf
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -70,7 +72,7 @@ if __name__ == '__main__':
     # resources...
 
     # OPCConf...
-    conf = MQTTConf.load(Host)
+    conf = ConfCache.load(MQTTConf, Host)
 
 
     # ----------------------------------------------------------------------------------------------------------------
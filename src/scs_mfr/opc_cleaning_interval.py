@@ -27,11 +27,14 @@ from scs_core.data.json import JSONify
 from scs_dfe.interface.interface_conf import InterfaceConf
 from scs_dfe.particulate.opc_conf import OPCConf
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.bus.i2c_session import I2CSession
+
 from scs_mfr.cmd.cmd_opc_cleaning_interval import CmdOPCCleaningInterval
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -54,10 +57,10 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        I2C.open(Host.I2C_SENSORS)
+        I2CSession.open(Host.I2C_SENSORS)
 
         # Interface...
-        interface_conf = InterfaceConf.load(Host)
+        interface_conf = ConfCache.load(InterfaceConf, Host)
 
         if interface_conf is None:
             print("opc_cleaning_interval: InterfaceConf not available.", file=sys.stderr)
@@ -73,7 +76,7 @@ if __name__ == '__main__':
             print("opc_cleaning_interval: %s" % interface, file=sys.stderr)
 
         # OPCConf...
-        conf = OPCConf.load(Host)
+        conf = ConfCache.load(OPCConf, Host)
 
         if conf is None:
             print("opc_cleaning_interval: OPCConf not available.", file=sys.stderr)
@@ -105,4 +108,4 @@ if __name__ == '__main__':
     # end...
 
     finally:
-        I2C.close()
+        I2CSession.close()
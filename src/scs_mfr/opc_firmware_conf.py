@@ -49,11 +49,14 @@ from scs_dfe.interface.interface_conf import InterfaceConf
 
 from scs_dfe.particulate.opc_conf import OPCConf
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.bus.i2c_session import I2CSession
+
 from scs_mfr.cmd.cmd_opc_firmware_conf import CmdOPCFirmwareConf
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -76,23 +79,25 @@ if __name__ == '__main__':
         print("opc_firmware_conf: %s" % cmd, file=sys.stderr)
         sys.stderr.flush()
 
-    try:
-        # ------------------------------------------------------------------------------------------------------------
-        # resources...
 
-        # OPCConf...
-        opc_conf = OPCConf.load(Host, name=cmd.name)
+    # ----------------------------------------------------------------------------------------------------------------
+    # resources...
 
-        if opc_conf is None:
-            print("opc_firmware_conf: OPCConf not available.", file=sys.stderr)
-            exit(1)
+    # OPCConf...
+    opc_conf = OPCConf.load(Host, name=cmd.name)
+
+    if opc_conf is None:
+        print("opc_firmware_conf: OPCConf not available.", file=sys.stderr)
+        exit(1)
 
+    i2c_bus = Host.I2C_SENSORS if opc_conf.uses_spi() else opc_conf.bus
+
+    try:
         # I2C...
-        i2c_bus = Host.I2C_SENSORS if opc_conf.uses_spi() else opc_conf.bus
-        I2C.open(i2c_bus)
+        I2CSession.open(i2c_bus)
 
         # Interface...
-        interface_conf = InterfaceConf.load(Host)
+        interface_conf = ConfCache.load(InterfaceConf, Host)
 
         if interface_conf is None:
             print("opc_firmware_conf: InterfaceConf not available.", file=sys.stderr)
@@ -185,4 +190,4 @@ if __name__ == '__main__':
         if opc:
             opc.power_off()
 
-        I2C.close()
+        I2CSession.close()
@@ -55,6 +55,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_osio_client_auth import CmdOSIOClientAuth
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -73,7 +75,7 @@ if __name__ == '__main__':
     # resources...
 
     # OPCConf...
-    opc_conf = OPCConf.load(Host)
+    opc_conf = ConfCache.load(OPCConf, Host)
 
     if cmd.verbose:
         print("osio_client_auth: %s" % opc_conf, file=sys.stderr)
@@ -89,7 +91,7 @@ if __name__ == '__main__':
         print("osio_client_auth: %s" % api_auth, file=sys.stderr)
 
     # SystemID...
-    system_id = SystemID.load(Host)
+    system_id = ConfCache.load(SystemID, Host)
 
     if system_id is None:
         print("osio_client_auth: SystemID not available.", file=sys.stderr)
@@ -99,7 +101,7 @@ if __name__ == '__main__':
         print("osio_client_auth: %s" % system_id, file=sys.stderr)
 
     # AFECalib...
-    afe_calib = AFECalib.load(Host)
+    afe_calib = ConfCache.load(AFECalib, Host)
 
     if afe_calib is None:
         print("osio_client_auth: AFECalib not available.", file=sys.stderr)
@@ -76,6 +76,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_osio_project import CmdOSIOProject
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -137,7 +139,7 @@ if __name__ == '__main__':
     # resources...
 
     # OPCConf...
-    opc_conf = OPCConf.load(Host)
+    opc_conf = ConfCache.load(OPCConf, Host)
 
     if cmd.verbose:
         print("osio_project: %s" % opc_conf, file=sys.stderr)
@@ -153,7 +155,7 @@ if __name__ == '__main__':
         print("osio_project: %s" % api_auth, file=sys.stderr)
 
     # SystemID...
-    system_id = SystemID.load(Host)
+    system_id = ConfCache.load(SystemID, Host)
 
     if system_id is None:
         print("osio_project: SystemID not available.", file=sys.stderr)
@@ -163,7 +165,7 @@ if __name__ == '__main__':
         print("osio_project: %s" % system_id, file=sys.stderr)
 
     # AFECalib...
-    afe_calib = AFECalib.load(Host)
+    afe_calib = ConfCache.load(AFECalib, Host)
 
     if afe_calib is None:
         print("osio_project: AFECalib not available.", file=sys.stderr)
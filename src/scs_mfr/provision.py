@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The provision utility runs a list of scs_mfr utilities - such as system_id, sht_conf, interface_conf, gps_conf,
+psu_conf, mqtt_conf, schedule and timezone - within a single Python process. Each utility parses its arguments, and
+loads and saves its configuration, exactly as it does when run on its own, but the cost of starting the interpreter
+and importing the scs_core, scs_dfe and scs_host packages is paid once for the whole bring-up, rather than once for
+each utility.
+
+The commands are read from SCRIPT, or from stdin if no SCRIPT is given. There is one command per line, written as it
+would be typed at the shell, without the ./ prefix. Blank lines and # comments are ignored. The stdout and stderr
+output of each utility is that of the utility itself.
+
+Commands are run in order. By default, provision stops at the first command that exits with a non-zero status, and
+exits with that status. With the --keep-going flag, the remaining commands are run, and provision exits with status 1
+if any command failed. An unknown utility, or a line that cannot be parsed, is reported before any command is run.
+
+dfe_test_client and dfe_test_daemon cannot be run by provision.
+
+SYNOPSIS
+provision.py [-k] [-v] [SCRIPT]
+
+EXAMPLES
+./provision.py -v ~/SCS/bring_up.txt
+echo "sht_conf -i 0x44 -e 0x45" | ./provision.py
+
+DOCUMENT EXAMPLE - SCRIPT
+# bring-up for a DFE-equipped device...
+system_id -d SCS -m BGX -n Praxis -c BGX -s 401
+interface_conf -m DFE
+sht_conf -i 0x44 -e 0x45
+timezone -s Europe/London
+schedule -s scs-climate 10.0 1
+"""
+
+import os
+import sys
+import time
+
+from scs_mfr.cmd.cmd_provision import CmdProvision
+
+from scs_mfr.provisioning.provisioning_script import ProvisioningScript
+from scs_mfr.provisioning.provisioning_shell import ProvisioningShell
+
+from scs_mfr.sys.conf_cache import ConfCache
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    failures = 0
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdProvision()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("provision: %s" % cmd, file=sys.stderr)
+        sys.stderr.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # resources...
+
+    # ProvisioningScript...
+    try:
+        if cmd.script is None:
+            script = ProvisioningScript.construct_from_file(sys.stdin)
+
+        else:
+            with open(cmd.script) as f:
+                script = ProvisioningScript.construct_from_file(f)
+
+    except FileNotFoundError:
+        print("provision: file not found: %s" % cmd.script, file=sys.stderr)
+        exit(1)
+
+    except ValueError as ex:
+        print("provision: malformed script: %s" % ex, file=sys.stderr)
+        exit(1)
+
+    # ProvisioningShell...
+    shell = ProvisioningShell(os.path.dirname(os.path.abspath(__file__)))
+
+    unknown = [command for command in script.commands if not shell.has_tool(command.tool)]
+
+    for command in unknown:
+        print("provision: line %d: unknown utility: %s" % (command.line, command.tool), file=sys.stderr)
+
+    if unknown:
+        exit(1)
+
+    if cmd.verbose:
+        print("provision: %s" % shell, file=sys.stderr)
+        print("provision: %d commands" % len(script), file=sys.stderr)
+        sys.stderr.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # run...
+
+    try:
+        for command in script.commands:
+            if cmd.verbose:
+                print("provision: line %d: %s" % (command.line, command.command_line()), file=sys.stderr)
+                sys.stderr.flush()
+
+            started = time.time()
+            status = shell.run(command.tool, command.args)
+
+            if cmd.verbose:
+                print("provision: line %d: exit %d in %0.3f s" % (command.line, status, time.time() - started),
+                      file=sys.stderr)
+                sys.stderr.flush()
+
+            if status != 0:
+                failures += 1
+
+                if not cmd.keep_going:
+                    print("provision: line %d: %s failed with exit status %d" % (command.line, command.tool, status),
+                          file=sys.stderr)
+                    exit(status)
+
+    except KeyboardInterrupt:
+        if cmd.verbose:
+            print("provision: KeyboardInterrupt", file=sys.stderr)
+
+        exit(1)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    if cmd.verbose:
+        print("provision: %s" % ConfCache.stats(), file=sys.stderr)
+
+    if failures:
+        print("provision: %d of %d commands failed" % (failures, len(script)), file=sys.stderr)
+        exit(1)
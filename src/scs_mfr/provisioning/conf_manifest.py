@@ -0,0 +1,256 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The configuration documents of a device, as a single JSON object, keyed by document name. Each value is the document
+as its conf utility would report it, or null where the document should not exist. Documents that are not named are
+left as they are.
+
+Fields that are not given in a document take their stored values, so that a manifest need only give the fields that
+it manages. A document is written only where the result differs from the stored document. Documents are written
+atomically, by replacing the stored file - the replacement keeps the mode of the file that it replaces. Documents are
+deleted by their classes.
+
+Document classes are imported when they are used, so that a manifest does not require the packages - such as scs_psu
+- of the documents that it does not name.
+
+example:
+{"sht_conf": {"int": "0x44", "ext": "0x45"}, "interface_conf": {"model": "DFE"},
+"schedule": {"scs-climate": {"interval": 10.0, "tally": 1}}, "mqtt_conf": null}
+"""
+
+import importlib
+import json
+import os
+import stat
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+
+from scs_mfr.sys.conf_cache import ConfCache
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfManifest(object):
+    """
+    classdocs
+    """
+
+    DOCUMENTS = OrderedDict([
+        ('system_id',           ('scs_core.sys.system_id', 'SystemID')),
+        ('interface_conf',      ('scs_dfe.interface.interface_conf', 'InterfaceConf')),
+        ('sht_conf',            ('scs_dfe.climate.sht_conf', 'SHTConf')),
+        ('mpl115a2_conf',       ('scs_dfe.climate.mpl115a2_conf', 'MPL115A2Conf')),
+        ('gps_conf',            ('scs_dfe.gps.gps_conf', 'GPSConf')),
+        ('opc_conf',            ('scs_dfe.particulate.opc_conf', 'OPCConf')),
+        ('scd30_conf',          ('scs_dfe.gas.scd30.scd30_conf', 'SCD30Conf')),
+        ('psu_conf',            ('scs_psu.psu.psu_conf', 'PSUConf')),
+        ('mqtt_conf',           ('scs_core.comms.mqtt_conf', 'MQTTConf')),
+        ('csv_logger_conf',     ('scs_core.csv.csv_logger_conf', 'CSVLoggerConf')),
+        ('schedule',            ('scs_core.sync.schedule', 'Schedule')),
+        ('timezone_conf',       ('scs_core.location.timezone_conf', 'TimezoneConf')),
+        ('airnow_site_conf',    ('scs_core.aqcsv.conf.airnow_site_conf', 'AirNowSiteConf'))
+    ])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_file(cls, filename):
+        with open(filename, "r") as f:
+            jdict = json.load(f, object_hook=OrderedDict)
+
+        return cls.construct_from_jdict(jdict)
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        # raises ValueError on a name that is not a known document...
+        if not isinstance(jdict, dict):
+            raise ValueError("the manifest must be a JSON object")
+
+        for name, document in jdict.items():
+            if name not in cls.DOCUMENTS:
+                raise ValueError("unknown document: %s" % name)
+
+            if document is not None and not isinstance(document, dict):
+                raise ValueError("%s: the document must be a JSON object or null" % name)
+
+        return ConfManifest(jdict)
+
+
+    @classmethod
+    def document_class(cls, name):
+        # raises ImportError if the package of the document is not installed...
+        module_name, class_name = cls.DOCUMENTS[name]
+
+        return getattr(importlib.import_module(module_name), class_name)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, documents):
+        """
+        Constructor
+        """
+        self.__documents = documents                                    # OrderedDict of name: jdict or None
+
+
+    def __len__(self):
+        return len(self.__documents)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def updates(self, host):
+        # the ConfUpdate for each document, in manifest order - raises ValueError on a malformed document...
+        updates = []
+
+        for name, document in self.__documents.items():
+            conf_class = self.document_class(name)
+            stored = ConfCache.load(conf_class, host)
+
+            if document is None:
+                updates.append(ConfUpdate(name, conf_class, stored, None))
+                continue
+
+            jdict = OrderedDict() if stored is None else ConfUpdate.jdict(stored)
+            jdict.update(document)
+
+            try:
+                target = conf_class.construct_from_jdict(jdict)
+
+            except (AttributeError, KeyError, TypeError, ValueError) as ex:
+                raise ValueError("%s: %s" % (name, repr(ex)))
+
+            if target is None:
+                raise ValueError("%s: the document is incomplete" % name)
+
+            updates.append(ConfUpdate(name, conf_class, stored, target))
+
+        return updates
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def documents(self):
+        return self.__documents
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConfManifest:{documents:%s}" % list(self.documents.keys())
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfUpdate(object):
+    """
+    classdocs
+    """
+
+    UNCHANGED =     'unchanged'
+    WRITE =         'write'
+    DELETE =        'delete'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def jdict(document):
+        # the document as it would be stored...
+        return json.loads(JSONify.dumps(document), object_hook=OrderedDict)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, name, conf_class, stored, target):
+        """
+        Constructor
+        """
+        self.__name = name                                              # string
+        self.__conf_class = conf_class                                  # PersistentJSONable class
+        self.__stored = stored                                          # PersistentJSONable or None
+        self.__target = target                                          # PersistentJSONable or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def action(self, host):
+        if self.target is None:
+            return self.DELETE if os.path.exists(self.filename(host)) else self.UNCHANGED
+
+        if self.stored is None or not os.path.exists(self.filename(host)):
+            return self.WRITE
+
+        return self.UNCHANGED if self.jdict(self.stored) == self.jdict(self.target) else self.WRITE
+
+
+    def apply(self, host):
+        # returns the action taken...
+        action = self.action(host)
+
+        if action == self.WRITE:
+            self.__save(host)
+
+        elif action == self.DELETE:
+            self.__conf_class.delete(host)
+
+        return action
+
+
+    def filename(self, host):
+        return os.path.join(*self.__conf_class.persistence_location(host))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __save(self, host):
+        # written in full, then moved over the stored document, whose mode it takes...
+        filename = self.filename(host)
+        tmp = "%s.%d.tmp" % (filename, os.getpid())
+
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+        try:
+            with open(tmp, "w") as f:
+                f.write(JSONify.dumps(self.target) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+            if os.path.exists(filename):
+                os.chmod(tmp, stat.S_IMODE(os.stat(filename).st_mode))
+
+            os.replace(tmp, filename)
+
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.__name
+
+
+    @property
+    def stored(self):
+        return self.__stored
+
+
+    @property
+    def target(self):
+        return self.__target
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConfUpdate:{name:%s, stored:%s, target:%s}" % (self.name, self.stored, self.target)
@@ -0,0 +1,119 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A list of scs_mfr utility invocations, one per line, written as they would be typed at the shell - without the
+./ prefix, and with or without the .py suffix. Arguments are split with shell quoting rules, but are not otherwise
+expanded. Blank lines, and text from an unquoted # to the end of a line, are ignored.
+
+example:
+# bring-up for a DFE-equipped device...
+system_id -d SCS -m BGX -n Praxis -c BGX -s 401
+interface_conf -m DFE
+sht_conf -i 0x44 -e 0x45
+timezone -s Europe/London
+schedule -s scs-climate 10.0 1
+"""
+
+import shlex
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ProvisioningScript(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_file(cls, file):
+        # raises ValueError on a line that cannot be split...
+        commands = []
+
+        for number, line in enumerate(file, 1):
+            try:
+                tokens = shlex.split(line, comments=True)
+
+            except ValueError as ex:
+                raise ValueError("line %d: %s" % (number, ex))
+
+            if tokens:
+                commands.append(ProvisioningCommand(number, tokens[0], tokens[1:]))
+
+        return ProvisioningScript(commands)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, commands):
+        """
+        Constructor
+        """
+        self.__commands = commands                                      # list of ProvisioningCommand
+
+
+    def __len__(self):
+        return len(self.__commands)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def commands(self):
+        return self.__commands
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ProvisioningScript:{commands:[%s]}" % ', '.join(str(command) for command in self.commands)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ProvisioningCommand(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, line, tool, args):
+        """
+        Constructor
+        """
+        self.__line = line                                              # int line number
+        self.__tool = tool[:-3] if tool.endswith('.py') else tool       # string utility name, without suffix
+        self.__args = args                                              # list of string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def command_line(self):
+        return ' '.join([self.tool] + [shlex.quote(arg) for arg in self.args])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def line(self):
+        return self.__line
+
+
+    @property
+    def tool(self):
+        return self.__tool
+
+
+    @property
+    def args(self):
+        return self.__args
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ProvisioningCommand:{line:%s, tool:%s, args:%s}" % (self.line, self.tool, self.args)
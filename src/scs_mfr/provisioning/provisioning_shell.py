@@ -0,0 +1,108 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Runs scs_mfr utilities within the current interpreter, rather than as separate processes. Each utility is run as its
+own __main__ module, with sys.argv set to its arguments, so that its Cmd parser, and its conf load and save logic,
+behave exactly as they do when the utility is run from the shell. The modules that utilities import are imported
+once, and each utility is compiled once, however many times it is run.
+
+exit(..) within a utility ends that utility, not the shell - utilities see exit and quit as sys.exit, since the site
+versions close sys.stdin, which later utilities need. Utilities share the process - its working directory,
+environment and standard streams - and so run one at a time.
+"""
+
+import builtins
+import os
+import sys
+import traceback
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ProvisioningShell(object):
+    """
+    classdocs
+    """
+
+    EXCLUDED_TOOLS = {'provision', 'dfe_test_client', 'dfe_test_daemon'}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, tool_dir):
+        """
+        Constructor
+        """
+        self.__tool_dir = tool_dir                                      # string directory of the utilities
+        self.__code = {}                                                # dict of tool: code
+
+        self.__builtins = dict(vars(builtins))                          # dict of name: object
+        self.__builtins['exit'] = sys.exit
+        self.__builtins['quit'] = sys.exit
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def has_tool(self, tool):
+        return tool not in self.EXCLUDED_TOOLS and os.path.isfile(self.__path(tool))
+
+
+    def run(self, tool, args):
+        # returns the exit status of the utility...
+        path = self.__path(tool)
+
+        previous_argv = sys.argv
+        sys.argv = [path] + list(args)
+
+        try:
+            exec(self.__compiled(tool), {'__name__': '__main__', '__file__': path, '__builtins__': self.__builtins})
+            status = 0
+
+        except SystemExit as ex:
+            status = ex.code if isinstance(ex.code, int) else (0 if ex.code is None else 1)
+
+            if ex.code is not None and not isinstance(ex.code, int):
+                print(ex.code, file=sys.stderr)
+
+        except Exception:
+            traceback.print_exc()
+            status = 1
+
+        finally:
+            sys.argv = previous_argv
+
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+        return status
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __compiled(self, tool):
+        if tool not in self.__code:
+            path = self.__path(tool)
+
+            with open(path) as f:
+                self.__code[tool] = compile(f.read(), path, 'exec')
+
+        return self.__code[tool]
+
+
+    def __path(self, tool):
+        return os.path.join(self.__tool_dir, tool + '.py')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def tool_dir(self):
+        return self.__tool_dir
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ProvisioningShell:{tool_dir:%s, compiled:%s}" % (self.tool_dir, sorted(self.__code))
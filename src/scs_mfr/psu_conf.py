@@ -45,6 +45,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_psu_conf import CmdPSUConf
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 from scs_psu.psu.psu_conf import PSUConf
 
 
@@ -70,7 +72,7 @@ if __name__ == '__main__':
     # resources...
 
     # PSUConf...
-    conf = PSUConf.load(Host)
+    conf = ConfCache.load(PSUConf, Host)
 
 
     # ----------------------------------------------------------------------------------------------------------------
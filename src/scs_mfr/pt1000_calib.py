@@ -39,20 +39,22 @@ from scs_core.data.json import JSONify
 from scs_core.gas.afe.pt1000_calib import Pt1000Calib
 
 from scs_dfe.interface.interface_conf import InterfaceConf
-from scs_dfe.climate.sht_conf import SHTConf
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.bus.i2c_session import I2CSession
+
 from scs_mfr.cmd.cmd_pt1000_calib import CmdPt1000Calib
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
 
     try:
-        I2C.open(Host.I2C_SENSORS)
+        I2CSession.open(Host.I2C_SENSORS)
 
         # ------------------------------------------------------------------------------------------------------------
         # cmd...
@@ -72,7 +74,7 @@ if __name__ == '__main__':
         # resources...
 
         # Interface...
-        interface_conf = InterfaceConf.load(Host)
+        interface_conf = ConfCache.load(InterfaceConf, Host)
 
         if interface_conf is None:
             print("pt1000_calib: InterfaceConf not available.", file=sys.stderr)
@@ -87,29 +89,30 @@ if __name__ == '__main__':
         if cmd.verbose and interface:
             print("pt1000_calib: %s" % interface, file=sys.stderr)
 
-        # SHT...
-        sht_conf = SHTConf.load(Host)
-        sht = sht_conf.int_sht()
-
         # validate...
         if interface.pt1000 is None:
             print("pt1000_calib: a Pt1000 ADC has not been configured for this system.", file=sys.stderr)
             exit(1)
 
-        afe = interface.gas_sensors(Host)
-
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
         if cmd.set:
+            # the SHT driver is imported only where it is sampled...
+            from scs_dfe.climate.sht_conf import SHTConf
+
             # SHT...
+            sht_conf = ConfCache.load(SHTConf, Host)
+            sht = sht_conf.int_sht()
+
             sht_datum = sht.sample()
 
             if cmd.verbose:
                 print(sht_datum, file=sys.stderr)
 
             # Pt1000 initial...
+            afe = interface.gas_sensors(Host)
             pt1000_datum = afe.sample_pt1000()
 
             # Pt1000 correction...
@@ -124,7 +127,7 @@ if __name__ == '__main__':
 
         else:
             # load...
-            pt1000_calib = Pt1000Calib.load(Host)
+            pt1000_calib = ConfCache.load(Pt1000Calib, Host)
 
         # report...
         if pt1000_calib:
@@ -141,4 +144,4 @@ if __name__ == '__main__':
     # end...
 
     finally:
-        I2C.close()
+        I2CSession.close()
@@ -2,6 +2,8 @@
 Created on 29 Jan 2017
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The timing section is optional - it is reported only where a DFETestTiming is given.
 """
 
 from collections import OrderedDict
@@ -18,7 +20,7 @@ class DFETestDatum(Sample):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, tag, rec, host_serial_number, dfe_serial_number, subjects, afe, result):
+    def __init__(self, tag, rec, host_serial_number, dfe_serial_number, subjects, afe, result, timing=None):
         """
         Constructor
         """
@@ -29,6 +31,7 @@ class DFETestDatum(Sample):
         self.__subjects = subjects                                      # dict of string: string
         self.__afe = afe                                                # MCUDatum
         self.__result = result                                          # string
+        self.__timing = timing                                          # DFETestTiming or None
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -50,6 +53,9 @@ class DFETestDatum(Sample):
         jdict['subjects'] = self.subjects
         jdict['afe'] = self.afe
 
+        if self.timing is not None:
+            jdict['timing'] = self.timing
+
         return jdict
 
 
@@ -80,10 +86,15 @@ class DFETestDatum(Sample):
         return self.__result
 
 
+    @property
+    def timing(self):
+        return self.__timing
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
         return "StatusSample:{tag:%s, rec:%s, src:%s, host_serial_number:%s, dfe_serial_number:%s, " \
-               "subjects:%s,  afe:%s, result:%s}" % \
+               "subjects:%s,  afe:%s, result:%s, timing:%s}" % \
             (self.tag, self.rec, self.src, self.host_serial_number, self.dfe_serial_number,
-             self.subjects, self.afe, self.result)
+             self.subjects, self.afe, self.result, self.timing)
@@ -0,0 +1,144 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Where the time goes in a dfe_test run: the setup stages (loading SystemID and the confs, opening the bus), and,
+for each subject, the time spent constructing and conducting its test, waiting for the I2C bus, and holding it.
+All times are wall-clock seconds. Subjects run concurrently, so their times overlap, and sum to more than the total.
+
+example:
+{"setup": {"system-id": 0.004, "interface-conf": 0.003, "bus": 0.001},
+"subjects": {"RTC": {"construct": 0.0, "conduct": 2.031, "bus-wait": 0.012, "bus-held": 0.019}, ...},
+"total": 2.046}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DFETestTiming(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, setup, subjects, total):
+        """
+        Constructor
+        """
+        self.__setup = setup                                            # dict of string: float seconds
+        self.__subjects = subjects                                      # dict of string: TestTiming
+        self.__total = total                                            # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['setup'] = OrderedDict((stage, round(seconds, 3)) for stage, seconds in self.setup.items())
+        jdict['subjects'] = self.subjects
+        jdict['total'] = round(self.total, 3)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def slowest(self):
+        # the subject that took longest to conduct, or None...
+        if not self.subjects:
+            return None
+
+        return max(self.subjects, key=lambda subject: self.subjects[subject].conduct_time)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def setup(self):
+        return self.__setup
+
+
+    @property
+    def subjects(self):
+        return self.__subjects
+
+
+    @property
+    def total(self):
+        return self.__total
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        subjects = '{' + ', '.join(str(subject) + ': ' + str(timing) for subject, timing in self.subjects.items()) + '}'
+
+        return "DFETestTiming:{setup:%s, subjects:%s, total:%0.3f}" % (self.setup, subjects, self.total)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestTiming(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, construct_time, conduct_time, bus_wait_time, bus_held_time):
+        """
+        Constructor
+        """
+        self.__construct_time = construct_time                          # float seconds
+        self.__conduct_time = conduct_time                              # float seconds
+        self.__bus_wait_time = bus_wait_time                            # float seconds
+        self.__bus_held_time = bus_held_time                            # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['construct'] = round(self.construct_time, 3)
+        jdict['conduct'] = round(self.conduct_time, 3)
+        jdict['bus-wait'] = round(self.bus_wait_time, 3)
+        jdict['bus-held'] = round(self.bus_held_time, 3)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def construct_time(self):
+        return self.__construct_time
+
+
+    @property
+    def conduct_time(self):
+        return self.__conduct_time
+
+
+    @property
+    def bus_wait_time(self):
+        return self.__bus_wait_time
+
+
+    @property
+    def bus_held_time(self):
+        return self.__bus_held_time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TestTiming:{construct_time:%0.3f, conduct_time:%0.3f, bus_wait_time:%0.3f, bus_held_time:%0.3f}" % \
+               (self.construct_time, self.conduct_time, self.bus_wait_time, self.bus_held_time)
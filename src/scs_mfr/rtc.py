@@ -32,9 +32,10 @@ from scs_core.data.rtc_datetime import RTCDatetime
 
 from scs_dfe.time.ds1338 import DS1338
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.bus.i2c_session import I2CSession
+
 from scs_mfr.cmd.cmd_rtc import CmdRTC
 
 
@@ -64,7 +65,7 @@ if __name__ == '__main__':
     # run...
 
     try:
-        I2C.open(Host.I2C_SENSORS)
+        I2CSession.open(Host.I2C_SENSORS)
 
         if cmd.initialise:
             DS1338.init()
@@ -84,4 +85,4 @@ if __name__ == '__main__':
         print(JSONify.dumps(localized_datetime))
 
     finally:
-        I2C.close()
+        I2CSession.close()
@@ -37,6 +37,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_scd30_conf import CmdSCD30Conf
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -60,7 +62,7 @@ if __name__ == '__main__':
     # resources...
 
     # scd30Conf...
-    conf = SCD30Conf.load(Host)
+    conf = ConfCache.load(SCD30Conf, Host)
 
 
     # ----------------------------------------------------------------------------------------------------------------
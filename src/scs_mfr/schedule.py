@@ -54,6 +54,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_schedule import CmdSchedule
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # TODO: implement tally / averaging functionality on sampling processes
 
@@ -78,7 +80,7 @@ if __name__ == '__main__':
     # ----------------------------------------------------------------------------------------------------------------
     # resources...
 
-    schedule = Schedule.load(Host)
+    schedule = ConfCache.load(Schedule, Host)
 
 
     # ----------------------------------------------------------------------------------------------------------------
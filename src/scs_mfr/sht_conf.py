@@ -48,6 +48,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_sht_conf import CmdSHTConf
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -71,7 +73,7 @@ if __name__ == '__main__':
     # resources...
 
     # SHTConf...
-    conf = SHTConf.load(Host)
+    conf = ConfCache.load(SHTConf, Host)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,146 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A client for dfe_test_daemon. The client sends the dfe_test command-line arguments and working directory to the
+daemon, over a local Unix socket, and receives the stdout and stderr text of the run, followed by its exit status.
+
+Messages are JSON documents, one per line. This module uses the standard library only, so that the client starts
+quickly.
+
+The daemon drives the test hardware, so its socket must be private to its user: the socket is kept in
+$XDG_RUNTIME_DIR or, where that is not set, in a directory in the temporary directory that only the user can use.
+The client connects only to a socket that is owned by the user, with mode 0600, in a directory that no other user
+can write to - otherwise, another local user could impersonate the daemon.
+
+example request:
+{"args": ["-t", "123"], "cwd": "/home/pi"}
+
+example responses:
+{"stderr": "dfe_test: ..."}
+{"stdout": "{\"tag\": \"scs-ap1-6\", ...}\n"}
+{"exit": 0}
+"""
+
+import json
+import os
+import socket
+import stat
+import tempfile
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DFETestClient(object):
+    """
+    classdocs
+    """
+
+    SOCKET_ENVIRONMENT_VARIABLE =   'SCS_DFE_TEST_SOCKET'
+
+    SOCKET_NAME =                   'scs_mfr_dfe_test.sock'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def socket_path(cls):
+        return os.environ.get(cls.SOCKET_ENVIRONMENT_VARIABLE) or os.path.join(cls.socket_dir(), cls.SOCKET_NAME)
+
+
+    @classmethod
+    def socket_dir(cls):
+        return os.environ.get('XDG_RUNTIME_DIR') or os.path.join(tempfile.gettempdir(), 'scs_mfr-%d' % os.getuid())
+
+
+    @classmethod
+    def is_private_dir(cls, path):
+        # owned by this user, and not writable by any other...
+        status = os.stat(path)
+
+        return status.st_uid == os.getuid() and stat.S_ISDIR(status.st_mode) and not status.st_mode & 0o022
+
+
+    @classmethod
+    def is_private_socket(cls, path):
+        status = os.stat(path)
+
+        if status.st_uid != os.getuid() or not stat.S_ISSOCK(status.st_mode) or status.st_mode & 0o077:
+            return False
+
+        return cls.is_private_dir(os.path.dirname(os.path.abspath(path)))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path):
+        """
+        Constructor
+        """
+        self.__path = path                                              # string
+        self.__socket = None                                            # socket
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def connect(self):
+        # raises OSError (such as FileNotFoundError or ConnectionRefusedError) if the daemon is not running, or
+        # PermissionError if the socket is not private to this user...
+        if not self.is_private_socket(self.__path):
+            raise PermissionError("the socket is not private to this user: %s" % self.__path)
+
+        self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            self.__socket.connect(self.__path)
+
+        except OSError:
+            self.close()
+            raise
+
+
+    def request(self, args, cwd, stdout, stderr):
+        # the text of the run is written to stdout and stderr as it arrives - returns the exit status...
+        request = {'args': list(args), 'cwd': cwd}
+
+        self.__socket.sendall((json.dumps(request) + '\n').encode())
+        self.__socket.shutdown(socket.SHUT_WR)
+
+        with self.__socket.makefile('r') as responses:
+            for line in responses:
+                response = json.loads(line)
+
+                if 'stdout' in response:
+                    stdout.write(response['stdout'])
+                    stdout.flush()
+
+                elif 'stderr' in response:
+                    stderr.write(response['stderr'])
+                    stderr.flush()
+
+                elif 'exit' in response:
+                    return response['exit']
+
+        stderr.write("dfe_test_client: the daemon closed the connection\n")
+
+        return 1
+
+
+    def close(self):
+        if self.__socket is not None:
+            self.__socket.close()
+            self.__socket = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DFETestClient:{path:%s}" % self.path
@@ -0,0 +1,253 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The server side of dfe_test_daemon - see DFETestClient for the protocol. Requests are handled one at a time, since the
+test hardware can only be used by one run at once. For each request, the server moves to the client's working
+directory, and redirects sys.stdout and sys.stderr to the connection, so that the run - and each of its test threads
+- reports to the client as it would report to a terminal. exit(..) within the run ends the request, not the server.
+
+Where the client disconnects, the run continues to completion, so that the hardware is left in a known state, and
+its output is discarded.
+
+The socket is created with mode 0600, in a directory that is private to the user - see DFETestClient. The directory
+is created with mode 0700 if it does not exist.
+"""
+
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import traceback
+
+from contextlib import redirect_stderr, redirect_stdout
+
+from scs_mfr.station.dfe_test_client import DFETestClient
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DFETestServer(socketserver.UnixStreamServer):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, path, run, verbose=False):
+        # raises OSError if another server holds the socket, or PermissionError if its directory is not private...
+        directory = os.path.dirname(os.path.abspath(path))
+
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        if not DFETestClient.is_private_dir(directory):
+            raise PermissionError("the socket directory is not private to this user: %s" % directory)
+
+        if os.path.exists(path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+            try:
+                probe.connect(path)
+                raise OSError("a daemon is already listening on: %s" % path)
+
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.remove(path)                                         # left by a daemon that has stopped
+
+            finally:
+                probe.close()
+
+        return DFETestServer(path, run, verbose)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path, run, verbose=False):
+        """
+        Constructor
+        """
+        self.__path = path                                              # string
+        self.__run = run                                                # callable(args) - may raise SystemExit
+        self.__verbose = verbose                                        # bool
+
+        previous_umask = os.umask(0o177)                                # the socket is never open to others
+
+        try:
+            super().__init__(path, DFETestRequestHandler)
+
+        finally:
+            os.umask(previous_umask)
+
+        os.chmod(path, 0o600)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def conduct(self, args, cwd, connection):
+        # returns the exit status of the run...
+        lock = threading.Lock()                                         # the streams share the connection
+
+        stdout = DFETestStream(connection, 'stdout', lock)
+        stderr = DFETestStream(connection, 'stderr', lock)
+
+        previous_cwd = os.getcwd()
+
+        try:
+            os.chdir(cwd)
+
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    self.__run(args)
+                    status = 0
+
+                except SystemExit as ex:
+                    status = ex.code if isinstance(ex.code, int) else (0 if ex.code is None else 1)
+
+                    if ex.code is not None and not isinstance(ex.code, int):
+                        print(ex.code, file=sys.stderr)
+
+                except Exception:
+                    traceback.print_exc()
+                    status = 1
+
+                sys.stdout.flush()
+                sys.stderr.flush()
+
+        except OSError as ex:
+            stderr.write("dfe_test_daemon: %s\n" % ex)
+            status = 1
+
+        finally:
+            os.chdir(previous_cwd)
+
+        return status
+
+
+    def server_close(self):
+        super().server_close()
+
+        try:
+            os.remove(self.__path)
+
+        except FileNotFoundError:
+            pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    @property
+    def verbose(self):
+        return self.__verbose
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DFETestServer:{path:%s, verbose:%s}" % (self.path, self.verbose)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DFETestRequestHandler(socketserver.StreamRequestHandler):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline().decode())
+
+            args = [str(arg) for arg in request['args']]
+            cwd = request.get('cwd', '/')
+
+        except (ValueError, KeyError, TypeError) as ex:
+            self.__send({'stderr': "dfe_test_daemon: malformed request: %s\n" % ex})
+            self.__send({'exit': 2})
+            return
+
+        if self.server.verbose:
+            print("dfe_test_daemon: request: %s" % args, file=sys.stderr)
+            sys.stderr.flush()
+
+        status = self.server.conduct(args, cwd, self.connection)
+
+        if self.server.verbose:
+            print("dfe_test_daemon: exit: %s" % status, file=sys.stderr)
+            sys.stderr.flush()
+
+        self.__send({'exit': status})
+
+
+    def __send(self, response):
+        try:
+            self.connection.sendall((json.dumps(response) + '\n').encode())
+
+        except OSError:
+            pass                                                        # the client has gone
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DFETestStream(io.TextIOBase):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, connection, name, lock):
+        """
+        Constructor
+        """
+        super().__init__()
+
+        self.__connection = connection                                  # socket
+        self.__name = name                                              # string 'stdout' or 'stderr'
+
+        self.__lock = lock                                              # test threads write concurrently
+        self.__connected = True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def writable(self):
+        return True
+
+
+    def write(self, text):
+        if not text:
+            return 0
+
+        with self.__lock:
+            if self.__connected:
+                try:
+                    self.__connection.sendall((json.dumps({self.__name: text}) + '\n').encode())
+
+                except OSError:
+                    self.__connected = False                            # the run continues - see above
+
+        return len(text)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.__name
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DFETestStream:{name:%s, connected:%s}" % (self.name, self.__connected)
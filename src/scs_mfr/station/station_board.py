@@ -0,0 +1,166 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A DFE board on a multi-board test station fixture, addressed through its own I2C bus(es) and, optionally, a channel
+of a TCA9548A-type I2C multiplexer on its sensor bus.
+
+Unless an eeprom-bus is given, the EEPROM of a board with a multiplexer channel is reached through that channel on
+the sensor bus, and the EEPROM of any other board is on Host.I2C_EEPROM.
+
+example:
+{"dfe-sn": "123", "bus": 3, "eeprom-bus": 4, "mux": {"addr": "0x70", "channel": 2}}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+from scs_host.bus.i2c import I2C
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class StationBoard(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        dfe_serial_number = str(jdict.get('dfe-sn'))
+
+        bus = jdict.get('bus', Host.I2C_SENSORS)
+        mux = jdict.get('mux')
+
+        eeprom_bus = jdict.get('eeprom-bus', Host.I2C_EEPROM if mux is None else bus)
+
+        mux_addr = None if mux is None else int(str(mux.get('addr')), 0)
+        mux_channel = None if mux is None else int(mux.get('channel'))
+
+        return StationBoard(dfe_serial_number, bus, eeprom_bus, mux_addr, mux_channel)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, dfe_serial_number, bus, eeprom_bus, mux_addr, mux_channel):
+        """
+        Constructor
+        """
+        self.__dfe_serial_number = dfe_serial_number                    # string
+        self.__bus = int(bus)                                           # int        replaces Host.I2C_SENSORS
+        self.__eeprom_bus = int(eeprom_bus)                             # int        replaces Host.I2C_EEPROM
+
+        self.__mux_addr = mux_addr                                      # int or None
+        self.__mux_channel = mux_channel                                # int or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if not self.dfe_serial_number:
+            return False
+
+        if (self.mux_addr is None) != (self.mux_channel is None):
+            return False
+
+        if self.mux_channel is not None and not 0 <= self.mux_channel < 8:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def route(self, host_bus):
+        # the board's bus that stands in for the given Host bus...
+        if host_bus == Host.I2C_EEPROM:
+            return self.eeprom_bus
+
+        if host_bus == Host.I2C_SENSORS:
+            return self.bus
+
+        return host_bus
+
+
+    def channel(self, bus):
+        # the multiplexer channel through which the given board bus is reached, or None...
+        return self.mux_channel if bus == self.bus else None
+
+
+    def addresses(self):
+        # the (bus, channel) pairs that the board occupies...
+        return {(bus, self.channel(bus)) for bus in (self.bus, self.eeprom_bus)}
+
+
+    def select(self, bus):
+        # must be called with the bus open - the multiplexer is on the board's sensor bus...
+        if self.channel(bus) is None:
+            return
+
+        try:
+            I2C.start_tx(self.mux_addr)
+            I2C.write(1 << self.mux_channel)
+
+        finally:
+            I2C.end_tx()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['dfe-sn'] = self.dfe_serial_number
+        jdict['bus'] = self.bus
+        jdict['eeprom-bus'] = self.eeprom_bus
+
+        if self.mux_addr is not None:
+            jdict['mux'] = OrderedDict()
+            jdict['mux']['addr'] = "0x%02x" % self.mux_addr
+            jdict['mux']['channel'] = self.mux_channel
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def dfe_serial_number(self):
+        return self.__dfe_serial_number
+
+
+    @property
+    def bus(self):
+        return self.__bus
+
+
+    @property
+    def eeprom_bus(self):
+        return self.__eeprom_bus
+
+
+    @property
+    def mux_addr(self):
+        return self.__mux_addr
+
+
+    @property
+    def mux_channel(self):
+        return self.__mux_channel
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        mux_addr = None if self.mux_addr is None else "0x%02x" % self.mux_addr
+
+        return "StationBoard:{dfe_serial_number:%s, bus:%s, eeprom_bus:%s, mux_addr:%s, mux_channel:%s}" % \
+               (self.dfe_serial_number, self.bus, self.eeprom_bus, mux_addr, self.mux_channel)
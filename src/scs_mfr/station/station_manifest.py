@@ -0,0 +1,110 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The set of DFE boards on a multi-board test station fixture.
+
+Boards must not share an address: a bus is either held by a single board without a multiplexer channel, or shared by
+boards on distinct channels. This applies to EEPROM buses as well as to sensor buses.
+
+example:
+[{"dfe-sn": "123", "bus": 1, "mux": {"addr": "0x70", "channel": 0}},
+{"dfe-sn": "124", "bus": 1, "mux": {"addr": "0x70", "channel": 1}},
+{"dfe-sn": "125", "bus": 3, "eeprom-bus": 4}]
+"""
+
+import json
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+from scs_mfr.station.station_board import StationBoard
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class StationManifest(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_file(cls, filename):
+        with open(filename, "r") as f:
+            jdict = json.load(f, object_hook=OrderedDict)
+
+        return cls.construct_from_jdict(jdict)
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        boards = [StationBoard.construct_from_jdict(board_jdict) for board_jdict in jdict]
+
+        return StationManifest(boards)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, boards):
+        """
+        Constructor
+        """
+        self.__boards = boards                                          # list of StationBoard
+
+
+    def __len__(self):
+        return len(self.__boards)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        serial_numbers = set()
+        channels = {}                                                   # dict of bus: set of channel or None
+
+        for board in self.boards:
+            if not board.is_valid():
+                return False
+
+            # each board must be uniquely identified and addressed...
+            if board.dfe_serial_number in serial_numbers:
+                return False
+
+            serial_numbers.add(board.dfe_serial_number)
+
+            for bus, channel in board.addresses():
+                used = channels.setdefault(bus, set())
+
+                # a board without a channel must have the bus to itself...
+                if channel in used or (used and (channel is None or None in used)):
+                    return False
+
+                used.add(channel)
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        return [board.as_json() for board in self.boards]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def boards(self):
+        return self.__boards
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "StationManifest:{boards:[%s]}" % ', '.join(str(board) for board in self.boards)
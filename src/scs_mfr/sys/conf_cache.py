@@ -0,0 +1,156 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A process-wide stand-in for PersistentJSONable.load(host). Each document is read once, and its JSON is then held as a
+string for as long as its file is unchanged - a repeated load costs a stat, a parse and a construct_from_jdict(..),
+rather than a file read. Where the file is written, replaced or deleted - by this process or any other - the document
+is loaded again.
+
+Each load returns a new document, constructed from a newly-parsed jdict, so that a caller may change it in place - as
+afe_baseline and schedule do - without affecting later loads, whether or not the change is saved. Missing documents, and loads that take further arguments,
+such as a named OPCConf, are not cached.
+
+File timestamps are coarser than the time taken to rewrite a small document, so a file rewritten in place, at the same
+size, within one tick of the clock, would keep its stat. A document whose file was modified within the last
+RACY_INTERVAL seconds is therefore not cached, and is read again on its next load.
+"""
+
+import json
+import os
+import threading
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable, JSONify
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfCache(object):
+    """
+    classdocs
+    """
+
+    RACY_INTERVAL = 2.0                             # seconds
+
+    __LOCK = threading.RLock()
+
+    __documents = {}                                # dict of (class, filename): (stat key, jstr)
+
+    __requests = 0                                  # int    calls to load(..)
+    __reads = 0                                     # int    calls to conf_class.load(..)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, conf_class, host, **kwargs):
+        if kwargs:
+            return conf_class.load(host, **kwargs)
+
+        filename = os.path.join(*conf_class.persistence_location(host))
+        key = (conf_class, filename)
+
+        with cls.__LOCK:
+            cls.__requests += 1
+
+            stat_key = cls.__stat_key(filename)
+            cached = cls.__documents.get(key)
+
+            if cached is not None and cached[0] == stat_key:
+                return conf_class.construct_from_jdict(json.loads(cached[1], object_hook=OrderedDict))
+
+            document = conf_class.load(host)
+            cls.__reads += 1
+
+            # a missing file, or one that changed during or just before the load, is read again next time...
+            if stat_key is not None and document is not None and cls.__stat_key(filename) == stat_key and \
+                    time.time() - stat_key[2] / 1e9 > cls.RACY_INTERVAL:
+                cls.__documents[key] = (stat_key, JSONify.dumps(document))
+
+            else:
+                cls.__documents.pop(key, None)
+
+            return document
+
+
+    @classmethod
+    def clear(cls):
+        with cls.__LOCK:
+            cls.__documents.clear()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def stats(cls):
+        with cls.__LOCK:
+            return ConfCacheStats(cls.__requests, cls.__reads)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __stat_key(filename):
+        try:
+            stat = os.stat(filename)
+
+        except FileNotFoundError:
+            return None
+
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfCacheStats(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, requests, reads):
+        """
+        Constructor
+        """
+        self.__requests = requests                                      # int
+        self.__reads = reads                                            # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['requests'] = self.requests
+        jdict['reads'] = self.reads
+        jdict['saved'] = self.saved
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def requests(self):
+        return self.__requests
+
+
+    @property
+    def reads(self):
+        return self.__reads
+
+
+    @property
+    def saved(self):
+        return self.__requests - self.__reads
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConfCacheStats:{requests:%s, reads:%s, saved:%s}" % (self.requests, self.reads, self.saved)
@@ -48,6 +48,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_system_id import CmdSystemID
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -67,7 +69,7 @@ if __name__ == '__main__':
     # resources...
 
     # check for existing document...
-    system_id = SystemID.load(Host)
+    system_id = ConfCache.load(SystemID, Host)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,252 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Conducts dfe_test runs, for a single board or for the boards of a station manifest, with the given host resources -
+SystemID, the interface and SHTConf. The resources may be held between runs, as they are by dfe_test_daemon.
+
+A run is directed by a CmdDFETest. As for the dfe_test utility, errors in the manifest are reported to stderr, and end
+the run with exit(1).
+"""
+
+import sys
+import threading
+import time
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from scs_core.data.datetime import LocalizedDatetime
+
+from scs_host.sys.host import Host
+
+from scs_mfr.bus.i2c_session import I2CSession
+
+from scs_mfr.report.dfe_test_datum import DFETestDatum
+from scs_mfr.report.dfe_test_reporter import DFETestReporter
+from scs_mfr.report.dfe_test_timing import DFETestTiming
+
+from scs_mfr.station.station_manifest import StationManifest
+
+from scs_mfr.test.afe_test import AFETest
+from scs_mfr.test.eeprom_test import EEPROMTest
+from scs_mfr.test.gps_test import GPSTest
+from scs_mfr.test.opc_test import OPCTest
+from scs_mfr.test.pt1000_test import Pt1000Test
+from scs_mfr.test.rtc_test import RTCTest
+from scs_mfr.test.sht_test import SHTTest
+from scs_mfr.test.test_scheduler import TestScheduler
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DFETestConductor(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, system_id, interface, sht_conf):
+        """
+        Constructor
+        """
+        self.__system_id = system_id                                    # SystemID
+        self.__interface = interface                                    # Interface
+        self.__sht_conf = sht_conf                                      # SHTConf or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self, cmd, setup=None):
+        # yields a DFETestDatum for each board, as it finishes - setup is a dict of stage: float seconds...
+        setup = OrderedDict() if setup is None else setup
+        manifest = None
+
+        # StationManifest...
+        if cmd.manifest is not None:
+            stage_started = time.time()
+
+            try:
+                manifest = StationManifest.construct_from_file(cmd.manifest)
+
+            except FileNotFoundError:
+                print("dfe_test: file not found: %s" % cmd.manifest, file=sys.stderr)
+                exit(1)
+
+            except ValueError as ex:
+                print("dfe_test: malformed manifest: %s" % ex, file=sys.stderr)
+                exit(1)
+
+            if manifest is None or not manifest.is_valid():
+                print("dfe_test: the manifest must list uniquely-addressed boards.", file=sys.stderr)
+                exit(1)
+
+            setup['manifest'] = time.time() - stage_started
+
+            if cmd.verbose:
+                print(manifest, file=sys.stderr)
+                sys.stderr.flush()
+
+        try:
+            # hold the session, so that the bus is opened once for all tests...
+            stage_started = time.time()
+            I2CSession.open(Host.I2C_SENSORS)
+            setup['bus'] = time.time() - stage_started
+
+            if manifest is None:
+                yield self.conduct(cmd, setup, cmd.dfe_serial_number)
+
+            else:
+                station_bus_lock = threading.Lock()
+
+                with ThreadPoolExecutor(max_workers=len(manifest)) as executor:
+                    futures = [executor.submit(self.conduct, cmd, setup, board.dfe_serial_number, board,
+                                               station_bus_lock) for board in manifest.boards]
+
+                    # report each board as it finishes...
+                    for future in as_completed(futures):
+                        yield future.result()
+
+        finally:
+            I2CSession.close()
+
+        if cmd.verbose:
+            print("dfe_test: %s" % I2CSession.stats(), file=sys.stderr)
+
+
+    def conduct(self, cmd, setup, dfe_serial_number, board=None, bus_lock=None):
+        started = time.time()
+
+        interface = self.__interface
+
+        scheduler = TestScheduler(bus_lock=bus_lock, board=board)
+        reporter = DFETestReporter(cmd.verbose)
+
+        # ------------------------------------------------------------------------------------------------------------
+        # UUID...
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # RTC...
+
+        if cmd.ignore_rtc:
+            scheduler.ignore("RTC")
+
+        else:
+            scheduler.schedule("RTC", lambda: RTCTest(interface, cmd.verbose))
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # OPC...
+
+        if board is not None:
+            scheduler.ignore("OPC")
+
+        else:
+            scheduler.schedule("OPC", lambda: OPCTest(interface, cmd.verbose))
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # GPS...
+
+        if cmd.ignore_gps or board is not None:
+            scheduler.ignore("GPS")
+
+        else:
+            scheduler.schedule("GPS", lambda: GPSTest(interface, cmd.verbose))
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # NDIR...
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # Int SHT...
+
+        scheduler.schedule("Int SHT", lambda: SHTTest("Int SHT", self.__sht_conf.int_sht(), interface, cmd.verbose))
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # Ext SHT...
+
+        scheduler.schedule("Ext SHT", lambda: SHTTest("Ext SHT", self.__sht_conf.ext_sht(), interface, cmd.verbose))
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # Pt1000...
+
+        scheduler.schedule("Pt1000", lambda: Pt1000Test(interface, cmd.verbose))
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # AFE...
+
+        scheduler.schedule("AFE", lambda: AFETest(interface, cmd.verbose))
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # EEPROM...
+
+        if cmd.ignore_eeprom:
+            scheduler.ignore("EEPROM")
+
+        else:
+            scheduler.schedule("EEPROM", lambda: EEPROMTest(interface, cmd.verbose))
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        if cmd.verbose:
+            print("dfe_test: %s" % scheduler, file=sys.stderr)
+            sys.stderr.flush()
+
+        scheduler.run(reporter)
+
+        afe_datum = scheduler.datum("AFE")
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # result...
+
+        if cmd.verbose:
+            print(reporter, file=sys.stderr)
+            print(reporter.result, file=sys.stderr)
+            print("-", file=sys.stderr)
+
+        timing = DFETestTiming(setup, scheduler.timings(), time.time() - started) if cmd.timing else None
+
+        if cmd.verbose and timing is not None:
+            print(timing, file=sys.stderr)
+            print("slowest: %s" % timing.slowest(), file=sys.stderr)
+
+        recorded = LocalizedDatetime.now().utc()
+
+        return DFETestDatum(self.__system_id.message_tag(), recorded, Host.serial_number(), dfe_serial_number,
+                            reporter.subjects, afe_datum, reporter.result, timing)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def system_id(self):
+        return self.__system_id
+
+
+    @property
+    def interface(self):
+        return self.__interface
+
+
+    @property
+    def sht_conf(self):
+        return self.__sht_conf
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DFETestConductor:{system_id:%s, interface:%s, sht_conf:%s}" % \
+               (self.system_id, self.interface, self.sht_conf)
@@ -3,7 +3,8 @@ Created on 18 May 2017
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 
-Note that this test updates the EEPROM contents.
+Note that this test updates the EEPROM contents. Only the pages that differ from the image are written - see
+EEPROMPageWriter.
 """
 
 from os import path
@@ -14,9 +15,10 @@ from scs_core.sys.eeprom_image import EEPROMImage
 
 from scs_dfe.interface.component.cat24c32 import CAT24C32
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.eeprom.eeprom_page_writer import EEPROMPageWriter
+
 from scs_mfr.test.test import Test
 
 
@@ -44,20 +46,21 @@ class EEPROMTest(Test):
             print("error: eeprom image not found", file=sys.stderr)
             exit(1)
 
-        try:
-            # resources...
-            # Host.enable_eeprom_access()               # TODO: test whether EEPROM access is required
+        # resources...
+        # Host.enable_eeprom_access()                   # TODO: test whether EEPROM access is required
 
-            I2C.open(Host.I2C_EEPROM)
+        file_image = EEPROMImage.construct_from_file(Host.eep_image(), CAT24C32.SIZE)
 
-            eeprom = CAT24C32()
+        with self.bus(Host.I2C_EEPROM):
+            writer = EEPROMPageWriter(CAT24C32.SIZE)
 
             # test...
-            file_image = EEPROMImage.construct_from_file(Host.eep_image(), CAT24C32.SIZE)
-            eeprom.write(file_image)
+            written, failed = writer.update(file_image)
+
+        self._datum = written
 
-            # test criterion...
-            return eeprom.image == file_image
+        if self.verbose:
+            print("pages written: %d of %d" % (len(written), writer.pages), file=sys.stderr)
 
-        finally:
-            I2C.close()
+        # test criterion...
+        return not failed
@@ -10,7 +10,6 @@ from scs_core.position.nmea.gprmc import GPRMC
 
 from scs_dfe.gps.pam_7q import PAM7Q
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
 from scs_mfr.test.test import Test
@@ -35,18 +34,16 @@ class GPSTest(Test):
         if self.verbose:
             print("GPS...", file=sys.stderr)
 
-        gps = None
-
-        try:
-            I2C.open(Host.I2C_SENSORS)
-
-            # GPS...
-            gps = PAM7Q(self.interface, Host.gps_device())
+        # GPS...
+        gps = PAM7Q(self.interface, Host.gps_device())
 
+        with self.bus(Host.I2C_SENSORS):
             gps.power_on()
+
+        try:
+            # test - the serial read does not need the bus...
             gps.open()
 
-            # test...
             self._datum = gps.report(GPRMC)
 
             if self.verbose:
@@ -56,8 +53,7 @@ class GPSTest(Test):
             return self._datum is not None
 
         finally:
-            if gps:
-                gps.close()
-                gps.power_off()
+            gps.close()
 
-            I2C.close()
+            with self.bus(Host.I2C_SENSORS):
+                gps.power_off()
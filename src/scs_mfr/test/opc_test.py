@@ -8,7 +8,6 @@ import sys
 
 from scs_dfe.particulate.opc_conf import OPCConf
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
 from scs_mfr.test.test import Test
@@ -33,24 +32,22 @@ class OPCTest(Test):
         if self.verbose:
             print("OPC...", file=sys.stderr)
 
-        opc = None
+        # resources...
+        opc_conf = OPCConf.load(Host)
 
-        try:
-            I2C.open(Host.I2C_SENSORS)
-
-            # resources...
-            opc_conf = OPCConf.load(Host)
+        if opc_conf is None:
+            print("OPCConf not available - skipping.", file=sys.stderr)
+            return False
 
-            if opc_conf is None:
-                print("OPCConf not available - skipping.", file=sys.stderr)
-                return False
-
-            opc = opc_conf.opc(self.interface, Host)
+        opc = opc_conf.opc(self.interface, Host)
 
+        with self.bus(Host.I2C_SENSORS):
             self.interface.power_opc(True)
+
+        try:
+            # test - the SPI exchange does not need the bus...
             opc.operations_on()
 
-            # test...
             self._datum = opc.firmware()
 
             if self.verbose:
@@ -60,8 +57,7 @@ class OPCTest(Test):
             return len(self._datum) > 0 and self._datum.startswith('OPC')
 
         finally:
-            if opc:
-                opc.operations_off()
-                self.interface.power_opc(False)
+            opc.operations_off()
 
-            I2C.close()
+            with self.bus(Host.I2C_SENSORS):
+                self.interface.power_opc(False)
@@ -8,12 +8,13 @@ import sys
 import time
 import tzlocal
 
+from datetime import timedelta
+
 from scs_core.data.datetime import LocalizedDatetime
 from scs_core.data.rtc_datetime import RTCDatetime
 
 from scs_dfe.time.ds1338 import DS1338
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
 from scs_mfr.test.test import Test
@@ -26,6 +27,12 @@ class RTCTest(Test):
     test script
     """
 
+    __WAIT =                2.0                 # seconds - the reference wait, for the delta criterion
+    __TICK =                1.0                 # seconds - the first tick after the time is set
+    __TOLERANCE =           0.1                 # seconds - either side of the tick
+    __FIRST_POLL =          0.75                # seconds
+    __POLL_INTERVAL =       0.02                # seconds
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __init__(self, interface, verbose):
@@ -35,33 +42,68 @@ class RTCTest(Test):
     # ----------------------------------------------------------------------------------------------------------------
 
     def conduct(self):
+        # Setting the time restarts the DS1338's one-second countdown, so a working clock ticks one second after it is
+        # set. Rather than sleeping for the reference wait, the clock is polled for that tick, and the delta is
+        # projected to the end of the reference wait. A clock that ticks outside the tolerance, or does not advance by
+        # exactly one second, fails - as it would fail the reference test.
         if self.verbose:
             print("RTC...", file=sys.stderr)
 
-        try:
-            I2C.open(Host.I2C_SENSORS)
+        tz = tzlocal.get_localzone()
 
-            # resources...
+        # set...
+        with self.bus(Host.I2C_SENSORS):
             now = LocalizedDatetime.now()
 
             DS1338.init()
 
-            # test...
-            rtc_datetime = RTCDatetime.construct_from_localized_datetime(now)
-            DS1338.set_time(rtc_datetime)
+            set_datetime = RTCDatetime.construct_from_localized_datetime(now)
+            DS1338.set_time(set_datetime)
+
+            set_time = time.time()
+
+        deadline = set_time + self.__TICK + self.__TOLERANCE
+
+        # the bus is released while waiting, so that other tests may use it...
+        time.sleep(self.__FIRST_POLL)
+
+        # poll - the tick comes after the last quiet read, and by the read that sees it...
+        quiet_time = set_time
+
+        while True:
+            with self.bus(Host.I2C_SENSORS):
+                rtc_datetime = DS1338.get_time()
+                read_time = time.time()                                 # after any wait for the bus
 
-            time.sleep(2)
+            if rtc_datetime.second != set_datetime.second:
+                break
 
-            rtc_datetime = DS1338.get_time()
-            localized_datetime = rtc_datetime.as_localized_datetime(tzlocal.get_localzone())
+            if read_time > deadline:
+                if self.verbose:
+                    print("no tick in %0.3f seconds" % (read_time - set_time), file=sys.stderr)
 
-            self._datum = localized_datetime - now
+                return False
+
+            quiet_time = read_time
+            time.sleep(self.__POLL_INTERVAL)
+
+        # the nominal tick, if it is consistent with the reads...
+        tick_time = min(max(quiet_time, set_time + self.__TICK), read_time)
+        elapsed = tick_time - set_time
+
+        localized_datetime = rtc_datetime.as_localized_datetime(tz)
+
+        # the delta that would have been read at the end of the reference wait...
+        self._datum = localized_datetime - now + timedelta(seconds=self.__WAIT - elapsed)
+
+        if self.verbose:
+            print("tick in %0.3f seconds: %s" % (elapsed, self._datum), file=sys.stderr)
 
-            if self.verbose:
-                print(self._datum, file=sys.stderr)
+        # test criterion...
+        if read_time - set_time < self.__TICK - self.__TOLERANCE:
+            return False                                                # the clock is fast
 
-            # test criterion...
-            return 1 <= self._datum.seconds <= 2
+        if localized_datetime - set_datetime.as_localized_datetime(tz) != timedelta(seconds=1):
+            return False                                                # the clock did not count
 
-        finally:
-            I2C.close()
+        return 1 <= self._datum.seconds <= 2
@@ -4,7 +4,12 @@ Created on 18 May 2017
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 """
 
+import time
+
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
+from scs_mfr.bus.i2c_session import I2CSession
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -20,6 +25,12 @@ class Test(ABC):
         self.__interface = interface
         self.__verbose = verbose
 
+        self.__bus_lock = None
+        self.__board = None
+
+        self.__bus_wait_time = 0.0                                      # float seconds spent waiting for the bus
+        self.__bus_held_time = 0.0                                      # float seconds for which the bus was held
+
         self._datum = None
 
 
@@ -30,6 +41,46 @@ class Test(ABC):
         pass
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def bind(self, bus_lock, board=None):
+        self.__bus_lock = bus_lock                                      # set by TestScheduler
+        self.__board = board                                            # StationBoard, or None for the host's DFE
+
+
+    @contextmanager
+    def bus(self, bus):
+        # the I2C file descriptor is process-wide, so concurrent tests must take turns...
+        requested = time.time()
+
+        if self.__bus_lock is not None:
+            self.__bus_lock.acquire()
+
+        acquired = time.time()
+        self.__bus_wait_time += acquired - requested
+
+        try:
+            if self.__board is not None:
+                bus = self.__board.route(bus)
+
+            I2CSession.open(bus)
+
+            try:
+                if self.__board is not None:
+                    self.__board.select(bus)
+
+                yield
+
+            finally:
+                I2CSession.close()
+
+        finally:
+            self.__bus_held_time += time.time() - acquired
+
+            if self.__bus_lock is not None:
+                self.__bus_lock.release()
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -37,6 +88,16 @@ class Test(ABC):
         return self._datum
 
 
+    @property
+    def bus_wait_time(self):
+        return self.__bus_wait_time
+
+
+    @property
+    def bus_held_time(self):
+        return self.__bus_held_time
+
+
     @property
     def interface(self):
         return self.__interface
@@ -0,0 +1,192 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Runs a set of DFE tests concurrently. Tests share the process-wide I2C file descriptor, so each test takes the
+scheduler's bus lock whenever it opens the bus (see Test.bus()) - serial (GPS), SPI (OPC) and waiting (RTC) phases
+run alongside the I2C sensor reads. Results are reported in the order in which the tests were scheduled.
+
+Each task records the time taken to construct and to conduct its test - see DFETestTiming.
+"""
+
+import threading
+import time
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from scs_mfr.report.dfe_test_timing import TestTiming
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestScheduler(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, max_workers=None, bus_lock=None, board=None):
+        """
+        Constructor
+        """
+        self.__max_workers = max_workers                                # int or None for one worker per test
+
+        self.__bus_lock = threading.Lock() if bus_lock is None else bus_lock    # shared between station boards
+        self.__board = board                                            # StationBoard or None
+        self.__tasks = OrderedDict()                                    # dict of subject: TestTask (None if ignored)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def ignore(self, subject):
+        self.__tasks[subject] = None
+
+
+    def schedule(self, subject, construct):
+        # construct is a callable that returns a Test - construction errors are reported against the subject
+        self.__tasks[subject] = TestTask(subject, construct)
+
+
+    def run(self, reporter):
+        tasks = [task for task in self.__tasks.values() if task is not None]
+
+        if tasks:
+            max_workers = len(tasks) if self.__max_workers is None else self.__max_workers
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(task.run, self.__bus_lock, self.__board) for task in tasks]
+
+            # re-raise anything that is not a test failure (for example, exit() from within a test)...
+            for future in futures:
+                future.result()
+
+        # report in scheduled order...
+        for subject, task in self.__tasks.items():
+            if task is None:
+                reporter.report_ignore(subject)
+
+            elif task.exception is not None:
+                reporter.report_exception(subject, task.exception)
+
+            else:
+                reporter.report_test(subject, task.ok)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def datum(self, subject):
+        task = self.__tasks.get(subject)
+
+        return None if task is None or task.test is None else task.test.datum
+
+
+    def timings(self):
+        # dict of subject: TestTiming, for the subjects that were run...
+        return OrderedDict((subject, task.timing) for subject, task in self.__tasks.items()
+                           if task is not None and task.timing is not None)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def subjects(self):
+        return list(self.__tasks.keys())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TestScheduler:{max_workers:%s, board:%s, subjects:%s}" % \
+               (self.__max_workers, self.__board, self.subjects)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestTask(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, subject, construct):
+        """
+        Constructor
+        """
+        self.__subject = subject                                        # string
+        self.__construct = construct                                    # callable returning Test
+
+        self.__test = None                                              # Test
+        self.__ok = None                                                # bool
+        self.__exception = None                                         # Exception
+
+        self.__construct_time = None                                    # float seconds
+        self.__conduct_time = None                                      # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self, bus_lock, board):
+        started = time.time()
+        constructed = None
+
+        try:
+            self.__test = self.__construct()
+            self.__test.bind(bus_lock, board)
+
+            constructed = time.time()
+
+            self.__ok = self.__test.conduct()
+
+        except Exception as ex:
+            self.__exception = ex
+
+        finally:
+            finished = time.time()
+
+            self.__construct_time = (finished if constructed is None else constructed) - started
+            self.__conduct_time = 0.0 if constructed is None else finished - constructed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def subject(self):
+        return self.__subject
+
+
+    @property
+    def test(self):
+        return self.__test
+
+
+    @property
+    def ok(self):
+        return self.__ok
+
+
+    @property
+    def exception(self):
+        return self.__exception
+
+
+    @property
+    def timing(self):
+        if self.__construct_time is None:
+            return None
+
+        if self.__test is None:
+            return TestTiming(self.__construct_time, self.__conduct_time, 0.0, 0.0)
+
+        return TestTiming(self.__construct_time, self.__conduct_time, self.__test.bus_wait_time,
+                          self.__test.bus_held_time)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TestTask:{subject:%s, test:%s, ok:%s, exception:%s}" % \
+               (self.subject, self.test, self.ok, self.exception)
@@ -47,6 +47,8 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_timezone import CmdTimezone
 
+from scs_mfr.sys.conf_cache import ConfCache
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -69,7 +71,7 @@ if __name__ == '__main__':
     # ----------------------------------------------------------------------------------------------------------------
     # resources...
 
-    conf = TimezoneConf.load(Host)
+    conf = ConfCache.load(TimezoneConf, Host)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,60 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import json
+
+from collections import OrderedDict
+
+from scs_mfr.station.station_manifest import StationManifest
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+EXAMPLE = '[{"dfe-sn": "123", "bus": 1, "mux": {"addr": "0x70", "channel": 0}}, ' \
+          '{"dfe-sn": "124", "bus": 1, "mux": {"addr": "0x70", "channel": 1}}, ' \
+          '{"dfe-sn": "125", "bus": 3, "eeprom-bus": 4}]'
+
+
+def manifest(jstr):
+    return StationManifest.construct_from_jdict(json.loads(jstr, object_hook=OrderedDict))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def test_example():
+    example = manifest(EXAMPLE)
+
+    assert example.is_valid()
+
+    # the EEPROM of each muxed board is behind its own channel...
+    assert [board.addresses() for board in example.boards] == [{(1, 0)}, {(1, 1)}, {(3, None), (4, None)}]
+
+
+def test_shared_eeprom_bus():
+    shared = manifest('[{"dfe-sn": "123", "bus": 1, "eeprom-bus": 2, "mux": {"addr": "0x70", "channel": 0}}, '
+                      '{"dfe-sn": "124", "bus": 1, "eeprom-bus": 2, "mux": {"addr": "0x70", "channel": 1}}]')
+
+    assert not shared.is_valid()
+
+    assert not manifest('[{"dfe-sn": "125", "bus": 3}, {"dfe-sn": "126", "bus": 5}]').is_valid()
+
+
+def test_shared_channel():
+    assert not manifest('[{"dfe-sn": "123", "bus": 1, "mux": {"addr": "0x70", "channel": 0}}, '
+                        '{"dfe-sn": "124", "bus": 1, "mux": {"addr": "0x70", "channel": 0}}]').is_valid()
+
+    assert not manifest('[{"dfe-sn": "123", "bus": 1, "mux": {"addr": "0x70", "channel": 0}}, '
+                        '{"dfe-sn": "124", "bus": 1, "eeprom-bus": 4}]').is_valid()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    test_example()
+    test_shared_eeprom_bus()
+    test_shared_channel()
+
+    print("station_manifest_test: OK")